@@ -0,0 +1,24 @@
+# adapters.py
+"""Conversions between the Blender-free codec value types and mathutils."""
+from typing import Sequence, Union
+
+from mathutils import Matrix, Vector
+
+from sr_impex.definitions.base_types import Matrix3x3, Vector3, Vector4
+
+
+def to_vector(value: Union[Vector3, Vector4]) -> Vector:
+    """Return the x/y/z part of a Vector3 or Vector4 as a mathutils.Vector."""
+    return Vector(value.xyz)
+
+
+def to_matrix(value: Matrix3x3) -> Matrix:
+    """Return a row-major Matrix3x3 as a 3x3 mathutils.Matrix."""
+    return Matrix(value.rows)
+
+
+def matrix3x3_from(value: Union[Matrix, Sequence[Sequence[float]]]) -> Matrix3x3:
+    """Build a Matrix3x3 from a 3x3 mathutils.Matrix or nested rows."""
+    matrix = Matrix3x3()
+    matrix.rows = value
+    return matrix
@@ -2,14 +2,18 @@
 from typing import List, Dict, Tuple
 import os
 import json
-from mathutils import Quaternion, Vector
 import bpy
+import numpy as np
 
-from sr_impex.definitions.ska_definitions import SKA, SKAKeyframe
+from sr_impex.core.quaternion_math import quaternion_conjugate, quaternion_multiply, rotate_vectors
+from sr_impex.definitions.ska_definitions import SKA
 from sr_impex.definitions.skeleton_definitions import DRSBone
 
 IS_44_PLUS = bpy.app.version >= (4, 4, 0)
 
+# Set on Actions whose curves have not been built yet (deferred SKA import)
+DEFERRED_ACTION_PROP = "deferred_ska"
+
 
 def assign_action_compat(arm_obj: bpy.types.Object, action: bpy.types.Action) -> None:
     """
@@ -121,6 +125,76 @@ def insert_or_replace_key(
     return k
 
 
+# Enum values of Keyframe.interpolation and Keyframe.handle_*_type (BEZT_IPO_*, HD_*)
+_INTERPOLATION_VALUES = {"CONSTANT": 0, "LINEAR": 1, "BEZIER": 2}
+_HANDLE_TYPE_VALUES = {"FREE": 0, "AUTO": 1, "VECTOR": 2, "ALIGNED": 3, "AUTO_CLAMPED": 4}
+
+
+def _set_keyframe_enum(keyframe_points, attribute: str, identifier: str, values: Dict[str, int]) -> None:
+    try:
+        keyframe_points.foreach_set(attribute, np.full(len(keyframe_points), values[identifier], dtype=np.int32))
+    except (TypeError, RuntimeError):
+        # Builds that do not expose enum properties to foreach_set
+        for keyframe in keyframe_points:
+            setattr(keyframe, attribute, identifier)
+
+
+def write_keyframes(
+    fcurve: bpy.types.FCurve,
+    frames: np.ndarray,
+    values: np.ndarray,
+    handles_left: np.ndarray,
+    handles_right: np.ndarray,
+    interpolation: str = "BEZIER",
+    handle_type: str = "FREE",
+) -> None:
+    """
+    Write all keys of an empty F-curve at once: one keyframe_points.add(), foreach_set for
+    co and handles ((N, 2) arrays of frame, value), and a single fcurve.update().
+    """
+    n = len(frames)
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.add(n)
+    keyframe_points.foreach_set("co", np.column_stack((frames, values)).astype(np.float32).reshape(-1))
+    keyframe_points.foreach_set("handle_left", np.asarray(handles_left, dtype=np.float32).reshape(-1))
+    keyframe_points.foreach_set("handle_right", np.asarray(handles_right, dtype=np.float32).reshape(-1))
+    _set_keyframe_enum(keyframe_points, "interpolation", interpolation, _INTERPOLATION_VALUES)
+    _set_keyframe_enum(keyframe_points, "handle_left_type", handle_type, _HANDLE_TYPE_VALUES)
+    _set_keyframe_enum(keyframe_points, "handle_right_type", handle_type, _HANDLE_TYPE_VALUES)
+    fcurve.update()
+
+
+def _unique_frames(frames, *columns) -> Tuple[np.ndarray, ...]:
+    """Drop keys that round to the same frame as their successor; the last one wins, as with insert_or_replace_key."""
+    frames = np.asarray(frames, dtype=np.float64)
+    keep = np.ones(len(frames), dtype=bool)
+    keep[:-1] = frames[1:] != frames[:-1]
+    return (frames[keep],) + tuple(np.asarray(column, dtype=np.float64)[keep] for column in columns)
+
+
+def hermite_bezier_handles(
+    frames: np.ndarray, values: np.ndarray, tangents: np.ndarray, duration: float, fps: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (N, 2) left and right Bézier handles that reproduce the Hermite spline through the keys.
+
+    Inner handles sit a third of the neighbouring segment away; the endpoint handles use the first
+    and last segment so the endpoint tangents survive round-trips (SKA stores one per key).
+    """
+    if len(frames) < 2:
+        # A single key has no segment, keep its handles one frame away
+        left_segments = right_segments = np.full(len(frames), 3.0)
+    else:
+        segments = np.diff(frames)
+        left_segments = np.concatenate((segments[:1], segments))
+        right_segments = np.concatenate((segments, segments[-1:]))
+    # Per segment: handle frame offset (f1 - f0) / 3, value offset m * (f1 - f0) / (duration * fps) / 3
+    slopes = tangents / (duration * fps)
+    handles_left = np.column_stack((frames - left_segments / 3.0, values - slopes * left_segments / 3.0))
+    handles_right = np.column_stack((frames + right_segments / 3.0, values + slopes * right_segments / 3.0))
+    return handles_left, handles_right
+
+
 def insert_hermite_bezier_curve(
     fcurve: bpy.types.FCurve,
     frames: List[float],
@@ -132,53 +206,48 @@ def insert_hermite_bezier_curve(
     """
     Insert a single-component curve as Bézier whose handles reproduce the exact Hermite spline.
     """
-    n = len(frames)
-    if n == 0:
+    if len(frames) == 0:
+        return
+    if len(fcurve.keyframe_points):
+        # Merging into existing keys goes key by key
+        for f, v in zip(frames, values):
+            insert_or_replace_key(fcurve, f, v, interpolation="BEZIER", handle_type="FREE")
+        return
+    frames, values, tangents = _unique_frames(frames, values, tangents)
+    handles_left, handles_right = hermite_bezier_handles(frames, values, tangents, duration, fps)
+    write_keyframes(fcurve, frames, values, handles_left, handles_right, "BEZIER", "FREE")
+
+
+def insert_linear_curve(fcurve: bpy.types.FCurve, frames: List[float], values: List[float]) -> None:
+    """Insert a single-component curve with linear interpolation between the keys."""
+    if len(frames) == 0:
         return
-    # Insert keyframes
-    for f, v in zip(frames, values):
-        insert_or_replace_key(fcurve, f, v, interpolation="BEZIER", handle_type="FREE")
-    # Compute and set handles
-    for i in range(n - 1):
-        f0, f1 = frames[i], frames[i + 1]
-        p0, p1 = values[i], values[i + 1]
-        m0, m1 = tangents[i], tangents[i + 1]
-        dt_n = (f1 - f0) / (duration * fps)
-        off_f = (f1 - f0) / 3.0
-        off_v0 = (m0 * dt_n) / 3.0
-        off_v1 = (m1 * dt_n) / 3.0
-        kp0 = fcurve.keyframe_points[i]
-        kp1 = fcurve.keyframe_points[i + 1]
-        kp0.handle_right.x = f0 + off_f
-        kp0.handle_right.y = p0 + off_v0
-        kp1.handle_left.x = f1 - off_f
-        kp1.handle_left.y = p1 - off_v1
-
-    # Also set endpoint handles so endpoint tangents survive round-trips.
-    # Blender doesn't need them for evaluation outside the curve range,
-    # but SKA stores tangents for *every* keyframe, including endpoints.
-    if n >= 2:
-        # First key: set LEFT handle from tangent[0] using first segment length
-        f0, f1 = frames[0], frames[1]
-        p0 = values[0]
-        m0 = tangents[0]
-        dt_n = (f1 - f0) / (duration * fps)
-        off_f = (f1 - f0) / 3.0
-        off_v0 = (m0 * dt_n) / 3.0
-        kp0 = fcurve.keyframe_points[0]
-        kp0.handle_left.x = f0 - off_f
-        kp0.handle_left.y = p0 - off_v0
-
-        # Last key: set RIGHT handle from tangent[-1] using last segment length
-        f0, f1 = frames[-2], frames[-1]
-        p1 = values[-1]
-        m1 = tangents[-1]
-        dt_n = (f1 - f0) / (duration * fps)
-        off_f = (f1 - f0) / 3.0
-        off_v1 = (m1 * dt_n) / 3.0
-        kp1 = fcurve.keyframe_points[-1]
-        kp1.handle_right.x = f1 + off_f
-        kp1.handle_right.y = p1 + off_v1
+    if len(fcurve.keyframe_points):
+        for f, v in zip(frames, values):
+            insert_or_replace_key(fcurve, f, v, interpolation="LINEAR")
+        return
+    frames, values = _unique_frames(frames, values)
+    handles_left, handles_right = hermite_bezier_handles(frames, values, np.zeros_like(values), 1.0, 1.0)
+    write_keyframes(fcurve, frames, values, handles_left, handles_right, "LINEAR", "FREE")
+
+
+def ska_keys_to_bone_space(keyframes: np.ndarray, header_type: int, bone: DRSBone) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert the (N, 8) keyframe rows of one SKA channel (x, y, z, w, tan_x, tan_y, tan_z, tan_w)
+    into bone-local values and tangents relative to the bind pose.
+
+    Location channels give (N, 3) arrays, rotation channels (N, 4) quaternions in (w, x, y, z).
+    """
+    keyframes = np.asarray(keyframes, dtype=np.float64)
+    bind_inverse = quaternion_conjugate(tuple(bone.bind_rot))
+    if header_type == 0:
+        values = rotate_vectors(bind_inverse, keyframes[:, 0:3] - np.asarray(tuple(bone.bind_loc)))
+        tangents = rotate_vectors(bind_inverse, keyframes[:, 4:7])
+        return values, tangents
+    # SKA stores (x, y, z, -w)
+    values = quaternion_multiply(bind_inverse, keyframes[:, [3, 0, 1, 2]] * (-1.0, 1.0, 1.0, 1.0))
+    tangents = quaternion_multiply(bind_inverse, keyframes[:, [7, 4, 5, 6]] * (-1.0, 1.0, 1.0, 1.0))
+    return values, tangents
 
 
 def import_ska_animation(
@@ -189,9 +258,13 @@ def import_ska_animation(
     use_bezier: bool = True,
     unit_name: str = "Name",
     map_collection: bpy.types.Collection | None = None,
-) -> None:
+    build_curves: bool = True,
+) -> bpy.types.Action | None:
     """
     Import SKA into Blender by inserting Hermite-interpolated Bézier keyframes.
+
+    With build_curves=False only the named Action with its SKA properties is created and
+    flagged with DEFERRED_ACTION_PROP; fill_ska_action() adds the curves later.
     """
     blob_key_original = (name or "").strip()
     # 1. Remove .ska extension if present
@@ -212,12 +285,9 @@ def import_ska_animation(
         # Just assign it and return
         assign_action_compat(arm_obj, existing_action)
         print(f"Info: Action '{name}' already exists, assigned existing action.")
-        return
+        return existing_action
 
     action = create_action(arm_obj, name=name, cyclic=ska_file.repeat > 1)
-    duration = ska_file.duration
-    frame_length = ska_file.frame_length
-    original_fps = frame_length / duration
 
     # ---- Mapping: blob filename -> actual Action name ----
     # Store on the model collection as JSON (ID props are fine, but JSON keeps it simple)
@@ -243,6 +313,35 @@ def import_ska_animation(
             mapping, separators=(",", ":"), ensure_ascii=False
         )
 
+    # Save Original Duration in the Action
+    action["original_duration"] = ska_file.duration
+    action["original_fps"] = ska_file.frame_length / ska_file.duration
+    action["frame_length"] = ska_file.frame_length
+    action["repeat"] = ska_file.repeat
+    action["stutter_mode"] = ska_file.stutter_mode
+    if ska_file.type == 7:
+        action["unused1"] = ska_file.unused1
+    action["prefix"] = parent_folder
+
+    if build_curves:
+        fill_ska_action(action, ska_file, arm_obj, bone_list, use_bezier)
+    else:
+        action[DEFERRED_ACTION_PROP] = True
+    return action
+
+
+def fill_ska_action(
+    action: bpy.types.Action,
+    ska_file: SKA,
+    arm_obj: bpy.types.Object,
+    bone_list: List[DRSBone],
+    use_bezier: bool = True,
+) -> None:
+    """Build the F-curves of an SKA Action and add its NLA track."""
+    duration = ska_file.duration
+    frame_length = ska_file.frame_length
+    original_fps = frame_length / duration
+
     # Prepare bones and curves
     bone_map = {b.ska_identifier: b for b in bone_list}
     curves_map: Dict[int, Dict[str, bpy.types.FCurve]] = {}
@@ -250,74 +349,47 @@ def import_ska_animation(
         curves_map[b.ska_identifier] = get_bone_fcurves(action, arm_obj, b.name)
         arm_obj.pose.bones[b.name].rotation_mode = "QUATERNION"
 
-    # Helper functions for extraction and tangents
-    def extract_loc(b: DRSBone, kf: SKAKeyframe) -> Vector:
-        return b.bind_rot.conjugated() @ (Vector((kf.x, kf.y, kf.z)) - b.bind_loc)
-
-    def tangent_loc(b: DRSBone, kf: SKAKeyframe) -> Vector:
-        return b.bind_rot.conjugated() @ (Vector((kf.tan_x, kf.tan_y, kf.tan_z)))
-
-    def extract_rot(b: DRSBone, kf: SKAKeyframe) -> Tuple[float, float, float, float]:
-        q = Quaternion((-kf.w, kf.x, kf.y, kf.z))
-        r = b.bind_rot.conjugated() @ q
-        return (r.w, r.x, r.y, r.z)
-
-    def tangent_rot(b: DRSBone, kf: SKAKeyframe) -> Tuple[float, float, float, float]:
-        tq = Quaternion((-kf.tan_w, kf.tan_x, kf.tan_y, kf.tan_z))
-        tr = b.bind_rot.conjugated() @ tq
-        return (tr.w, tr.x, tr.y, tr.z)
+    times_all = SKA.times.array(ska_file)
+    keyframes_all = SKA.keyframes.array(ska_file)
+    header_array = SKA.headers.array(ska_file)
+    header_columns = zip(*(header_array[name].tolist() for name in ("tick", "interval", "type", "bone_id")))
 
     # Process each channel header
-    for hdr in ska_file.headers:
-        bone = bone_map.get(hdr.bone_id)
-        fcs = curves_map.get(hdr.bone_id)
+    for tick, interval, header_type, bone_id in header_columns:
+        bone = bone_map.get(bone_id)
+        fcs = curves_map.get(bone_id)
         if bone is None or fcs is None:
             continue
-        # Choose extraction
-        if hdr.type == 0:
-            extract_fn = extract_loc
-            tangent_fn = tangent_loc
+        if header_type == 0:
             axes = ("x", "y", "z")
             prefix = "location"
         else:
-            extract_fn = extract_rot
-            tangent_fn = tangent_rot
             axes = ("w", "x", "y", "z")
             prefix = "rotation"
 
-        # Collect samples
-        seq = [
-            (ska_file.times[i], ska_file.keyframes[i])
-            for i in range(hdr.tick, hdr.tick + hdr.interval)
-        ]
-        seq.sort(key=lambda tk: tk[0])
-        times_norm = [t for t, _ in seq]
-        frames = [round(t * frame_length) for t in times_norm]
+        # Collect samples of this channel in time order
+        channel_times = times_all[tick:tick + interval]
+        if len(channel_times) == 0:
+            continue
+        order = np.argsort(channel_times, kind="stable")
+        frames = np.round(channel_times[order].astype(np.float64) * frame_length)
+        values, tangents = ska_keys_to_bone_space(
+            keyframes_all[tick:tick + interval][order], header_type, bone
+        )
         # For each component axis
         for idx, ax in enumerate(axes):
-            # Values and tangents
-            vals = [extract_fn(bone, kf)[idx] for _, kf in seq]
-            tans = [tangent_fn(bone, kf)[idx] for _, kf in seq]
+            vals = values[:, idx]
+            tans = tangents[:, idx]
             fcurve = fcs[f"{prefix}_{ax}"]
-            if not vals:
-                continue
             if use_bezier:
                 insert_hermite_bezier_curve(
                     fcurve, frames, vals, tans, duration, original_fps
                 )
             else:
-                for fr, v in zip(frames, vals):
-                    insert_or_replace_key(fcurve, fr, v, interpolation="LINEAR")
+                insert_linear_curve(fcurve, frames, vals)
     # Add NLA track strip
     track = arm_obj.animation_data.nla_tracks.new()
     track.strips.new(action.name, 0, action)
     track.name = action.name
-    # Save Original Duration in the Action
-    action["original_duration"] = duration
-    action["original_fps"] = original_fps
-    action["frame_length"] = ska_file.frame_length
-    action["repeat"] = ska_file.repeat
-    action["stutter_mode"] = ska_file.stutter_mode
-    if ska_file.type == 7:
-        action["unused1"] = ska_file.unused1
-    action["prefix"] = parent_folder
+    if DEFERRED_ACTION_PROP in action:
+        del action[DEFERRED_ACTION_PROP]
@@ -671,7 +671,8 @@ class DRSMaterial:
             self.flu_tex_node_layer_1.image = img
             self.flu_tex_node_layer_2.image = img
 
-    def create_wind_nodes(self, mesh_object: bpy.types.Object) -> None:
+    @staticmethod
+    def create_wind_nodes(mesh_object: bpy.types.Object) -> None:
         """
         Creates the Geometry Nodes modifier for the wind effect.
         """
@@ -29,6 +29,7 @@ from bpy.props import (
 # Abilities / actions
 # ---------------------------------------------------------------------------
 
+from sr_impex.blender.animation_utils import DEFERRED_ACTION_PROP
 from sr_impex.definitions.abilities import (
     must_have_abilities,
     situational_abilities,
@@ -815,6 +816,8 @@ def _new_uint10() -> int:
 # ---------------------------------------------------------------------------
 
 ANIM_BLOB_KEY = "AnimationSetJSON"
+# Blob entry of SKAs imported without curves: {action name: {"ska": path, "drs": path, "smooth": bool}}
+DEFERRED_ANIMATIONS_KEY = "deferred_animations"
 
 
 def _empty_blob() -> Dict:
@@ -851,6 +854,17 @@ def _write_blob(col: bpy.types.Collection, blob: Dict) -> None:
     col[ANIM_BLOB_KEY] = json.dumps(blob, separators=(",", ":"), ensure_ascii=False)
 
 
+def _materialize_action(act_name: str) -> None:
+    """Build the curves of an Action whose SKA import was deferred, if they are still missing."""
+    act = bpy.data.actions.get(act_name) if act_name and act_name != "NONE" else None
+    if act is None or not act.get(DEFERRED_ACTION_PROP):
+        return
+    # pylint: disable=import-outside-toplevel
+    from sr_impex.utilities.drs_utility import materialize_deferred_action
+
+    materialize_deferred_action(act_name, _active_model())
+
+
 # ---------------------------------------------------------------------------
 # State
 # ---------------------------------------------------------------------------
@@ -1098,6 +1112,7 @@ def _on_variant_file_changed(self, _context):
             if owner is None:
                 return None
             mk_i, v_i = owner
+            _materialize_action(new_file)
             _propagate_sle_variant_file(st, mk_i, v_i, new_file)
             _propagate_cast_resolve_variant_file(st, mk_i, v_i, new_file)
             _recompute_all_timing_values(st)
@@ -1665,6 +1680,10 @@ def _write_state_to_blob(col: bpy.types.Collection):
         "marker_sets": [],
         "timings": [],
     }
+    # Deferred SKA references are owned by the importer, keep them
+    deferred = _read_blob(col).get(DEFERRED_ANIMATIONS_KEY)
+    if deferred:
+        b[DEFERRED_ANIMATIONS_KEY] = deferred
     # collect for marker_sets while writing mode_keys
     emitted_ms = set()  # guard against duplicates
     # --- Build timings groups in-memory first ---
@@ -2014,6 +2033,7 @@ class DRS_OT_PlayRange(bpy.types.Operator):
         if act_name == "" or act_name == "NONE":
             # try to get the first valid variant instead
             pass
+        _materialize_action(act_name)
         act = (
             bpy.data.actions.get(act_name) if act_name and act_name != "NONE" else None
         )
@@ -2121,6 +2141,7 @@ class DRS_OT_ShowMarker(bpy.types.Operator):
             return {"CANCELLED"}
 
         act_name = (v.file or "").strip()
+        _materialize_action(act_name)
         act = (
             bpy.data.actions.get(act_name) if act_name and act_name != "NONE" else None
         )
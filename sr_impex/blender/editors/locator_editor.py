@@ -30,7 +30,8 @@ from sr_impex.definitions.locator_definitions import (
     CMatCoordinateSystem,
 )
 from sr_impex.definitions.enums import LocatorClass
-from sr_impex.definitions.base_types import Matrix3x3, Vector3
+from sr_impex.definitions.base_types import Vector3
+from sr_impex.blender.adapters import matrix3x3_from
 
 # ---- Constants ---------------------------------------------------------------
 
@@ -402,10 +403,7 @@ def blob_to_cdrw(blob: Dict) -> CDrwLocatorList:
     for e in blob.get("locators", []):
         r = e.get("rot3x3", [1, 0, 0, 0, 1, 0, 0, 0, 1])
         p = e.get("pos", [0, 0, 0])
-        m33 = Matrix3x3(
-            matrix=tuple(r),
-            math_matrix=_m3_from_list(r),
-        )
+        m33 = matrix3x3_from(_m3_from_list(r))
         v3 = Vector3(x=float(p[0]), y=float(p[1]), z=float(p[2]))
         cmat = CMatCoordinateSystem(matrix=m33, position=v3)
         class_id = int(e.get("class_id", 0))
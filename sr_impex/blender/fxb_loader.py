@@ -28,6 +28,7 @@ from bpy_extras.image_utils import load_image
 from sr_impex.definitions.drs_definitions import DRS
 from sr_impex.definitions.fxb_definitions import FxMaster, Element, Emitter, Track, FloatKeyframe, Vector3Keyframe
 from sr_impex.definitions.enums import TrackType
+from sr_impex.core.decode_scheduler import read_file
 from sr_impex.core.message_logger import MessageLogger
 
 logger = MessageLogger()
@@ -573,8 +574,8 @@ def load_fxb_effect(
         effect_name = os.path.splitext(os.path.basename(fxb_file_path))[0]
 
     try:
-        # Load the DRS file (FXB files are DRS format)
-        fxb_drs: DRS = DRS().read(fxb_file_path)
+        # Load the DRS file (FXB files are DRS format), shared through the asset cache
+        fxb_drs: DRS = read_file(fxb_file_path)
 
         # FXB files have FxMaster structure
         if not hasattr(fxb_drs, 'fx_master') or not fxb_drs.fx_master:
@@ -586,6 +587,7 @@ def load_fxb_effect(
             return None
 
         fx_master: FxMaster = fxb_drs.fx_master
+        fxb_drs.close()
 
         # Create root effect empty
         effect_root = bpy.data.objects.new(f"Effect_{effect_name}", None)
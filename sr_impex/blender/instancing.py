@@ -0,0 +1,66 @@
+# instancing.py
+"""
+Mesh datablock sharing for imports.
+
+Within one import every unique DRS mesh is built once; further uses of the same mesh
+become linked duplicates, i.e. new objects that share the mesh and its materials.
+Locator markers all share one small sphere mesh.
+"""
+import functools
+from typing import Callable, Dict, Optional, Tuple
+
+import bmesh
+import bpy
+
+LOCATOR_MARKER_MESH_NAME = "Locator_Marker"
+
+_shared_meshes: Optional[Dict[tuple, Tuple[object, bpy.types.Mesh]]] = None
+
+
+def with_mesh_instancing(func: Callable) -> Callable:
+    """Decorator that shares mesh datablocks between the objects created by one import function."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _shared_meshes  # pylint: disable=global-statement
+        previous, _shared_meshes = _shared_meshes, {}
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _shared_meshes = previous
+
+    return wrapper
+
+
+def shared_mesh(source: object, mesh_index: int, dir_name: str, build: Callable[[], bpy.types.Mesh]) -> bpy.types.Mesh:
+    """Return the mesh built earlier in this import for (source, mesh_index, dir_name), or build it now.
+
+    `source` is the decoded mesh file the mesh comes from; it is kept alive with the entry
+    so its id() cannot be reused while the import runs.
+    """
+    if _shared_meshes is None:
+        return build()
+    key = (id(source), mesh_index, dir_name)
+    entry = _shared_meshes.get(key)
+    if entry is not None:
+        try:
+            _ = entry[1].name
+            return entry[1]
+        except ReferenceError:
+            # The datablock was removed in the meantime, build it again
+            pass
+    mesh = build()
+    _shared_meshes[key] = (source, mesh)
+    return mesh
+
+
+def locator_marker_mesh() -> bpy.types.Mesh:
+    """Return the sphere mesh shared by all locator marker objects, creating it on first use."""
+    mesh = bpy.data.meshes.get(LOCATOR_MARKER_MESH_NAME)
+    if mesh is None:
+        mesh = bpy.data.meshes.new(LOCATOR_MARKER_MESH_NAME)
+        bm = bmesh.new()
+        bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=0.1)
+        bm.to_mesh(mesh)
+        bm.free()
+    return mesh
@@ -0,0 +1,77 @@
+"""
+Session-wide cache of decoded DRS/BMS/BMG/SKA/FXB files.
+
+Entries are keyed by absolute path, file size and modification time, so a file that
+changes on disk is decoded again. The cache is a byte-bounded LRU; the decoded size
+of a file is estimated from its size on disk. Cached objects are shared between
+imports and must be treated as read-only.
+"""
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+AssetKey = Tuple[str, int, int]
+
+# Decoded object graphs are several times larger than the files they come from
+DECODED_SIZE_FACTOR = 4
+DEFAULT_BUDGET = 512 * 1024 * 1024
+
+
+def asset_key(file_name: str) -> Optional[AssetKey]:
+    """Return (absolute path, size, mtime) of a file, or None if it cannot be stat'ed."""
+    path = os.path.normcase(os.path.abspath(file_name))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+class AssetCache:
+    """Byte-bounded LRU of decoded files."""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[AssetKey, object, int]]" = OrderedDict()
+
+    def get(self, file_name: str):
+        """Return the cached object for the file as it is on disk now, or None."""
+        key = asset_key(file_name)
+        entry = self._entries.get(key[0]) if key is not None else None
+        if entry is None or entry[0] != key:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key[0])
+        self.hits += 1
+        return entry[1]
+
+    def put(self, file_name: str, asset: object) -> None:
+        key = asset_key(file_name)
+        if key is None:
+            return
+        self._discard(key[0])
+        cost = key[1] * DECODED_SIZE_FACTOR
+        if cost > self.budget:
+            return
+        self._entries[key[0]] = (key, asset, cost)
+        self.used += cost
+        while self.used > self.budget:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.used -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.used = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+asset_cache = AssetCache()
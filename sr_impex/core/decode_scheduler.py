@@ -0,0 +1,164 @@
+"""
+Parallel decoding of the files referenced by one import.
+
+An import registers every DRS/BMS/BMG/SKA/FXB path it is going to need up front, the
+files are decoded in a pool of worker processes, and read_file() hands the decoded
+object graph back to the main thread, which only creates the bpy datablocks. Files
+that were not scheduled, or a pool that cannot be started (or dies), fall back to
+decoding on the calling thread, so results never depend on the pool. Every decoded
+file goes through the session-wide asset_cache, so it is parsed once per session.
+"""
+import functools
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, Optional
+
+from sr_impex.core.asset_cache import asset_cache
+from sr_impex.definitions.bmg_definitions import BMG, BMS
+from sr_impex.definitions.drs_definitions import DRS
+from sr_impex.definitions.ska_definitions import SKA
+
+# Decoders by file extension; FXB files are DRS containers holding an FxMaster
+_DECODERS = {".drs": DRS, ".fxb": DRS, ".bms": BMS, ".bmg": BMG, ".ska": SKA}
+# Below this many files the pool start-up costs more than it saves
+MIN_POOL_JOBS = 4
+
+_active: Optional["DecodeScheduler"] = None
+
+
+def file_key(file_name: str) -> str:
+    return os.path.normcase(os.path.abspath(file_name))
+
+
+def decode_file(file_name: str, lazy: bool = False):
+    """Decode a file with the definition class matching its extension."""
+    decoder = _DECODERS.get(os.path.splitext(file_name)[1].lower())
+    if decoder is None:
+        raise TypeError(f"No decoder for {file_name}")
+    if lazy and decoder is DRS:
+        return DRS().read(file_name, lazy=True)
+    return decoder().read(file_name)
+
+
+def _decode_cached(file_name: str, lazy: bool = False):
+    asset = asset_cache.get(file_name)
+    if asset is None:
+        asset = decode_file(file_name, lazy)
+        # A lazy DRS is closed by its user with the untouched sections left empty
+        if not (lazy and isinstance(asset, DRS)):
+            asset_cache.put(file_name, asset)
+    return asset
+
+
+class DecodeScheduler:
+    """Decode scheduled files in worker processes; use as a context manager around an import.
+
+    While the scheduler is active, schedule_files() feeds it and read_file() serves the files
+    it was given.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 1) - 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._results: Dict[str, object] = {}
+        self._previous: Optional["DecodeScheduler"] = None
+        self._inline = False
+
+    def submit(self, file_names: Iterable[str]) -> None:
+        """Schedule files for decoding; unknown extensions, missing files and duplicates are skipped."""
+        jobs = {}
+        for file_name in file_names:
+            key = file_key(file_name)
+            if key in self._futures or key in self._results or key in jobs:
+                continue
+            if os.path.splitext(key)[1].lower() not in _DECODERS or not os.path.isfile(key):
+                continue
+            cached = asset_cache.get(key)
+            if cached is not None:
+                self._results[key] = cached
+            else:
+                jobs[key] = file_name
+        if not jobs or self._inline:
+            return
+        if self._pool is None and len(jobs) >= MIN_POOL_JOBS and self.max_workers > 1:
+            try:
+                # spawn: forking Blender is not safe, and workers only need the codecs
+                self._pool = ProcessPoolExecutor(
+                    min(self.max_workers, len(jobs)), mp_context=multiprocessing.get_context("spawn")
+                )
+            except (OSError, RuntimeError, NotImplementedError) as exc:
+                print(f"[DecodeScheduler] No worker pool, decoding inline: {exc}")
+                self._inline = True
+                return
+        if self._pool is None:
+            return
+        try:
+            for key, file_name in jobs.items():
+                self._futures[key] = self._pool.submit(decode_file, file_name)
+        except (BrokenProcessPool, RuntimeError) as exc:
+            print(f"[DecodeScheduler] Worker pool failed, decoding inline: {exc}")
+            self._inline = True
+
+    def get(self, file_name: str, lazy: bool = False):
+        """Return the decoded file, waiting for its worker or decoding it here if it was not scheduled."""
+        key = file_key(file_name)
+        if key in self._results:
+            return self._results[key]
+        future = self._futures.pop(key, None)
+        if future is None:
+            return _decode_cached(file_name, lazy)
+        try:
+            result = future.result()
+        except BrokenProcessPool as exc:
+            print(f"[DecodeScheduler] Worker pool failed, decoding inline: {exc}")
+            result = decode_file(file_name)
+        asset_cache.put(file_name, result)
+        self._results[key] = result
+        return result
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._futures.clear()
+        self._results.clear()
+
+    def __enter__(self) -> "DecodeScheduler":
+        global _active  # pylint: disable=global-statement
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        global _active  # pylint: disable=global-statement
+        _active = self._previous
+        self.close()
+
+
+def with_decode_scheduler(func: Callable) -> Callable:
+    """Decorator that keeps a DecodeScheduler active for the duration of an import function."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with DecodeScheduler():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def schedule_files(file_names: Iterable[str]) -> None:
+    """Schedule files on the active DecodeScheduler; without one this does nothing."""
+    if _active is not None:
+        _active.submit(file_names)
+
+
+def read_file(file_name: str, lazy: bool = False):
+    """Decode a file through the active DecodeScheduler, or directly when none is active.
+
+    Scheduled and cached files always come back fully decoded, even if `lazy` is requested.
+    """
+    if _active is not None:
+        return _active.get(file_name, lazy)
+    return _decode_cached(file_name, lazy)
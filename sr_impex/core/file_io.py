@@ -1,3 +1,9 @@
+import mmap
+import os
+import stat
+import tempfile
+
+
 class FileReader:
     def __init__(self, file_name: str):
         self.file = open(file_name, 'rb')
@@ -21,6 +27,72 @@ class FileReader:
         return data
 
 
+class MappedFileReader:
+    """Reader that maps the whole file once and serves every request from memory.
+
+    It is a drop-in replacement for FileReader: read/seek/tell/peek never issue an
+    OS call after construction. read() still returns bytes so existing decode() and
+    unpack() calls keep working, while read_view() hands out zero-copy memoryview
+    slices for bulk array decoding.
+    """
+
+    def __init__(self, file_name: str):
+        with open(file_name, 'rb') as file:
+            self._size = os.fstat(file.fileno()).st_size
+            # mmap refuses empty files, fall back to an empty buffer
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+        self._data = self._map if self._map is not None else b""
+        self._view = memoryview(self._data)
+        self._pos = 0
+
+    def _advance(self, size: int) -> tuple[int, int]:
+        start = self._pos
+        end = self._size if size is None or size < 0 else min(start + size, self._size)
+        self._pos = end
+        return start, end
+
+    def read(self, size: int = -1) -> bytes:
+        start, end = self._advance(size)
+        return self._data[start:end]
+
+    def read_view(self, size: int) -> memoryview:
+        """Return the next `size` bytes as a memoryview without copying."""
+        start, end = self._advance(size)
+        return self._view[start:end]
+
+    def peek(self, size: int) -> bytes:
+        return self._data[self._pos:min(self._pos + size, self._size)]
+
+    def seek(self, offset: int):
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+
+    def tell(self) -> int:
+        return self._pos
+
+    def size(self) -> int:
+        return self._size
+
+    def close(self):
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Slices handed out by read_view() are still alive; the mapping
+                # is released together with the last of them.
+                pass
+            self._map = None
+        self._data = b""
+
+    def __enter__(self) -> "MappedFileReader":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
 class FileWriter:
     def __init__(self, file_name: str):
         self.file = open(file_name, 'wb')
@@ -33,3 +105,52 @@ class FileWriter:
 
     def tell(self):
         return self.file.tell()
+
+
+def _target_mode(file_name: str) -> int:
+    """Permission bits of the existing file, or 0666 minus the umask for a new one."""
+    try:
+        return stat.S_IMODE(os.stat(file_name).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class BufferWriter:
+    """Writer that assembles the whole file in one growable bytearray.
+
+    Nothing touches the disk until commit(), which writes the buffer with a single
+    call to a temporary file next to the target and renames it over the target, so
+    a failed export never leaves a truncated file behind. patch() overwrites bytes
+    that were reserved earlier, e.g. a header whose offsets are only known at the end.
+    """
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.buffer = bytearray()
+
+    def write(self, data: bytes):
+        self.buffer += data
+
+    def patch(self, offset: int, data: bytes):
+        self.buffer[offset:offset + len(data)] = data
+
+    def tell(self) -> int:
+        return len(self.buffer)
+
+    def commit(self):
+        directory = os.path.dirname(os.path.abspath(self.file_name))
+        handle, temp_name = tempfile.mkstemp(prefix=os.path.basename(self.file_name), suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                file.write(self.buffer)
+            # mkstemp creates the file as 0600; give it the mode a plain open() would have
+            os.chmod(temp_name, _target_mode(self.file_name))
+            os.replace(temp_name, self.file_name)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+    def close(self):
+        self.buffer = bytearray()
@@ -0,0 +1,310 @@
+"""
+Oriented bounding boxes fitted with NumPy only.
+
+fit_oriented_box() computes the convex hull of a point set with a quickhull and scores
+candidate orientations against the hull vertices in batched array math. Dense point sets
+are first reduced to their extreme points along a fixed set of directions, so the hull and
+the scoring stay bounded; the extents of the chosen box are still measured on every point.
+The candidates are:
+- the PCA frame and the world axes
+- every PCA axis, world axis and major hull face normal as the box normal, each paired
+  with the silhouette hull edges seen along it (the rotating calipers candidates: the
+  smallest rectangle around a convex outline has one side on an outline edge)
+The frame with the smallest volume wins.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Hull face normals tried as box normals, largest faces first
+MAX_NORMAL_CANDIDATES = 48
+# Candidate frames scored per fit, frames of the first normals first
+MAX_FRAMES = 4096
+# Point sets above this size are reduced to their extremes along SAMPLE_DIRECTIONS directions
+MAX_HULL_POINTS = 1024
+SAMPLE_DIRECTIONS = 256
+# Best frames on the sample that are scored again on every point
+REFINED_FRAMES = 32
+# Candidate frames x hull vertices evaluated per batch
+BATCH_SIZE = 1 << 21
+
+
+def _pca_axes(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the principal axes as columns (right-handed) and the singular values."""
+    _u, singular_values, vt = np.linalg.svd(points - points.mean(axis=0), full_matrices=False)
+    axes = vt.T
+    if axes.shape[1] < 3:
+        return np.eye(3), np.zeros(3)
+    if np.linalg.det(axes) < 0:
+        axes[:, 2] *= -1.0
+    return axes, singular_values
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cross product of (N, 3) arrays; np.cross has a high per-call cost on small inputs."""
+    return np.column_stack(
+        (
+            a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+            a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+            a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0],
+        )
+    )
+
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    grown = np.zeros((size,) + array.shape[1:], dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _planes(points: np.ndarray, triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    a, b, c = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+    normals = _cross(b - a, c - a)
+    lengths = np.sqrt((normals * normals).sum(axis=1))
+    normals /= np.maximum(lengths, 1e-300)[:, None]
+    return normals, (normals * a).sum(axis=1)
+
+
+def _neighbours(triangles: np.ndarray) -> np.ndarray:
+    """Return (F, 3) indices of the face across edge (v[k], v[k + 1]) of each face of a closed mesh."""
+    edges = np.concatenate((triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]))
+    n = int(triangles.max()) + 1
+    codes = edges[:, 0] * n + edges[:, 1]
+    order = np.argsort(codes)
+    twins = order[np.searchsorted(codes[order], edges[:, 1] * n + edges[:, 0])]
+    return (twins % len(triangles)).reshape(3, -1).T
+
+
+def convex_hull(points: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Return the outward-facing (F, 3) triangles of the convex hull of (N, 3) points.
+
+    Returns None if the points do not span a volume (fewer than four points, or all of
+    them collinear or coplanar). The faces seen from each new apex are found by walking
+    the face adjacency from the face that owns the apex, so an iteration only touches
+    the visible faces and their border instead of the whole hull, and the points outside
+    the hull are kept in per-face conflict lists so only the orphans of removed faces are
+    reassigned.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 4:
+        return None
+    extent = float(np.ptp(points, axis=0).max())
+    eps = 1e-9 * max(extent, 1e-12)
+
+    # Initial simplex: the two extremes of the widest axis, the point farthest from
+    # their line and the point farthest from their plane
+    axis = int(np.argmax(np.ptp(points, axis=0)))
+    i0, i1 = int(np.argmin(points[:, axis])), int(np.argmax(points[:, axis]))
+    line = points[i1] - points[i0]
+    line_distance = np.linalg.norm(np.cross(points - points[i0], line), axis=1) / max(np.linalg.norm(line), 1e-300)
+    i2 = int(np.argmax(line_distance))
+    if line_distance[i2] <= eps:
+        return None
+    normal = np.cross(line, points[i2] - points[i0])
+    normal /= np.linalg.norm(normal)
+    plane_distance = (points - points[i0]) @ normal
+    i3 = int(np.argmax(np.abs(plane_distance)))
+    if abs(plane_distance[i3]) <= eps:
+        return None
+
+    if plane_distance[i3] > 0.0:
+        i1, i2 = i2, i1
+    triangles = np.array([[i0, i1, i2], [i0, i3, i1], [i1, i3, i2], [i2, i3, i0]], dtype=np.int64)
+    normals, offsets = _planes(points, triangles)
+    neighbours = _neighbours(triangles)
+    alive = np.ones(4, dtype=bool)
+    count = 4
+
+    def assign(candidates: np.ndarray, normals: np.ndarray, offsets: np.ndarray, first_face: int):
+        """Give every point outside the hull to the face it is farthest above."""
+        distances = points[candidates] @ normals.T - offsets
+        owners = np.argmax(distances, axis=1)
+        outside = distances[np.arange(len(candidates)), owners] > eps
+        candidates, owners = candidates[outside], owners[outside]
+        order = np.argsort(owners, kind="stable")
+        faces, starts = np.unique(owners[order], return_index=True)
+        for face, owned in zip(faces, np.split(candidates[order], starts[1:])):
+            conflicts[first_face + int(face)] = owned
+
+    conflicts = {}
+    assign(np.setdiff1d(np.arange(len(points)), [i0, i1, i2, i3]), normals, offsets, 0)
+
+    corner = np.array([[0, 1], [1, 2], [2, 0]])
+    while conflicts:
+        # The point farthest above a face is a hull vertex
+        owner, owned = conflicts.popitem()
+        pick = int(np.argmax(points[owned] @ normals[owner]))
+        apex = points[owned[pick]]
+
+        # Visible faces form a connected patch around the owner face; removed faces are
+        # marked dead as they are found, so the walk never steps back into the patch
+        frontier = np.array([owner])
+        alive[frontier] = False
+        patch = [frontier]
+        while len(frontier):
+            across = np.unique(neighbours[frontier])
+            across = across[alive[across]]
+            frontier = across[normals[across] @ apex - offsets[across] > eps]
+            alive[frontier] = False
+            patch.append(frontier)
+        visible = np.concatenate(patch)
+
+        # Horizon: edges of visible faces whose neighbour survived, in the winding of the visible face
+        face_slots, edge_slots = np.nonzero(alive[neighbours[visible]])
+        faces = visible[face_slots]
+        hidden = neighbours[faces, edge_slots]
+        horizon = triangles[faces[:, None], corner[edge_slots]]
+        new_triangles = np.column_stack((horizon, np.full(len(horizon), owned[pick])))
+        new_normals, new_offsets = _planes(points, new_triangles)
+
+        # Face arrays grow by doubling; removed faces stay behind as dead slots
+        first_new, count = count, count + len(new_triangles)
+        if count > len(triangles):
+            size = max(count, 2 * len(triangles))
+            triangles, normals, offsets, neighbours, alive = (
+                _grow(triangles, size), _grow(normals, size), _grow(offsets, size),
+                _grow(neighbours, size), _grow(alive, size)
+            )
+        new_faces = np.arange(first_new, count)
+        triangles[first_new:count] = new_triangles
+        normals[first_new:count] = new_normals
+        offsets[first_new:count] = new_offsets
+        alive[first_new:count] = True
+        # New face (a, b, apex) borders the hidden face across (a, b) and the new faces
+        # starting and ending at b and a; the horizon is a cycle, so both are unique
+        neighbours[hidden, np.argmax(neighbours[hidden] == faces[:, None], axis=1)] = new_faces
+        order = np.argsort(horizon[:, 0])
+        neighbours[first_new:count, 0] = hidden
+        neighbours[first_new:count, 1] = new_faces[order[np.searchsorted(horizon[order, 0], horizon[:, 1])]]
+        order = np.argsort(horizon[:, 1])
+        neighbours[first_new:count, 2] = new_faces[order[np.searchsorted(horizon[order, 1], horizon[:, 0])]]
+
+        # Points of the removed faces are reassigned to the new faces or dropped
+        orphans = [np.delete(owned, pick)] + [conflicts.pop(face) for face in visible.tolist() if face in conflicts]
+        orphans = np.concatenate(orphans)
+        if len(orphans):
+            assign(orphans, new_normals, new_offsets, first_new)
+
+    return triangles[:count][alive[:count]]
+
+
+def _hull_edges(triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the undirected hull edges (E, 2) and the two faces (E,), (E,) on either side."""
+    edges = np.concatenate((triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]))
+    faces = np.tile(np.arange(len(triangles)), 3)
+    n = int(triangles.max()) + 1
+    codes = edges[:, 0] * n + edges[:, 1]
+    order = np.argsort(codes)
+    sorted_codes = codes[order]
+    forward = np.flatnonzero(edges[:, 0] < edges[:, 1])
+    twin_slots = np.minimum(np.searchsorted(sorted_codes, edges[forward, 1] * n + edges[forward, 0]), len(codes) - 1)
+    has_twin = sorted_codes[twin_slots] == edges[forward, 1] * n + edges[forward, 0]
+    forward, twin_slots = forward[has_twin], twin_slots[has_twin]
+    return edges[forward], faces[forward], faces[order[twin_slots]]
+
+
+def _frames_from_axes(normals: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """Build right-handed frames (M, 3, 3) with columns (x, z cross x, z) from z normals and x directions."""
+    x = directions - normals * np.einsum("ij,ij->i", directions, normals)[:, None]
+    lengths = np.linalg.norm(x, axis=1)
+    usable = lengths > 1e-9
+    x = x[usable] / lengths[usable, None]
+    z = normals[usable]
+    return np.stack((x, np.cross(z, x), z), axis=2)
+
+
+def _extreme_points(points: np.ndarray, count: int) -> np.ndarray:
+    """Return the points farthest along +/- each of `count` directions spread over the sphere."""
+    # Fibonacci sphere directions
+    z = np.linspace(1.0 - 1.0 / count, 1.0 / count - 1.0, count)
+    angles = np.pi * (3.0 - np.sqrt(5.0)) * np.arange(count)
+    radii = np.sqrt(1.0 - z * z)
+    directions = np.stack((radii * np.cos(angles), radii * np.sin(angles), z))
+    extremes = []
+    step = max(1, BATCH_SIZE // count)
+    for start in range(0, len(points), step):
+        projected = points[start : start + step] @ directions
+        extremes += [start + projected.argmax(axis=0), start + projected.argmin(axis=0)]
+    # The winners of each batch compete once more
+    candidates = np.unique(np.concatenate(extremes))
+    projected = points[candidates] @ directions
+    winners = np.concatenate((projected.argmax(axis=0), projected.argmin(axis=0)))
+    return points[candidates[np.unique(winners)]]
+
+
+def _box_volumes(points: np.ndarray, frames: np.ndarray, padding: float) -> np.ndarray:
+    """Volumes of the boxes around the points in each frame, every side padded so flat boxes still rank by area."""
+    volumes = np.empty(len(frames))
+    step = max(1, BATCH_SIZE // (3 * max(len(points), 1)))
+    for start in range(0, len(frames), step):
+        batch = frames[start : start + step]
+        # One (P, 3) x (3, 3M) product projects the points onto every axis of the batch
+        projected = points @ batch.transpose(1, 0, 2).reshape(3, -1)
+        sides = (projected.max(axis=0) - projected.min(axis=0)).reshape(-1, 3) + padding
+        volumes[start : start + step] = np.prod(sides, axis=1)
+    return volumes
+
+
+def _candidate_frames(points: np.ndarray, triangles: np.ndarray, axes: np.ndarray) -> np.ndarray:
+    frames = [axes[None], np.eye(3)[None]]
+    face_normals, _offsets = _planes(points, triangles)
+    a, b, c = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+    areas = np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    # Coplanar hull triangles share one normal; keep the largest planes
+    keys, inverse = np.unique(np.rint(face_normals * 1e6).astype(np.int64), axis=0, return_inverse=True)
+    plane_areas = np.bincount(inverse.reshape(-1), weights=areas, minlength=len(keys))
+    plane_normals = np.zeros((len(keys), 3))
+    plane_normals[inverse.reshape(-1)] = face_normals
+    plane_normals = plane_normals[np.argsort(-plane_areas)[:MAX_NORMAL_CANDIDATES]]
+    normals = np.concatenate((axes.T, np.eye(3), plane_normals))
+
+    # Silhouette edges along a normal lie between a face turned towards it and one that is not
+    edges, left, right = _hull_edges(triangles)
+    directions = points[edges[:, 1]] - points[edges[:, 0]]
+    directions /= np.maximum(np.linalg.norm(directions, axis=1, keepdims=True), 1e-300)
+    facing = face_normals @ normals.T > 1e-9
+    normal_index, edge_index = np.nonzero((facing[left] != facing[right]).T)
+    frames.append(_frames_from_axes(normals[normal_index], directions[edge_index]))
+    frames = np.concatenate(frames)
+    # Parallel silhouette edges give the same frame
+    keys = np.rint(frames[:, :, [0, 2]] * 1e6).reshape(-1, 6).astype(np.int64)
+    _keys, first = np.unique(keys, axis=0, return_index=True)
+    return frames[np.sort(first)[:MAX_FRAMES]]
+
+
+def fit_oriented_box(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fit an oriented box around (N, 3) points.
+
+    Returns (center (3,), axes (3, 3) as right-handed unit columns, half extents (3,)).
+    Extents are padded by 1e-6 and never below 1e-9.
+    """
+    points = np.unique(np.asarray(points, dtype=np.float64).reshape(-1, 3), axis=0)
+    axes, singular_values = _pca_axes(points)
+    extent = float(np.ptp(points, axis=0).max()) if len(points) else 0.0
+    frames = np.stack((axes, np.eye(3)))
+    corners = points
+    if len(points) >= 4 and singular_values[1] > 1e-12 * max(singular_values[0], 1e-300):
+        samples = _extreme_points(points, SAMPLE_DIRECTIONS) if len(points) > MAX_HULL_POINTS else points
+        hull_points = samples
+        if singular_values[2] <= 1e-9 * singular_values[0]:
+            # Flat: give the hull some thickness so it has edges to try
+            thickness = 1e-3 * extent * axes[:, 2]
+            hull_points = np.concatenate((samples - thickness, samples + thickness))
+        triangles = convex_hull(hull_points)
+        if triangles is not None:
+            frames = _candidate_frames(hull_points, triangles, axes)
+            # Only hull vertices can touch the box
+            corners = samples[np.unique(triangles) % len(samples)]
+
+    volumes = _box_volumes(corners, frames, 1e-6 * extent)
+    if len(points) > MAX_HULL_POINTS:
+        # The sample can miss points near the box faces; settle the best frames on all points
+        frames = frames[np.argsort(volumes)[:REFINED_FRAMES]]
+        volumes = _box_volumes(points, frames, 1e-6 * extent)
+    best = frames[int(np.argmin(volumes))]
+    projected = points @ best
+    low, high = projected.min(axis=0), projected.max(axis=0)
+    center = best @ (0.5 * (low + high))
+    return center, best, np.maximum(0.5 * (high - low) + 1e-6, 1e-9)
@@ -0,0 +1,40 @@
+"""
+Batched quaternion and vector math on NumPy arrays.
+
+Quaternions are (..., 4) arrays in (w, x, y, z) order, vectors are (..., 3) arrays; all
+functions broadcast, so one bind-pose quaternion can be applied to every key of a bone in
+a single call. Products follow mathutils: `quaternion_multiply(a, b)` is `a @ b` and
+`rotate_vectors(q, v)` is `q @ v`.
+"""
+import numpy as np
+
+
+def quaternion_conjugate(quaternions: np.ndarray) -> np.ndarray:
+    conjugate = np.array(quaternions, dtype=np.float64, copy=True)
+    conjugate[..., 1:] *= -1.0
+    return conjugate
+
+
+def quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product a * b."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack(
+        (
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+        ),
+        axis=-1,
+    )
+
+
+def rotate_vectors(quaternions: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Rotate vectors by quaternions as q * (0, v) * conj(q); like mathutils, q is not normalized."""
+    vectors = np.asarray(vectors, dtype=np.float64)
+    pure = np.concatenate((np.zeros(vectors.shape[:-1] + (1,)), vectors), axis=-1)
+    rotated = quaternion_multiply(quaternion_multiply(quaternions, pure), quaternion_conjugate(quaternions))
+    return rotated[..., 1:]
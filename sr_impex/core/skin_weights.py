@@ -0,0 +1,81 @@
+"""
+Batched selection of the strongest bone influences per vertex.
+
+Influences are given as three parallel arrays (vertex, bone, weight), i.e. a sparse
+vertex x bone matrix in coordinate form. limit_influences() keeps the strongest
+`max_influences` per vertex and renormalizes them; quantize_weights() turns the result
+into bytes that sum to exactly 255 per influenced vertex.
+"""
+from typing import Tuple
+
+import numpy as np
+
+MAX_INFLUENCES = 4
+
+
+def limit_influences(
+    vertex_ids: np.ndarray,
+    bone_ids: np.ndarray,
+    weights: np.ndarray,
+    vertex_count: int,
+    max_influences: int = MAX_INFLUENCES,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Reduce sparse influences to (V, max_influences) bone ids and weights.
+
+    Non-positive weights are ignored and a repeated (vertex, bone) pair keeps its first
+    weight. Each vertex keeps its strongest influences in descending order (ties keep
+    input order) and its weights are scaled to sum to 1; unused slots are (0, 0.0).
+    Returns (bone ids, weights, number of vertices that had influences dropped).
+    """
+    vertex_ids = np.asarray(vertex_ids, dtype=np.int64).reshape(-1)
+    bone_ids = np.asarray(bone_ids, dtype=np.int64).reshape(-1)
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+    out_bones = np.zeros((vertex_count, max_influences), dtype=np.int64)
+    out_weights = np.zeros((vertex_count, max_influences), dtype=np.float64)
+
+    keep = weights > 0.0
+    vertex_ids, bone_ids, weights = vertex_ids[keep], bone_ids[keep], weights[keep]
+    if len(weights) == 0:
+        return out_bones, out_weights, 0
+    pairs = np.stack((vertex_ids, bone_ids), axis=1)
+    _, first = np.unique(pairs, axis=0, return_index=True)
+    first.sort()
+    vertex_ids, bone_ids, weights = vertex_ids[first], bone_ids[first], weights[first]
+
+    # Scatter into a dense (V, K) matrix, K being the largest influence count of any vertex
+    order = np.argsort(vertex_ids, kind="stable")
+    vertex_ids, bone_ids, weights = vertex_ids[order], bone_ids[order], weights[order]
+    counts = np.bincount(vertex_ids, minlength=vertex_count)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    slots = np.arange(len(vertex_ids)) - starts[vertex_ids]
+    width = max(int(counts.max()), max_influences)
+    dense_bones = np.zeros((vertex_count, width), dtype=np.int64)
+    dense_weights = np.zeros((vertex_count, width), dtype=np.float64)
+    dense_bones[vertex_ids, slots] = bone_ids
+    dense_weights[vertex_ids, slots] = weights
+
+    if width > max_influences:
+        selected = np.argpartition(-dense_weights, max_influences - 1, axis=1)[:, :max_influences]
+        # Keep the selected slots in input order so the stable sort below breaks ties by it
+        selected.sort(axis=1)
+        dense_bones = np.take_along_axis(dense_bones, selected, axis=1)
+        dense_weights = np.take_along_axis(dense_weights, selected, axis=1)
+    ranking = np.argsort(-dense_weights, axis=1, kind="stable")
+    out_bones[:] = np.take_along_axis(dense_bones, ranking, axis=1)
+    out_weights[:] = np.take_along_axis(dense_weights, ranking, axis=1)
+
+    totals = out_weights.sum(axis=1, keepdims=True)
+    np.divide(out_weights, totals, out=out_weights, where=totals > 0.0)
+    return out_bones, out_weights, int(np.count_nonzero(counts > max_influences))
+
+
+def quantize_weights(weights: np.ndarray, total: int = 255) -> np.ndarray:
+    """
+    Quantize normalized (V, N) weights to bytes, diffusing the rounding error along each row.
+
+    Rows are rounded on their running sum, so every row that sums to 1 yields bytes that sum
+    to exactly `total`; all-zero rows stay zero.
+    """
+    cumulative = np.rint(np.cumsum(np.asarray(weights, dtype=np.float64), axis=1) * total)
+    return np.diff(cumulative, axis=1, prepend=0.0).astype(np.uint8)
@@ -0,0 +1,93 @@
+"""
+Welded triangle geometry shared by the collision and skinning parts of one export.
+
+The meshes of a model are concatenated and vertices whose positions round to the same
+grid point (10^-digits) are merged with a NumPy hash on the quantized coordinates.
+Welded vertices keep the order of their first occurrence, and triangles that collapse
+onto fewer than three vertices are dropped. match_positions() joins other vertex sets
+against the welded vertices on the same grid.
+"""
+from dataclasses import dataclass, field
+from typing import Iterable, Tuple
+
+import numpy as np
+
+WELD_DIGITS = 6
+
+
+def quantize_positions(positions: np.ndarray, digits: int = WELD_DIGITS) -> np.ndarray:
+    """Return the (N, 3) int64 grid keys of positions rounded to `digits` decimals."""
+    return np.rint(np.asarray(positions, dtype=np.float64) * 10.0**digits).astype(np.int64)
+
+
+_KEY_DTYPE = np.dtype([("x", "<i8"), ("y", "<i8"), ("z", "<i8")])
+
+
+def _key_records(keys: np.ndarray) -> np.ndarray:
+    """View (N, 3) int64 keys as N records, which sort and search lexicographically."""
+    return np.ascontiguousarray(keys, dtype=np.int64).view(_KEY_DTYPE).reshape(-1)
+
+
+def match_positions(reference: np.ndarray, queries: np.ndarray, digits: int = WELD_DIGITS) -> np.ndarray:
+    """
+    Return, for every query position, the index of the reference position on the same grid point.
+
+    Both sets are quantized and joined with a sort and searchsorted; queries without an exact
+    grid match get -1. If several reference positions share a grid point, the first one wins.
+    """
+    reference_keys = _key_records(quantize_positions(np.asarray(reference).reshape(-1, 3), digits))
+    query_keys = _key_records(quantize_positions(np.asarray(queries).reshape(-1, 3), digits))
+    matches = np.full(len(query_keys), -1, dtype=np.int64)
+    if len(reference_keys) == 0 or len(query_keys) == 0:
+        return matches
+    order = np.argsort(reference_keys, kind="stable")
+    sorted_keys = reference_keys[order]
+    slots = np.searchsorted(sorted_keys, query_keys)
+    clipped = np.minimum(slots, len(sorted_keys) - 1)
+    found = sorted_keys[clipped] == query_keys
+    matches[found] = order[clipped[found]]
+    return matches
+
+
+@dataclass(eq=False)
+class WeldedGeometry:
+    positions: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.float64))
+    triangles: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.int32))
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.triangles)
+
+
+def weld_meshes(meshes: Iterable[Tuple[np.ndarray, np.ndarray]], digits: int = WELD_DIGITS) -> WeldedGeometry:
+    """Weld (positions (N, 3), triangles (F, 3)) pairs, each indexing its own positions, into one geometry."""
+    all_positions, all_triangles = [np.zeros((0, 3))], [np.zeros((0, 3), dtype=np.int64)]
+    offset = 0
+    for positions, triangles in meshes:
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        all_positions.append(positions)
+        all_triangles.append(np.asarray(triangles, dtype=np.int64).reshape(-1, 3) + offset)
+        offset += len(positions)
+    positions = np.concatenate(all_positions)
+    triangles = np.concatenate(all_triangles)
+
+    _, first, inverse = np.unique(
+        quantize_positions(positions, digits), axis=0, return_index=True, return_inverse=True
+    )
+    # Renumber the welded vertices by first occurrence instead of key order
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    remap = rank[inverse.reshape(-1)]
+
+    triangles = remap[triangles]
+    degenerate = (
+        (triangles[:, 0] == triangles[:, 1])
+        | (triangles[:, 1] == triangles[:, 2])
+        | (triangles[:, 0] == triangles[:, 2])
+    )
+    return WeldedGeometry(positions[first[order]], triangles[~degenerate].astype(np.int32))
@@ -21,13 +21,20 @@ from dataclasses import dataclass, field
 from struct import calcsize, pack, unpack
 from typing import BinaryIO, List, Union
 
-from mathutils import Vector
-
-from sr_impex.definitions.base_types import Vector3
+from sr_impex.definitions.base_types import Fixed, Items, Nested, String, Vector3, When, binary_layout
 from sr_impex.definitions.resource_definitions import IKAtlas
 from sr_impex.definitions.enums import AnimationType
 
 
+@binary_layout(
+    Fixed("version", "i"),
+    Fixed("weight", "i"),
+    Fixed("length", "i"),
+    String("file", "length"),
+    When(lambda self: self.version >= 4, Fixed("start", "f"), Fixed("end", "f")),
+    When(lambda self: self.version >= 5, Fixed("allows_ik", "B")),
+    When(lambda self: self.version >= 7, Fixed("force_no_blend", "B")),
+)
 @dataclass(eq=False, repr=False)
 class AnimationSetVariant:
     version: int = 7
@@ -39,51 +46,6 @@ class AnimationSetVariant:
     allows_ik: int = 1
     force_no_blend: int = 0
 
-    def read(self, file: BinaryIO) -> "AnimationSetVariant":
-        """Reads the AnimationSetVariant from the buffer"""
-        self.version = unpack("i", file.read(4))[0]
-        self.weight = unpack("i", file.read(4))[0]
-        self.length = unpack("i", file.read(4))[0]
-        self.file = (
-            unpack(f"{self.length}s", file.read(calcsize(f"{self.length}s")))[0]
-            .decode("utf-8")
-            .strip("\x00")
-        )
-
-        if self.version >= 4:
-            self.start = unpack("f", file.read(4))[0]
-            self.end = unpack("f", file.read(4))[0]
-        if self.version >= 5:
-            self.allows_ik = unpack("B", file.read(1))[0]
-        if self.version >= 7:
-            self.force_no_blend = unpack("B", file.read(1))[0]
-
-        return self
-
-    def write(self, file: BinaryIO):
-        """Writes the AnimationSetVariant to the buffer"""
-        file.write(pack("i", self.version))
-        file.write(pack("i", self.weight))
-        file.write(pack("i", self.length))
-        file.write(pack(f"{self.length}s", self.file.encode("utf-8")))
-        if self.version >= 4:
-            file.write(pack("ff", self.start, self.end))
-        if self.version >= 5:
-            file.write(pack("B", self.allows_ik))
-        if self.version >= 7:
-            file.write(pack("B", self.force_no_blend))
-
-    def size(self) -> int:
-        """Returns the size of the AnimationSetVariant"""
-        base = 12 + self.length
-        if self.version >= 4:
-            base += 8
-        if self.version >= 5:
-            base += 1
-        if self.version >= 7:
-            base += 1
-        return base
-
 
 @dataclass(eq=False, repr=False)
 class ModeAnimationKey:
@@ -166,6 +128,12 @@ class ModeAnimationKey:
         return base
 
 
+@binary_layout(
+    Fixed("is_spawn_animation", "i"),
+    Fixed("time", "f"),
+    Nested("direction", Vector3),
+    Nested("position", Vector3),
+)
 @dataclass(eq=False, repr=False)
 class AnimationMarker:
     """AnimationMarker"""
@@ -175,24 +143,6 @@ class AnimationMarker:
     direction: Vector3 = field(default_factory=lambda: Vector3(0, 0, 0))
     position: Vector3 = field(default_factory=lambda: Vector3(0, 0, 0))
 
-    def read(self, file: BinaryIO) -> "AnimationMarker":
-        """Reads the AnimationMarker from the buffer"""
-        self.is_spawn_animation = unpack("i", file.read(4))[0]  # 4 bytes
-        self.time = unpack("f", file.read(4))[0]  # 4 bytes
-        self.direction = Vector3().read(file)  # 12 bytes
-        self.position = Vector3().read(file)  # 12 bytes
-        return self
-
-    def write(self, file: BinaryIO) :
-        """Writes the AnimationMarker to the buffer"""
-        file.write(pack("if", self.is_spawn_animation, self.time))
-        self.direction.write(file)
-        self.position.write(file)
-
-    def size(self) -> int:
-        """Returns the size of the AnimationMarker"""
-        return 32
-
 
 @dataclass(eq=False, repr=False)
 class AnimationMarkerSet:
@@ -506,33 +456,26 @@ class AnimationSet:
         return base
 
 
+@binary_layout(
+    Fixed("cast_ms", "i"),
+    Fixed("resolve_ms", "i"),
+    Nested("direction", Vector3),
+    Fixed("animation_marker_id", "I"),
+)
 @dataclass(eq=False, repr=False)
 class Timing:
     cast_ms: int = 0  # Int
     resolve_ms: int = 0  # Int
-    direction: Vector = Vector((0.0, 0.0, 1.0))  # Vector
+    direction: Vector3 = field(default_factory=lambda: Vector3(0.0, 0.0, 1.0))
     animation_marker_id: int = 0  # UInt
 
-    def read(self, file: BinaryIO) -> "Timing":
-        """Reads the Timing from the buffer"""
-        self.cast_ms = unpack("i", file.read(4))[0]
-        self.resolve_ms = unpack("i", file.read(4))[0]
-        self.direction = Vector(unpack("fff", file.read(12)))
-        self.animation_marker_id = unpack("I", file.read(4))[0]
-        return self
-
-    def write(self, file: BinaryIO):
-        """Writes the Timing to the buffer"""
-        file.write(pack("i", self.cast_ms))
-        file.write(pack("i", self.resolve_ms))
-        file.write(pack("fff", *self.direction))
-        file.write(pack("I", self.animation_marker_id))
-
-    def size(self) -> int:
-        """Returns the size of the Timing"""
-        return calcsize("iifffi")
-
 
+@binary_layout(
+    Fixed("weight", "B"),
+    When(lambda _self, animation_timing_version: animation_timing_version == 4, Fixed("variant_index", "B")),
+    Fixed("timing_count", "H"),
+    Items("timings", Timing, "timing_count"),
+)
 @dataclass(eq=False, repr=False)
 class TimingVariant:
     # Byte. The weight of this variant. The higher the weight, the more likely it is to be chosen.
@@ -542,31 +485,6 @@ class TimingVariant:
     timing_count: int = 0
     timings: List[Timing] = field(default_factory=list)
 
-    def read(self, file: BinaryIO, animation_timing_version: int) -> "TimingVariant":
-        """Reads the TimingVariant from the buffer"""
-        self.weight = unpack("B", file.read(1))[0]
-        if animation_timing_version == 4:
-            self.variant_index = unpack("B", file.read(1))[0]
-        self.timing_count = unpack("H", file.read(2))[0]
-        self.timings = [Timing().read(file) for _ in range(self.timing_count)]
-        return self
-
-    def write(self, file: BinaryIO, animation_timing_version: int) -> "TimingVariant":
-        """Writes the TimingVariant to the buffer"""
-        file.write(pack("B", self.weight))
-        if animation_timing_version == 4:
-            file.write(pack("B", self.variant_index))
-        file.write(pack("H", self.timing_count))
-        for timing in self.timings:
-            timing.write(file)
-        return self
-
-    def size(self, animation_timing_version: int) -> int:
-        """Returns the size of the TimingVariant"""
-        if animation_timing_version == 4:
-            return 4 + sum(timing.size() for timing in self.timings)
-        return 3 + sum(timing.size() for timing in self.timings)
-
 
 @dataclass(eq=False, repr=False)
 class AnimationTiming:
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from struct import calcsize, pack, unpack
-from typing import BinaryIO, List, Union
-from mathutils import Vector, Matrix
+from struct import Struct, pack, unpack
+from typing import Any, BinaryIO, Callable, List, Tuple, Union
+import numpy as np
 
-from sr_impex.definitions.enums import MagicValues
+from sr_impex.core.file_io import BufferWriter
+from sr_impex.definitions.enums import MagicValues, WriteOrder
 
 
 class ExportError(RuntimeError):
@@ -25,10 +26,23 @@ def error_context(ctx: str):
         raise ExportError(f"{ctx}: {exc}") from exc
 
 
+def _write_failure(obj, exc: Exception) -> ExportError:
+    """Build the ExportError raised when obj.write fails, naming the object if it has a name."""
+    ident = None
+    for attr in ("name", "id", "mesh_name", "material_name"):
+        if hasattr(obj, attr):
+            ident = getattr(obj, attr)
+            if ident:
+                break
+    extra = f" name={ident}" if ident else ""
+    return ExportError(f"{type(obj).__name__}.write failed{extra}: {exc}")
+
+
 def _wrap_write_method(cls):
     """Wrap cls.write(self, file, ...) so any exception becomes ExportError with class/name context."""
     original = getattr(cls, "write", None)
-    if not callable(original):
+    if not callable(original) or getattr(original, "__error_context__", False):
+        # Compiled layouts (and already wrapped methods) carry the error context inline
         return
 
     def wrapped(self, *args, **kwargs):
@@ -37,15 +51,9 @@ def _wrap_write_method(cls):
         except ExportError:
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
-            ident = None
-            for attr in ("name", "id", "mesh_name", "material_name"):
-                if hasattr(self, attr):
-                    ident = getattr(self, attr)
-                    if ident:
-                        break
-            extra = f" name={ident}" if ident else ""
-            raise ExportError(f"{cls.__name__}.write failed{extra}: {exc}") from exc
+            raise _write_failure(self, exc) from exc
 
+    wrapped.__error_context__ = True
     setattr(cls, "write", wrapped)
 
 
@@ -56,61 +64,333 @@ def _auto_wrap_all_write_methods(module_globals: dict):
             _wrap_write_method(obj)
 
 
+class Fixed:
+    """Fixed-size field: a struct format of one type code with an optional repeat count ("i", "16b", "3f").
+
+    Repeated fields hold a tuple, or whatever `wrap` builds from it.
+    """
+
+    def __init__(self, name: str, fmt: str, wrap: Callable = None):
+        self.name = name
+        self.fmt = fmt
+        self.count = int(fmt[:-1] or 1)
+        self.wrap = wrap
+
+
+class String:
+    """UTF-8 string whose byte length is stored in an earlier field; written zero-padded to that length."""
+
+    def __init__(self, name: str, length_field: str):
+        self.name = name
+        self.length_field = length_field
+
+
+class Nested:
+    """Field holding another definition object with its own read/write/size."""
+
+    def __init__(self, name: str, cls: type):
+        self.name = name
+        self.cls = cls
+
+
+class Items:
+    """List of definition objects whose length is stored in an earlier field."""
+
+    def __init__(self, name: str, cls: type, count_field: str):
+        self.name = name
+        self.cls = cls
+        self.count_field = count_field
+
+
+class When:
+    """Fields that are only present if predicate(self, *args) holds, args being the extra read/write/size arguments."""
+
+    def __init__(self, predicate: Callable[..., bool], *fields):
+        self.predicate = predicate
+        self.fields = fields
+
+
+class _LayoutCompiler:
+    """Generate the source of read/write/size for a layout, merging adjacent Fixed fields into one Struct."""
+
+    def __init__(self):
+        self.namespace = {"ExportError": ExportError, "_write_failure": _write_failure, "_encode_padded": _encode_padded}
+        self.read_lines: List[str] = []
+        self.write_lines: List[str] = []
+
+    def bind(self, value) -> str:
+        key = f"_c{len(self.namespace)}"
+        self.namespace[key] = value
+        return key
+
+    def emit(self, fields, indent: int) -> List[Union[int, str]]:
+        """Emit the read/write statements of a block and return its size terms."""
+        size_terms: List[Union[int, str]] = []
+        group: List[Fixed] = []
+        for spec in fields:
+            if isinstance(spec, Fixed):
+                group.append(spec)
+                continue
+            self.emit_fixed(group, indent, size_terms)
+            group = []
+            self.emit_field(spec, indent, size_terms)
+        self.emit_fixed(group, indent, size_terms)
+        return size_terms
+
+    def emit_fixed(self, group: List[Fixed], indent: int, size_terms: list) -> None:
+        if not group:
+            return
+        pad = "    " * indent
+        compiled = Struct("<" + "".join(spec.fmt for spec in group))
+        key = self.bind(compiled)
+        if all(spec.count == 1 and spec.wrap is None for spec in group):
+            targets = ", ".join(f"self.{spec.name}" for spec in group)
+            self.read_lines.append(f"{pad}{targets}, = {key}.unpack(file.read({compiled.size}))")
+        else:
+            self.read_lines.append(f"{pad}_v = {key}.unpack(file.read({compiled.size}))")
+            position = 0
+            for spec in group:
+                value = f"_v[{position}]" if spec.count == 1 else f"_v[{position}:{position + spec.count}]"
+                if spec.wrap is not None:
+                    value = f"{self.bind(spec.wrap)}({value})"
+                self.read_lines.append(f"{pad}self.{spec.name} = {value}")
+                position += spec.count
+        values = ", ".join(f"self.{spec.name}" if spec.count == 1 else f"*self.{spec.name}" for spec in group)
+        self.write_lines.append(f"{pad}file.write({key}.pack({values}))")
+        size_terms.append(compiled.size)
+
+    def emit_field(self, spec, indent: int, size_terms: list) -> None:
+        pad = "    " * indent
+        if isinstance(spec, String):
+            length = f"self.{spec.length_field}"
+            self.read_lines.append(f'{pad}self.{spec.name} = file.read({length}).decode("utf-8").strip("\\x00")')
+            self.write_lines.append(f"{pad}file.write(_encode_padded(self.{spec.name}, {length}))")
+            size_terms.append(length)
+        elif isinstance(spec, Nested):
+            key = self.bind(spec.cls)
+            self.read_lines.append(f"{pad}self.{spec.name} = {key}().read(file)")
+            self.write_lines.append(f"{pad}self.{spec.name}.write(file)")
+            fixed = getattr(spec.cls, "__layout_size__", None)
+            size_terms.append(fixed if fixed is not None else f"self.{spec.name}.size()")
+        elif isinstance(spec, Items):
+            key = self.bind(spec.cls)
+            self.read_lines.append(f"{pad}self.{spec.name} = [{key}().read(file) for _ in range(self.{spec.count_field})]")
+            self.write_lines.append(f"{pad}for _item in self.{spec.name}:")
+            self.write_lines.append(f"{pad}    _item.write(file)")
+            fixed = getattr(spec.cls, "__layout_size__", None)
+            if fixed is not None:
+                size_terms.append(f"{fixed} * len(self.{spec.name})")
+            else:
+                size_terms.append(f"sum(_item.size() for _item in self.{spec.name})")
+        elif isinstance(spec, When):
+            key = self.bind(spec.predicate)
+            self.read_lines.append(f"{pad}if {key}(self, *args):")
+            self.write_lines.append(f"{pad}if {key}(self, *args):")
+            inner = _sum_terms(self.emit(spec.fields, indent + 1))
+            size_terms.append(f"({inner} if {key}(self, *args) else 0)")
+        else:
+            raise TypeError(f"Unknown layout field {spec!r}")
+
+
+def _encode_padded(text: str, length: int) -> bytes:
+    return text.encode("utf-8")[:length].ljust(length, b"\x00")
+
+
+def _sum_terms(terms: List[Union[int, str]]) -> str:
+    constant = sum(term for term in terms if isinstance(term, int))
+    expressions = [term for term in terms if not isinstance(term, int)]
+    if constant or not expressions:
+        expressions.append(str(constant))
+    return " + ".join(expressions)
+
+
+def binary_layout(*fields):
+    """Class decorator that compiles a declarative field layout into read/write/size.
+
+    Methods the class defines itself are kept. read/write/size accept extra positional
+    arguments that are handed to When predicates (e.g. a parent version). After reading,
+    an `_after_read(*args)` method is called if the class has one. Layouts without
+    variable parts get a constant size() and expose it as `__layout_size__`.
+    """
+
+    def decorate(cls):
+        compiler = _LayoutCompiler()
+        terms = compiler.emit(fields, 1)
+        read_lines = ["def read(self, file, *args):", *compiler.read_lines]
+        if hasattr(cls, "_after_read"):
+            read_lines.append("    self._after_read(*args)")
+        read_lines.append("    return self")
+        write_lines = [
+            "def write(self, file, *args):",
+            "    try:",
+            # the write body sits one level deeper, inside the try block
+            *("    " + line for line in compiler.write_lines),
+            "    except ExportError:",
+            "        raise",
+            "    except Exception as exc:",
+            "        raise _write_failure(self, exc) from exc",
+        ]
+        size_lines = ["def size(self, *args):", f"    return {_sum_terms(terms)}"]
+        source = "\n".join(read_lines + write_lines + size_lines) + "\n"
+        exec(compile(source, f"<binary_layout {cls.__qualname__}>", "exec"), compiler.namespace)  # pylint: disable=exec-used
+        compiler.namespace["write"].__error_context__ = True
+        for method in ("read", "write", "size"):
+            if method not in cls.__dict__:
+                function = compiler.namespace[method]
+                function.__qualname__ = f"{cls.__qualname__}.{method}"
+                setattr(cls, method, function)
+        if all(isinstance(term, int) for term in terms):
+            cls.__layout_size__ = sum(terms)
+        cls.__layout__ = fields
+        return cls
+
+    return decorate
+
+
+def read_array(file: BinaryIO, dtype: Union[np.dtype, str], count: int) -> np.ndarray:
+    """Decode `count` records of `dtype` in one call, zero-copy on readers that offer read_view()."""
+    dtype = np.dtype(dtype)
+    size = dtype.itemsize * count
+    read_view = getattr(file, "read_view", None)
+    data = read_view(size) if read_view is not None else file.read(size)
+    # copy() detaches the array from the reader's buffer so the file can be closed
+    return np.frombuffer(data, dtype=dtype, count=count).copy()
+
+
+def write_array(file: BinaryIO, array: np.ndarray) -> None:
+    """Encode a whole array with a single write call."""
+    file.write(np.ascontiguousarray(array).tobytes())
+
+
+class ArrayBackedList:
+    """Expose an array attribute as a list of legacy objects that is only built on first access.
+
+    Once the list has been requested (or assigned), it becomes the source of truth and
+    `array()` re-encodes it, so callers that mutate the objects keep working.
+    """
+
+    def __init__(
+        self,
+        array_attr: str,
+        decode: Callable[[Any, np.ndarray], list],
+        encode: Callable[[Any, list], np.ndarray],
+    ):
+        self.array_attr = array_attr
+        self.decode = decode
+        self.encode = encode
+        self.cache_attr = ""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.cache_attr = f"_{name}_objects"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        items = obj.__dict__.get(self.cache_attr)
+        if items is None:
+            array = getattr(obj, self.array_attr)
+            items = [] if array is None else self.decode(obj, array)
+            obj.__dict__[self.cache_attr] = items
+        return items
+
+    def __set__(self, obj, items: list) -> None:
+        obj.__dict__[self.cache_attr] = items
+        setattr(obj, self.array_attr, None)
+
+    def reset(self, obj) -> None:
+        """Drop the object list after the backing array has been replaced."""
+        obj.__dict__.pop(self.cache_attr, None)
+
+    def count(self, obj) -> int:
+        items = obj.__dict__.get(self.cache_attr)
+        if items is not None:
+            return len(items)
+        array = getattr(obj, self.array_attr)
+        return 0 if array is None else len(array)
+
+    def array(self, obj) -> np.ndarray:
+        items = obj.__dict__.get(self.cache_attr)
+        if items is not None:
+            setattr(obj, self.array_attr, self.encode(obj, items))
+        elif getattr(obj, self.array_attr) is None:
+            setattr(obj, self.array_attr, self.encode(obj, []))
+        return getattr(obj, self.array_attr)
+
+
+def read_faces(file: BinaryIO, count: int) -> np.ndarray:
+    """Read `count` triangles as an (N, 3) uint16 index buffer."""
+    return read_array(file, "<u2", count * 3).reshape(count, 3)
+
+
+def faces_to_objects(_owner, indices: np.ndarray) -> List["Face"]:
+    return [Face(list(triangle)) for triangle in indices.tolist()]
+
+
+def faces_to_array(_owner, faces: List["Face"]) -> np.ndarray:
+    if not faces:
+        return np.zeros((0, 3), dtype="<u2")
+    return np.array([face.indices for face in faces], dtype="<u2").reshape(-1, 3)
+
+
+@binary_layout(Fixed("indices", "3H", wrap=list))
 @dataclass(eq=False, repr=False)
 class Face:
     indices: List[int] = field(default_factory=lambda: [0] * 3)
 
-    def read(self, file: BinaryIO) -> "Face":
-        self.indices = list(unpack("3H", file.read(6)))
-        return self
 
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("3H", *self.indices))
+@binary_layout(Fixed("x", "f"), Fixed("y", "f"), Fixed("z", "f"), Fixed("w", "f"))
+class Vector4:
+    """Four raw floats; see sr_impex.blender.adapters for the mathutils conversion."""
 
-    def size(self) -> int:
-        return 6
+    __slots__ = ("x", "y", "z", "w")
 
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
 
-@dataclass(repr=False)
-class Vector4:
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
-    w: float = 0.0
-    xyz: Vector = field(default_factory=lambda: Vector((0, 0, 0)))
-
-    def read(self, file: BinaryIO) -> "Vector4":
-        self.x, self.y, self.z, self.w = unpack("4f", file.read(16))
-        self.xyz = Vector((self.x, self.y, self.z))
-        return self
+    @property
+    def xyz(self) -> Tuple[float, float, float]:
+        return (self.x, self.y, self.z)
 
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("4f", self.x, self.y, self.z, self.w))
+    @xyz.setter
+    def xyz(self, value) -> None:
+        self.x, self.y, self.z = value[0], value[1], value[2]
 
-    def size(self) -> int:
-        return 16
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vector4):
+            return NotImplemented
+        return (self.x, self.y, self.z, self.w) == (other.x, other.y, other.z, other.w)
 
+    __hash__ = None
 
-@dataclass(repr=False)
+
+@binary_layout(Fixed("x", "f"), Fixed("y", "f"), Fixed("z", "f"))
 class Vector3:
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
-    xyz: Vector = field(default_factory=lambda: Vector((0, 0, 0)))
+    """Three raw floats; see sr_impex.blender.adapters for the mathutils conversion."""
 
-    def __post_init__(self):
-        self.xyz = Vector((self.x, self.y, self.z))
+    __slots__ = ("x", "y", "z")
 
-    def read(self, file: BinaryIO) -> "Vector3":
-        self.x, self.y, self.z = unpack("3f", file.read(12))
-        self.xyz = Vector((self.x, self.y, self.z))
-        return self
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
 
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("3f", self.x, self.y, self.z))
+    @property
+    def xyz(self) -> Tuple[float, float, float]:
+        return (self.x, self.y, self.z)
 
-    def size(self) -> int:
-        return 12
+    @xyz.setter
+    def xyz(self, value) -> None:
+        self.x, self.y, self.z = value[0], value[1], value[2]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vector3):
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    __hash__ = None
 
 
 @dataclass(eq=True, repr=False)
@@ -129,47 +409,49 @@ class Matrix4x4:
         return 64
 
 
-@dataclass(eq=True, repr=False)
+@binary_layout(Fixed("matrix", "9f"))
 class Matrix3x3:
-    matrix: tuple = ((0, 0, 0), (0, 0, 0), (0, 0, 0))
-    math_matrix: Matrix = field(default_factory=lambda: Matrix(((0, 0, 0), (0, 0, 0), (0, 0, 0))))
-
-    def read(self, file: BinaryIO) -> "Matrix3x3":
-        self.matrix = unpack("9f", file.read(36))
-        self.math_matrix = Matrix(
-            (
-                (self.matrix[0], self.matrix[1], self.matrix[2]),
-                (self.matrix[3], self.matrix[4], self.matrix[5]),
-                (self.matrix[6], self.matrix[7], self.matrix[8]),
-            )
-        )
+    """Row-major 3x3 matrix kept as 9 raw floats; see sr_impex.blender.adapters for the mathutils conversion."""
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, matrix=(0.0,) * 9):
+        self.matrix = tuple(matrix)
+
+    def from_flat(self, values) -> "Matrix3x3":
+        self.matrix = tuple(values)
         return self
 
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("9f", *self.matrix))
+    @property
+    def rows(self) -> Tuple[Tuple[float, float, float], ...]:
+        m = self.matrix
+        return ((m[0], m[1], m[2]), (m[3], m[4], m[5]), (m[6], m[7], m[8]))
 
-    def size(self) -> int:
-        return 36
+    @rows.setter
+    def rows(self, value) -> None:
+        self.matrix = tuple(value[row][column] for row in range(3) for column in range(3))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Matrix3x3):
+            return NotImplemented
+        return tuple(self.matrix) == tuple(other.matrix)
 
+    __hash__ = None
 
+
+@binary_layout(Nested("matrix", Matrix3x3), Nested("position", Vector3))
 @dataclass(eq=True, repr=False)
 class CMatCoordinateSystem:
     matrix: Matrix3x3 = field(default_factory=Matrix3x3)
     position: Vector3 = field(default_factory=Vector3)
 
-    def read(self, file: BinaryIO) -> "CMatCoordinateSystem":
-        self.matrix = Matrix3x3().read(file)
-        self.position = Vector3().read(file)
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.matrix.write(file)
-        self.position.write(file)
-
-    def size(self) -> int:
-        return self.matrix.size() + self.position.size()
-
 
+@binary_layout(
+    Fixed("identifier", "i"),
+    Fixed("unknown", "i"),
+    Fixed("length", "i"),
+    String("name", "length"),
+)
 @dataclass(eq=False, repr=False)
 class RootNode:
     identifier: int = 0
@@ -177,26 +459,13 @@ class RootNode:
     length: int = field(default=9, init=False)
     name: str = "root node"
 
-    def read(self, file: BinaryIO) -> "RootNode":
-        self.identifier, self.unknown, self.length = unpack("iii", file.read(12))
-        self.name = file.read(self.length).decode("utf-8").strip("\x00")
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        file.write(
-            pack(
-                f"iii{self.length}s",
-                self.identifier,
-                self.unknown,
-                self.length,
-                self.name.encode("utf-8"),
-            )
-        )
-
-    def size(self) -> int:
-        return calcsize(f"iii{self.length}s")
-
 
+@binary_layout(
+    Fixed("info_index", "i"),
+    Fixed("length", "i"),
+    String("name", "length"),
+    Fixed("zero", "i"),
+)
 @dataclass(eq=False, repr=False)
 class Node:
     info_index: int = 0
@@ -207,26 +476,14 @@ class Node:
     def __post_init__(self):
         self.length = len(self.name)
 
-    def read(self, file: BinaryIO) -> "Node":
-        self.info_index, self.length = unpack("ii", file.read(8))
-        self.name = (
-            unpack(f"{self.length}s", file.read(calcsize(f"{self.length}s")))[0]
-            .decode("utf-8")
-            .strip("\x00")
-        )
-        self.zero = unpack("i", file.read(4))[0]
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("i", self.info_index))
-        file.write(pack("i", self.length))
-        file.write(pack(f"{self.length}s", self.name.encode("utf-8")))
-        file.write(pack("i", self.zero))
-
-    def size(self) -> int:
-        return 8 + calcsize(f"{self.length}s") + 4
-
 
+@binary_layout(
+    Fixed("zeroes", "16b"),
+    Fixed("neg_one", "i"),
+    Fixed("one", "i"),
+    Fixed("node_information_count", "i"),
+    Fixed("zero", "i"),
+)
 @dataclass(eq=False, repr=False)
 class RootNodeInformation:
     zeroes: List[int] = field(default_factory=lambda: [0] * 16)
@@ -238,21 +495,17 @@ class RootNodeInformation:
     node_size: int = 0
     node_name: str = ""
 
-    def read(self, file: BinaryIO) -> "RootNodeInformation":
-        self.zeroes = unpack("16b", file.read(16))
-        self.neg_one, self.one, self.node_information_count, self.zero = unpack("iiii", file.read(16))
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("16biiii", *self.zeroes, self.neg_one, self.one, self.node_information_count, self.zero))
-
-    def size(self) -> int:
-        return 32
-
     def update_offset(self, _: int) -> None:  # pragma: no cover - compatibility hook
         pass
 
 
+@binary_layout(
+    Fixed("magic", "i"),
+    Fixed("identifier", "i"),
+    Fixed("offset", "i"),
+    Fixed("node_size", "i"),
+    Fixed("spacer", "16b"),
+)
 @dataclass(eq=False, repr=False)
 class NodeInformation:
     magic: int = field(init=False)
@@ -265,21 +518,9 @@ class NodeInformation:
     def __post_init__(self):
         self.magic = MagicValues.get(self.node_name) if self.node_name else 0
 
-    def read(self, file: BinaryIO) -> "NodeInformation":
-        self.magic, self.identifier, self.offset, self.node_size = unpack("iiii", file.read(16))
-        self.spacer = unpack("16b", file.read(16))
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("iiii", self.magic, self.identifier, self.offset, self.node_size))
-        file.write(pack("16b", *self.spacer))
-
     def update_offset(self, offset: int) -> None:
         self.offset = offset
 
-    def size(self) -> int:
-        return calcsize("iiii16b")
-
 
 @dataclass(eq=False, repr=False)
 class BaseContainer:
@@ -297,3 +538,118 @@ class BaseContainer:
     nodes: List[Union[RootNode, Node]] = field(default_factory=lambda: [RootNode()])
     node_informations: List[Union[NodeInformation, RootNodeInformation]] = field(default_factory=lambda: [RootNodeInformation()])
     model_type: str = None
+
+    # Lazy loading state (not dataclass fields): section attribute -> (class, offset)
+    _pending_sections = None
+    _reader = None
+    # node_name -> NodeInformation, built on first use by push_node_infos/save
+    _node_info_lookup = None
+
+    def __getattribute__(self, name: str):
+        pending = object.__getattribute__(self, "_pending_sections")
+        if pending and name in pending:
+            object.__getattribute__(self, "_load_section")(name)
+        return object.__getattribute__(self, name)
+
+    def _open_sections(self, reader, sections: dict, lazy: bool) -> None:
+        """Decode all node sections now, or keep the reader and decode each one on first access."""
+        self._reader = reader
+        self._pending_sections = dict(sections)
+        if not lazy:
+            for name in sections:
+                self._load_section(name)
+        if not self._pending_sections:
+            self.close()
+
+    def _load_section(self, name: str) -> None:
+        section_class, offset = self._pending_sections.pop(name)
+        self._reader.seek(offset)
+        setattr(self, name, section_class().read(self._reader))
+        if not self._pending_sections:
+            self.close()
+
+    def pending_sections(self) -> List[str]:
+        """Names of sections that a lazy read has not decoded yet."""
+        return list(self._pending_sections or ())
+
+    def close(self) -> None:
+        """Release the file; sections of a lazy read that were never accessed stay None."""
+        self._pending_sections = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _node_information(self, node_name: str) -> NodeInformation:
+        if self._node_info_lookup is None:
+            self._node_info_lookup = {}
+            for node_info in self.node_informations:
+                self._node_info_lookup.setdefault(node_info.node_name, node_info)
+        return self._node_info_lookup.get(node_name)
+
+    def push_node_infos(self, class_name: str, data_object: object):
+        """Attach the section object that save() writes for class_name."""
+        node_info = self._node_information(class_name)
+        if node_info is not None:
+            node_info.data_object = data_object
+
+    def update_offsets(self):
+        """Offsets and node sizes are assigned by save() while it serializes; kept for existing callers."""
+
+    def save(self, file_name: str):
+        """Serialize all sections in WriteOrder into one buffer and replace file_name with it atomically.
+
+        Each section's offset and size are taken from the buffer position while it is
+        written, so no size() pass is needed; the header is back-patched at the end.
+        """
+        label = type(self).__name__
+        writer = BufferWriter(file_name)
+        try:
+            # header, patched once the table offsets are known
+            writer.write(bytes(20))
+
+            # packets (in WriteOrder)
+            for node_name in WriteOrder[self.model_type]:
+                node_info = self._node_information(node_name)
+                with error_context(f"{node_name}.write"):
+                    node_info.offset = writer.tell()
+                    if node_name != "CGeoPrimitiveContainer":
+                        node_info.data_object.write(writer)
+                    node_info.node_size = writer.tell() - node_info.offset
+
+            self.node_information_offset = writer.tell()
+            self.node_hierarchy_offset = self.node_information_offset + 32 * self.node_count
+
+            # node infos
+            for node_info in self.node_informations:
+                with error_context(f"NodeInformation[{node_info.node_name}].write"):
+                    node_info.write(writer)
+
+            # hierarchy
+            for node in self.nodes:
+                with error_context(f"Hierarchy node '{node.name}'.write"):
+                    node.write(writer)
+
+            with error_context(f"{label} header"):
+                writer.patch(0, pack(
+                    "iiiiI",
+                    self.magic,
+                    self.number_of_models,
+                    self.node_information_offset,
+                    self.node_hierarchy_offset,
+                    self.node_count,
+                ))
+            writer.commit()
+        except ExportError:
+            # bubble normalized errors
+            raise
+        except Exception as e:
+            # normalize anything else
+            raise ExportError(f"{label}.save failed: {e}") from e
+        finally:
+            writer.close()
@@ -7,18 +7,16 @@ which define building layouts with modular grids and state-based meshes.
 
 from __future__ import annotations
 from dataclasses import dataclass
-from struct import pack, unpack
+from struct import unpack
 from typing import cast
 
-from sr_impex.core.file_io import FileReader, FileWriter
+from sr_impex.core.file_io import MappedFileReader
 from sr_impex.definitions.base_types import (
     BaseContainer,
     Node,
     NodeInformation,
     RootNode,
     RootNodeInformation,
-    error_context,
-    ExportError,
 )
 from sr_impex.definitions.animation_definitions import AnimationSet, AnimationTimings
 from sr_impex.definitions.collision_definitions import CollisionShape
@@ -31,7 +29,7 @@ from sr_impex.definitions.grid_definitions import (
     MeshGridModule,
     MeshSetGrid,
 )
-from sr_impex.definitions.enums import WriteOrder, InformationIndices
+from sr_impex.definitions.enums import InformationIndices
 
 # Re-export grid classes for backward compatibility
 __all__ = [
@@ -77,30 +75,9 @@ class BMG(BaseContainer):
                     node_info.node_size = 0
                 self.node_informations[info_index] = node_info
 
-    def push_node_infos(self, class_name: str, data_object: object):
-        # Get the right node from self.node_informations
-        for node_info in self.node_informations:
-            if node_info.node_name == class_name:
-                node_info.data_object = data_object
-                node_info.node_size = data_object.size()
-                break
-
-    def update_offsets(self):
-        for node_name in WriteOrder[self.model_type]:
-            # get the right node_infortmation froms self.node_informations
-            node_information = next(
-                (
-                    node_info
-                    for node_info in self.node_informations
-                    if node_info.node_name == node_name
-                ),
-                None,
-            )
-            node_information.offset = self.data_offset
-            self.data_offset += node_information.node_size
-
-    def read(self, file_name: str) -> "BMG":
-        reader = FileReader(file_name)
+    def read(self, file_name: str, lazy: bool = False) -> "BMG":
+        """Read a BMG file; lazy=True defers decoding each section to its first access (see DRS.read)."""
+        reader = MappedFileReader(file_name)
         (
             self.magic,
             self.number_of_models,
@@ -159,6 +136,7 @@ class BMG(BaseContainer):
             else:
                 raise TypeError(f"Unknown Node: {node.name}")
 
+        sections = {}
         for node in self.nodes[1:]:  # skip root node, it has no info_index
             if not isinstance(node, Node):
                 continue
@@ -168,7 +146,6 @@ class BMG(BaseContainer):
             if node_info is None:
                 raise TypeError(f"Node {node.name} not found")
 
-            reader.seek(node_info.offset)
             node_name = node_map.get(node.name, None).replace("_node", "")
             if node_map is None:
                 raise TypeError(f"Node {node.name} not found in node_map")
@@ -177,57 +154,11 @@ class BMG(BaseContainer):
             if val == "collisionShape":
                 val = "CollisionShape"
 
-            setattr(self, node_name, globals()[val]().read(reader))
+            sections[node_name] = (globals()[val], node_info.offset)
 
-        reader.close()
+        self._open_sections(reader, sections, lazy)
         return self
 
-    def save(self, file_name: str):
-        writer = FileWriter(file_name)
-        try:
-            # offsets
-            for ni in self.node_informations:
-                self.node_information_offset += ni.node_size
-            self.node_hierarchy_offset = self.node_information_offset + 32 + (self.node_count - 1) * 32
-
-            # header
-            with error_context("BMG header"):
-                writer.write(pack(
-                    "iiiiI",
-                    self.magic,
-                    self.number_of_models,
-                    self.node_information_offset,
-                    self.node_hierarchy_offset,
-                    self.node_count,
-                ))
-
-            # packets (in WriteOrder)
-            for node_name in WriteOrder[self.model_type]:
-                if node_name == "CGeoPrimitiveContainer":
-                    continue
-                node_info = next((ni for ni in self.node_informations if ni.node_name == node_name), None)
-                with error_context(f"{node_name}.write"):
-                    node_info.data_object.write(writer)
-
-            # node infos
-            for node_info in self.node_informations:
-                with error_context(f"NodeInformation[{node_info.node_name}].write"):
-                    node_info.write(writer)
-
-            # hierarchy
-            for node in self.nodes:
-                with error_context(f"Hierarchy node '{node.name}'.write"):
-                    node.write(writer)
-
-        except ExportError:
-            # bubble normalized errors
-            raise
-        except Exception as e:
-            # normalize anything else
-            raise ExportError(f"DRS.save failed: {e}") from e
-        finally:
-            writer.close()
-
 
 @dataclass(eq=False, repr=False)
 class BMS(BaseContainer):
@@ -240,7 +171,7 @@ class BMS(BaseContainer):
     animation_set: AnimationSet = None  # Fake Object
 
     def read(self, file_name: str) -> "BMS":
-        reader = FileReader(file_name)
+        reader = MappedFileReader(file_name)
         (
             self.magic,
             self.number_of_models,
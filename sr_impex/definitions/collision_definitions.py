@@ -19,117 +19,54 @@ from typing import BinaryIO, List
 from sr_impex.definitions.base_types import (
     Vector3,
     CMatCoordinateSystem,
+    Fixed,
+    Nested,
+    binary_layout,
 )
 
 
+@binary_layout(Nested("lower_left_corner", Vector3), Nested("upper_right_corner", Vector3))
 @dataclass(eq=True, repr=False)
 class CGeoAABox:
     lower_left_corner: Vector3 = field(default_factory=Vector3)
     upper_right_corner: Vector3 = field(default_factory=Vector3)
 
-    def read(self, file: BinaryIO) -> "CGeoAABox":
-        self.lower_left_corner = Vector3().read(file)
-        self.upper_right_corner = Vector3().read(file)
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.lower_left_corner.write(file)
-        self.upper_right_corner.write(file)
-
-    def size(self) -> int:
-        return self.lower_left_corner.size() + self.upper_right_corner.size()
-
 
+@binary_layout(Nested("coord_system", CMatCoordinateSystem), Nested("geo_aabox", CGeoAABox))
 @dataclass(eq=True, repr=False)
 class BoxShape:
     coord_system: CMatCoordinateSystem = field(default_factory=CMatCoordinateSystem)
     geo_aabox: CGeoAABox = field(default_factory=CGeoAABox)
 
-    def read(self, file: BinaryIO) -> "BoxShape":
-        self.coord_system = CMatCoordinateSystem().read(file)
-        self.geo_aabox = CGeoAABox().read(file)
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.coord_system.write(file)
-        self.geo_aabox.write(file)
-
-    def size(self) -> int:
-        return self.coord_system.size() + self.geo_aabox.size()
-
 
+@binary_layout(Nested("center", Vector3), Fixed("height", "f"), Fixed("radius", "f"))
 @dataclass(eq=True, repr=False)
 class CGeoCylinder:
     center: Vector3 = field(default_factory=Vector3)
     height: float = 0.0
     radius: float = 0.0
 
-    def read(self, file: BinaryIO) -> "CGeoCylinder":
-        self.center = Vector3().read(file)
-        self.height, self.radius = unpack("ff", file.read(8))
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.center.write(file)
-        file.write(pack("ff", self.height, self.radius))
-
-    def size(self) -> int:
-        return self.center.size() + 8
-
 
+@binary_layout(Nested("coord_system", CMatCoordinateSystem), Nested("geo_cylinder", CGeoCylinder))
 @dataclass(eq=True, repr=False)
 class CylinderShape:
     coord_system: CMatCoordinateSystem = field(default_factory=CMatCoordinateSystem)
     geo_cylinder: CGeoCylinder = field(default_factory=CGeoCylinder)
 
-    def read(self, file: BinaryIO) -> "CylinderShape":
-        self.coord_system = CMatCoordinateSystem().read(file)
-        self.geo_cylinder = CGeoCylinder().read(file)
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.coord_system.write(file)
-        self.geo_cylinder.write(file)
-
-    def size(self) -> int:
-        return self.coord_system.size() + self.geo_cylinder.size()
-
 
+@binary_layout(Fixed("radius", "f"), Nested("center", Vector3))
 @dataclass(eq=True, repr=False)
 class CGeoSphere:
     radius: float = 0.0
     center: Vector3 = field(default_factory=Vector3)
 
-    def read(self, file: BinaryIO) -> "CGeoSphere":
-        self.radius = unpack("f", file.read(4))[0]
-        self.center = Vector3().read(file)
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("f", self.radius))
-        self.center.write(file)
-
-    def size(self) -> int:
-        return 4 + self.center.size()
-
 
+@binary_layout(Nested("coord_system", CMatCoordinateSystem), Nested("geo_sphere", CGeoSphere))
 @dataclass(eq=True, repr=False)
 class SphereShape:
     coord_system: CMatCoordinateSystem = field(default_factory=CMatCoordinateSystem)
     geo_sphere: CGeoSphere = field(default_factory=CGeoSphere)
 
-    def read(self, file: BinaryIO) -> "SphereShape":
-        self.coord_system = CMatCoordinateSystem().read(file)
-        self.geo_sphere = CGeoSphere().read(file)
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.coord_system.write(file)
-        self.geo_sphere.write(file)
-
-    def size(self) -> int:
-        return self.coord_system.size() + self.geo_sphere.size()
-
 
 @dataclass(eq=True, repr=False)
 class CollisionShape:
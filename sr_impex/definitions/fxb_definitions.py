@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from struct import pack, unpack
-from typing import BinaryIO, List, Optional, Tuple, Union
+from struct import Struct, pack, unpack
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 
-from sr_impex.definitions.base_types import Vector3
+import numpy as np
+
+from sr_impex.definitions.base_types import ArrayBackedList, Vector3
+
+_HEADER = Struct("<I")
+_TRACK = Struct("<IIfIIII")
+# Keyframe record followed by the header of the next record
+_FLOAT_KEYFRAME = Struct("<ffI")
+_VECTOR3_KEYFRAME = Struct("<ffffI")
 
 
 @dataclass(eq=False, repr=False)
@@ -78,8 +86,9 @@ class Static:
     data_type_header: int = 0
     data: Union[FloatStaticTrack, Vector3StaticTrack, StringStaticTrack, Vector3OtherStaticTrack, None] = None
 
-    def read(self, file: BinaryIO) -> "Static":
-        (self.header, self.version, self.track_type, self.data_type_header) = unpack("IIII", file.read(16))
+    def read(self, file: BinaryIO, header: Optional[int] = None) -> "Static":
+        self.header = _read_header(file) if header is None else header
+        (self.version, self.track_type, self.data_type_header) = unpack("III", file.read(12))
         assert self.header == 4166493980, f"Invalid Static header: {self.header}"
         assert self.version == 1, f"Unsupported Static version: {self.version}"
         if self.data_type_header == 0xF857A7F7:
@@ -154,49 +163,61 @@ class Vector3Keyframe(TrackKeyframe):
         return 20
 
 
-def _read_entries_and_control_points(file: BinaryIO) -> Tuple[List[TrackKeyframe], List[TrackKeyframe]]:
-    entries: List[TrackKeyframe] = []
-    control_points: List[TrackKeyframe] = []
-    current_header = unpack("I", file.peek(4))[0]
-
-    if current_header == FloatKeyframe().header:
-        while current_header == FloatKeyframe().header:
-            keyframe = FloatKeyframe().read(file)
-            entries.append(keyframe)
-            current_header = unpack("I", file.peek(4))[0]
-
-        control_data_header = unpack("I", file.read(4))[0]
-
-        if control_data_header == FloatKeyframe().start_control_point_header:
-            current_header = unpack("I", file.peek(4))[0]
-            while current_header == FloatKeyframe().control_point_header:
-                keyframe = FloatKeyframe().read(file)
-                control_points.append(keyframe)
-                current_header = unpack("I", file.peek(4))[0]
-
-            end_control_point_header = unpack("I", file.read(4))[0]
-            assert end_control_point_header == 0xF876AC3E, f"Invalid end control point header: {end_control_point_header}"
-    elif current_header == Vector3Keyframe().header:
-        while current_header == Vector3Keyframe().header:
-            keyframe = Vector3Keyframe().read(file)
-            entries.append(keyframe)
-            current_header = unpack("I", file.peek(4))[0]
-
-        control_data_header = unpack("I", file.read(4))[0]
-
-        if control_data_header == Vector3Keyframe().start_control_point_header:
-            current_header = unpack("I", file.peek(4))[0]
-            while current_header == Vector3Keyframe().control_point_header:
-                keyframe = Vector3Keyframe().read(file)
-                control_points.append(keyframe)
-                current_header = unpack("I", file.peek(4))[0]
-
-            end_control_point_header = unpack("I", file.read(4))[0]
-            assert end_control_point_header == 0xF876AC3E, f"Invalid end control point header: {end_control_point_header}"
+def _read_header(file: BinaryIO) -> int:
+    return _HEADER.unpack(file.read(4))[0]
+
+
+def _read_keyframe_run(file: BinaryIO, header: int, record: Struct, run_header: int) -> Tuple[list, int]:
+    """Read consecutive keyframes tagged with run_header; each record is read together with the next header."""
+    rows = []
+    while header == run_header:
+        *row, header = record.unpack(file.read(record.size))
+        rows.append(row)
+    return rows, header
+
+
+def _read_keyframe_arrays(file: BinaryIO) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the entries and optional control points of a Track as (N, 2) or (N, 4) float32 arrays."""
+    header = _read_header(file)
+    if header == FloatKeyframe.header:
+        keyframe_class, record, width = FloatKeyframe, _FLOAT_KEYFRAME, 2
+    elif header == Vector3Keyframe.header:
+        keyframe_class, record, width = Vector3Keyframe, _VECTOR3_KEYFRAME, 4
     else:
-        raise ValueError(f"Unknown keyframe header: {current_header}")
+        raise ValueError(f"Unknown keyframe header: {header}")
+
+    entries, control_data_header = _read_keyframe_run(file, header, record, keyframe_class.header)
+    control_points: list = []
+    if control_data_header == keyframe_class.start_control_point_header:
+        control_points, end_control_point_header = _read_keyframe_run(
+            file, _read_header(file), record, keyframe_class.control_point_header
+        )
+        assert end_control_point_header == 0xF876AC3E, f"Invalid end control point header: {end_control_point_header}"
+
+    return (
+        np.array(entries, dtype="<f4").reshape(-1, width),
+        np.array(control_points, dtype="<f4").reshape(-1, width),
+    )
+
 
-    return entries, control_points
+def _keyframes_to_objects(_owner, keys: np.ndarray) -> List[TrackKeyframe]:
+    if keys.shape[1] == 4:
+        return [Vector3Keyframe(frame=frame, data=Vector3(x, y, z)) for frame, x, y, z in keys.tolist()]
+    return [FloatKeyframe(frame=frame, data=value) for frame, value in keys.tolist()]
+
+
+def _control_points_to_objects(owner, keys: np.ndarray) -> List[TrackKeyframe]:
+    control_points = _keyframes_to_objects(owner, keys)
+    for keyframe in control_points:
+        keyframe.header = keyframe.control_point_header
+    return control_points
+
+
+def _keyframes_to_array(_owner, keyframes: List[TrackKeyframe]) -> np.ndarray:
+    if keyframes and isinstance(keyframes[0], Vector3Keyframe):
+        rows = [(key.frame, key.data.x, key.data.y, key.data.z) for key in keyframes]
+        return np.array(rows, dtype="<f4").reshape(-1, 4)
+    return np.array([(key.frame, key.data) for key in keyframes], dtype="<f4").reshape(-1, 2)
 
 
 @dataclass(eq=False, repr=False)
@@ -210,17 +231,29 @@ class Track:
     track_mode: int = 0
     interpolation_type: int = 0
     evaluation_type: int = 0
-    entries: List[TrackKeyframe] = field(default_factory=list)
-    control_points: List[TrackKeyframe] = field(default_factory=list)
+    entry_array: Optional[np.ndarray] = None  # (N, 2) frame/value or (N, 4) frame/x/y/z
+    control_point_array: Optional[np.ndarray] = None
 
-    def read(self, file: BinaryIO) -> "Track":
-        (self.header, self.version, self.track_type) = unpack("III", file.read(12))
+    entries = ArrayBackedList("entry_array", _keyframes_to_objects, _keyframes_to_array)
+    control_points = ArrayBackedList("control_point_array", _control_points_to_objects, _keyframes_to_array)
+
+    def read(self, file: BinaryIO, header: Optional[int] = None) -> "Track":
+        self.header = _read_header(file) if header is None else header
         assert self.header == 0xF876AC30, f"Invalid Track header: {self.header}"
+        (
+            self.version,
+            self.track_type,
+            self.length,
+            self.track_dim,
+            self.track_mode,
+            self.interpolation_type,
+            self.evaluation_type,
+        ) = _TRACK.unpack(file.read(_TRACK.size))
         assert self.version == 4, f"Unsupported Track version: {self.version}"
-        self.length = unpack("f", file.read(4))[0]
-        (self.track_dim, self.track_mode, self.interpolation_type, self.evaluation_type) = unpack("IIII", file.read(16))
-        self.entries, self.control_points = _read_entries_and_control_points(file)
-        if len(self.entries) == 0:
+        self.entry_array, self.control_point_array = _read_keyframe_arrays(file)
+        Track.entries.reset(self)
+        Track.control_points.reset(self)
+        if len(self.entry_array) == 0:
             raise ValueError("Track must have at least one entry")
         return self
 
@@ -242,8 +275,8 @@ class NodeLink:
     span: int = 0
     locator: int = 0
 
-    def read(self, file: BinaryIO) -> "NodeLink":
-        self.header = unpack("I", file.read(4))[0]
+    def read(self, file: BinaryIO, header: Optional[int] = None) -> "NodeLink":
+        self.header = _read_header(file) if header is None else header
         assert self.header == 0xF82D712E, f"Invalid NodeLink header: {self.header}"
         version = unpack("I", file.read(4))[0]
         assert version in [1, 2, 3], f"Unsupported NodeLink version: {version}"
@@ -294,9 +327,10 @@ class Element:
     parent: Optional["Element"] = field(default=None)
     children: List["Element"] = field(default_factory=list)
 
-    def read(self, file: BinaryIO, parent: "Element", ignores: List[int], depth: int) -> "Element":
-        self.node_link = NodeLink().read(file)
-        start_element_header = unpack("I", file.read(4))[0]
+    def read(self, file: BinaryIO, header: Optional[int] = None) -> "Element":
+        """Read the element up to its start-children marker; the children are read by iter_elements."""
+        self.node_link = NodeLink().read(file, header)
+        start_element_header = _read_header(file)
         assert start_element_header == self.start_element_header, f"Invalid start element header: {start_element_header}"
         (self.version,) = unpack("I", file.read(4))
         assert self.version == 1, f"Unsupported Element version: {self.version}"
@@ -306,64 +340,31 @@ class Element:
             self.name = raw.decode("utf-8").strip("\x00")
         except UnicodeDecodeError:
             self.name = raw.decode("latin-1").strip("\x00")
-        self.element_type_header = unpack("I", file.peek(4))[0]
-        header = self.element_type_header
-
-        match header:
-            case header if header in _element_type_map:
-                element_class = _element_type_map[header]
-                element_instance = element_class().read(file)
-                setattr(self, element_class.__name__.lower(), element_instance)
-            case _:
-                raise ValueError(f"Unknown element type header: {self.element_type_header}")
-
-        end_element_header = unpack("I", file.read(4))[0]
+        self.element_type_header = _read_header(file)
+        element_class = _element_type_map.get(self.element_type_header)
+        if element_class is None:
+            raise ValueError(f"Unknown element type header: {self.element_type_header}")
+        # Step back over the type header, the typed payload reads and checks it itself
+        file.seek(file.tell() - 4)
+        setattr(self, element_class.__name__.lower(), element_class().read(file))
+
+        end_element_header = _read_header(file)
         assert end_element_header == self.end_element_header, f"Invalid end element header: {end_element_header}"
 
         track_counter = 0
-        current_header = unpack("I", file.peek(4))[0]
-        while current_header == Track().start_track_header:
-            _ = unpack("I", file.read(4))[0]
+        header = _read_header(file)
+        while header == Track.start_track_header:
             track_counter += 1
-            current_header = unpack("I", file.peek(4))[0]
+            header = _read_header(file)
 
         if track_counter != 2 and self.element_type_header not in [0xF8A23E54, 0xF8534D4D]:
             raise ValueError(
                 f"Element must have exactly 2 tracks, found {track_counter}. Element name: {self.name}, Type: {hex(self.element_type_header)}"
             )
 
-        self.static_tracks = _read_static_tracks(file)
-        self.tracks = _read_tracks(file)
-
-        self.start_element_children_header = unpack("I", file.read(4))[0]
+        self.static_tracks, self.tracks, self.start_element_children_header = _read_track_blocks(file, header)
         assert self.start_element_children_header == 0xF876E2D0, f"Invalid start_element_children_header: {self.start_element_children_header}"
-
-        if self.element_type_header == 0xF8EFFE37:
-            ignores[depth] += 1
-
-        parent.children.append(self)
-        self.parent = parent
-        next_parent: Optional[Element] = self
-        depth += 1
-
-        current_header = unpack("I", file.peek(4))[0]
-        while current_header == Element.end_element_children_header:
-            self.end_element_children_header = unpack("I", file.read(4))[0]
-            if ignores[depth] > 0:
-                ignores[depth] -= 1
-            else:
-                if next_parent is not None:
-                    next_parent = next_parent.parent
-                else:
-                    if depth != 0:
-                        raise ValueError("Element parent is None but depth is not zero")
-                depth -= 1
-            current_header = unpack("I", file.peek(4))[0]
-
-        if depth == -1:
-            return self
-
-        return Element().read(file, next_parent, ignores, depth)
+        return self
 
 
 @dataclass(eq=False, repr=False)
@@ -900,24 +901,17 @@ _element_type_map = {
 }
 
 
-def _read_static_tracks(file: BinaryIO) -> List[Static]:
+def _read_track_blocks(file: BinaryIO, header: int) -> Tuple[List[Static], List[Track], int]:
+    """Read the static tracks and tracks starting at `header` and return the header that follows them."""
     static_tracks: List[Static] = []
-    current_header = unpack("I", file.peek(4))[0]
-    while current_header == Static().header:
-        static_track = Static().read(file)
-        static_tracks.append(static_track)
-        current_header = unpack("I", file.peek(4))[0]
-    return static_tracks
-
-
-def _read_tracks(file: BinaryIO) -> List[Track]:
+    while header == Static.header:
+        static_tracks.append(Static().read(file, header))
+        header = _read_header(file)
     tracks: List[Track] = []
-    current_header = unpack("I", file.peek(4))[0]
-    while current_header == Track().header:
-        track = Track().read(file)
-        tracks.append(track)
-        current_header = unpack("I", file.peek(4))[0]
-    return tracks
+    while header == Track.header:
+        tracks.append(Track().read(file, header))
+        header = _read_header(file)
+    return static_tracks, tracks, header
 
 
 @dataclass(eq=False, repr=False, init=True)
@@ -934,13 +928,45 @@ class SpecialEffect(Element):
 
 
 
+def iter_elements(file: BinaryIO, root: Element) -> Iterator[Element]:
+    """Read the element stream below `root` in one forward pass, yielding each element once its tracks are read.
+
+    Nesting is tracked with an explicit stack of [parent, pending] entries instead of recursion, so
+    deep effects cost no Python stack. Every list of children is closed by an end-children marker and
+    an Effect owes the list it sits in one extra marker, counted in `pending`. The stream starts one
+    level above `root`, whose list has to be closed as well. An empty stream is a single marker.
+    """
+    header = _read_header(file)
+    if header == Element.end_element_children_header:
+        return
+    stack: List[list] = [[None, 0], [root, 0]]
+    while True:
+        if header == Element.end_element_children_header:
+            if stack[-1][1] > 0:
+                stack[-1][1] -= 1
+            else:
+                stack.pop()
+                if not stack:
+                    return
+        else:
+            parent = stack[-1][0]
+            if parent is None:
+                raise ValueError("Element found after the effect root was closed")
+            element = Element().read(file, header)
+            if element.element_type_header == 0xF8EFFE37:
+                stack[-1][1] += 1
+            parent.children.append(element)
+            element.parent = parent
+            stack.append([element, 0])
+            yield element
+        header = _read_header(file)
+
+
 def _read_element(file: BinaryIO, parent: Optional[Element] = None) -> Optional[Element]:
-    current_header = unpack("I", file.peek(4))[0]
-    if current_header != Element.end_element_children_header:
-        depth = 1
-        ignores = [0] * 16
-        return Element().read(file, parent, ignores, depth)
-    return None
+    element = None
+    for element in iter_elements(file, parent):
+        pass
+    return element
 
 
 @dataclass(eq=False, repr=False)
@@ -966,7 +992,8 @@ class FxMaster:
     end_element_children_header: int = 0xF8E2DE2D
     special_effect: SpecialEffect = field(default_factory=SpecialEffect)
 
-    def read(self, file: BinaryIO) -> "FxMaster":
+    def read_header(self, file: BinaryIO) -> "FxMaster":
+        """Read everything before the element stream; iter_elements(file, self.special_effect) continues from there."""
         (self.version, self.magic, self.revision) = unpack("III", file.read(12))
         assert self.version == 1, f"Unsupported FxMaster version: {self.version}"
         assert self.magic == 4172197351, f"Invalid FxMaster magic: {self.magic}"
@@ -984,11 +1011,13 @@ class FxMaster:
         (self.header_one, self.header_two) = unpack("II", file.read(8))
         assert self.header_one == 4166473575, f"Invalid header_one: {self.header_one}"
         assert self.header_two == 4166473575, f"Invalid header_two: {self.header_two}"
-        self.static_tracks = _read_static_tracks(file)
-        self.tracks = _read_tracks(file)
-        self.start_element_children_header = unpack("I", file.read(4))[0]
+        self.static_tracks, self.tracks, self.start_element_children_header = _read_track_blocks(file, _read_header(file))
         assert self.start_element_children_header == 0xF876E2D0, f"Invalid start_element_children_header: {self.start_element_children_header}"
         self.special_effect = SpecialEffect()
+        return self
+
+    def read(self, file: BinaryIO) -> "FxMaster":
+        self.read_header(file)
         _read_element(file, self.special_effect)
         return self
 
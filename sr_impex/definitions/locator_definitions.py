@@ -8,13 +8,22 @@ This module contains classes related to locator data structures:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from struct import calcsize, pack, unpack
+from struct import pack, unpack
 from typing import BinaryIO, List
 
-from sr_impex.definitions.base_types import CMatCoordinateSystem
+from sr_impex.definitions.base_types import CMatCoordinateSystem, Fixed, Nested, String, When, binary_layout
 from sr_impex.definitions.enums import LocatorClass
 
 
+@binary_layout(
+    Nested("cmat_coordinate_system", CMatCoordinateSystem),
+    Fixed("class_id", "i"),
+    Fixed("bone_id", "i"),
+    Fixed("file_name_length", "i"),
+    String("file_name", "file_name_length"),
+    # Only version 5 lists store uk_int, but it is always written on export
+    When(lambda _self, version=5: version == 5, Fixed("uk_int", "i")),
+)
 @dataclass(eq=False, repr=False)
 class SLocator:
     cmat_coordinate_system: CMatCoordinateSystem = field(
@@ -27,46 +36,9 @@ class SLocator:
     uk_int: int = -1
     class_type: str = ""
 
-    def read(self, file: BinaryIO, version: int) -> "SLocator":
-        self.cmat_coordinate_system = CMatCoordinateSystem().read(file)
-        self.class_id, self.bone_id, self.file_name_length = unpack(
-            "iii", file.read(12)
-        )
-        self.file_name = (
-            unpack(
-                f"{self.file_name_length}s",
-                file.read(calcsize(f"{self.file_name_length}s")),
-            )[0]
-            .decode("utf-8")
-            .strip("\x00")
-        )
+    def _after_read(self, _version: int = 5) -> None:
         # Get LocatorClass from ClassID
         self.class_type = LocatorClass.get(self.class_id, "Unknown")
-        if version == 5:
-            self.uk_int = unpack("i", file.read(4))[0]
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        self.cmat_coordinate_system.write(file)
-        file.write(
-            pack(
-                f"iii{self.file_name_length}s",
-                self.class_id,
-                self.bone_id,
-                self.file_name_length,
-                self.file_name.encode("utf-8"),
-            )
-        )
-        if hasattr(self, "uk_int"):
-            file.write(pack("i", self.uk_int))
-
-    def size(self) -> int:
-        size = self.cmat_coordinate_system.size() + calcsize(
-            f"iii{self.file_name_length}s"
-        )
-        if hasattr(self, "uk_int"):
-            size += 4
-        return size
 
 
 @dataclass(eq=False, repr=False)
@@ -4,7 +4,7 @@ Mesh-related class definitions for DRS files.
 This module contains classes related to mesh data structures:
 - Vertex: Vertex data with position, normal, texture coordinates, etc.
 - VertexData: Vertex weight and bone index data
-- MeshData: Mesh data with revision and vertices
+- MeshData: Mesh data with revision and a structured vertex array
 - CGeoMesh: Geometric mesh with faces and vertices
 - CDspMeshFile: Complete mesh file with bounding boxes
 - BattleforgeMesh: Complete mesh with materials and textures
@@ -13,13 +13,20 @@ This module contains classes related to mesh data structures:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from struct import calcsize, pack, unpack
+from struct import Struct, calcsize, pack, unpack
 from typing import BinaryIO, List, Optional
 
+import numpy as np
+
 from sr_impex.definitions.base_types import (
+    ArrayBackedList,
     Vector3,
     Vector4,
-    Face,
+    faces_to_array,
+    faces_to_objects,
+    read_array,
+    read_faces,
+    write_array,
 )
 
 
@@ -113,63 +120,125 @@ class VertexData:
         return 32
 
 
+def _vector4_to_objects(_owner, vertices: np.ndarray) -> List[Vector4]:
+    return [Vector4(x, y, z, w) for x, y, z, w in vertices.tolist()]
+
+
+def _vector4_to_array(_owner, vertices: List[Vector4]) -> np.ndarray:
+    if not vertices:
+        return np.zeros((0, 4), dtype="<f4")
+    return np.array([(v.x, v.y, v.z, v.w) for v in vertices], dtype="<f4")
+
+
 @dataclass(eq=False, repr=False)
 class CGeoMesh:
+    """Collision mesh stored as an (N, 3) uint16 index buffer and an (N, 4) float32 vertex array."""
+
     magic: int = 1
     index_count: int = 0
-    faces: List[Face] = field(default_factory=list)
+    face_indices: Optional[np.ndarray] = None
     vertex_count: int = 0
-    vertices: List[Vector4] = field(default_factory=list)
+    position_array: Optional[np.ndarray] = None
+    faces = ArrayBackedList("face_indices", faces_to_objects, faces_to_array)
+    vertices = ArrayBackedList("position_array", _vector4_to_objects, _vector4_to_array)
 
     def read(self, file: BinaryIO) -> "CGeoMesh":
         self.magic, self.index_count = unpack("ii", file.read(8))
-        self.faces = [Face().read(file) for _ in range(self.index_count // 3)]
+        self.face_indices = read_faces(file, self.index_count // 3)
         self.vertex_count = unpack("i", file.read(4))[0]
-        for _ in range(self.vertex_count):
-            x, y, z, w = unpack("4f", file.read(16))
-            self.vertices.append(Vector4(x, y, z, w))
+        self.position_array = read_array(file, "<f4", self.vertex_count * 4).reshape(-1, 4)
+        CGeoMesh.faces.reset(self)
+        CGeoMesh.vertices.reset(self)
         return self
 
     def write(self, file: BinaryIO) -> None:
         file.write(pack("ii", self.magic, self.index_count))
-        for face in self.faces:
-            face.write(file)
+        write_array(file, CGeoMesh.faces.array(self))
         file.write(pack("i", self.vertex_count))
-        for vertex in self.vertices:
-            vertex.write(file)
+        write_array(file, CGeoMesh.vertices.array(self))
 
     def size(self) -> int:
-        return 12 + 6 * len(self.faces) + 16 * len(self.vertices)
+        return 12 + 6 * CGeoMesh.faces.count(self) + 16 * CGeoMesh.vertices.count(self)
+
+
+# One structured dtype per vertex stream revision, matching the on-disk layout.
+_TANGENT_DTYPE = np.dtype([("tangent", "<f4", 3), ("bitangent", "<f4", 3)])
+VERTEX_DTYPES = {
+    133121: np.dtype([("position", "<f4", 3), ("normal", "<f4", 3), ("texture", "<f4", 2)]),
+    12288: _TANGENT_DTYPE,
+    2049: _TANGENT_DTYPE,
+    12: np.dtype([("raw_weights", "u1", 4), ("bone_indices", "u1", 4)]),
+    163841: np.dtype([("position", "<f4", 3), ("texture", "<f4", 2), ("unknown", "u1", 4)]),
+}
+_VERTEX_FIELDS = ("position", "normal", "texture", "tangent", "bitangent", "raw_weights", "bone_indices")
+
+
+def vertex_dtype(revision: int, vertex_size: int) -> np.dtype:
+    """Return the structured dtype of a vertex stream; unknown revisions are kept as raw bytes."""
+    dtype = VERTEX_DTYPES.get(revision)
+    if dtype is None:
+        dtype = np.dtype([("raw", f"V{vertex_size}")])
+    return dtype
+
+
+def _vertices_from_data(mesh_data: "MeshData", data: np.ndarray) -> List[Vertex]:
+    names = [name for name in data.dtype.names if name in _VERTEX_FIELDS]
+    columns = [data[name].tolist() for name in names]
+    vertices = [Vertex(**dict(zip(names, values))) for values in zip(*columns)]
+    if mesh_data.revision == 163841:
+        for vertex in vertices:
+            vertex.normal = [0.0, 0.0, 0.0]
+    return vertices
+
+
+def _data_from_vertices(mesh_data: "MeshData", vertices: List[Vertex]) -> np.ndarray:
+    dtype = vertex_dtype(mesh_data.revision, mesh_data.vertex_size)
+    data = np.zeros(len(vertices), dtype=dtype)
+    for name in dtype.names:
+        if name in _VERTEX_FIELDS and vertices:
+            data[name] = [tuple(getattr(vertex, name)) for vertex in vertices]
+    return data
 
 
 @dataclass(eq=False, repr=False)
 class MeshData:
+    """A single vertex stream of a BattleforgeMesh.
+
+    The stream is decoded and encoded as one structured array (`data`). `vertices`
+    builds legacy Vertex objects lazily; once requested, that list is the source of
+    truth and is re-encoded on write.
+    """
+
     revision: int = 0
     vertex_size: int = 0
-    vertices: List[Vertex] = field(default_factory=list)
+    data: Optional[np.ndarray] = None
+    vertices = ArrayBackedList("data", _vertices_from_data, _data_from_vertices)
+
+    @property
+    def vertex_count(self) -> int:
+        return MeshData.vertices.count(self)
+
+    def vertex_array(self) -> np.ndarray:
+        """Return the stream as a structured array, re-encoding Vertex objects if they were requested."""
+        return MeshData.vertices.array(self)
 
     def read(self, file: BinaryIO, vertex_count: int) -> "MeshData":
         self.revision, self.vertex_size = unpack("ii", file.read(8))
-        self.vertices = [
-            Vertex().read(file, self.revision) for _ in range(vertex_count)
-        ]
+        self.data = read_array(file, vertex_dtype(self.revision, self.vertex_size), vertex_count)
+        MeshData.vertices.reset(self)
         return self
 
     def write(self, file: BinaryIO) -> None:
-        i = -1
         try:
             file.write(pack("ii", self.revision, self.vertex_size))
-            for idx, vertex in enumerate(self.vertices):
-                i = idx
-                vertex.write(file, self.revision)
+            write_array(file, self.vertex_array())
         except Exception as e:
             raise RuntimeError(
-                f"Vertex write failed at index {i}, revision={self.revision}: {e}"
+                f"Vertex write failed, revision={self.revision}: {e}"
             ) from e
 
-
     def size(self) -> int:
-        s = 8 + self.vertex_size * len(self.vertices)
+        s = 8 + self.vertex_size * self.vertex_count
         return s
 
 
@@ -218,6 +287,24 @@ class Textures:
         return 4 + sum(texture.size() for texture in self.textures)
 
 
+# Each Material entry is an identifier followed by the one float it sets
+_MATERIAL_STRUCT = Struct("<if")
+_MATERIAL_ATTRIBUTES = {
+    1668510769: "smoothness",
+    1668510770: "metalness",
+    1668510771: "reflectivity",
+    1668510772: "emissivity",
+    1668510773: "refraction_scale",
+    1668510774: "distortion_mesh_scale",
+    1935897704: "scratch",
+    1668510775: "specular_scale",
+    1668510776: "wind_response",
+    1668510777: "wind_height",
+    1935893623: "depth_write_threshold",
+    1668510785: "saturation",
+}
+
+
 @dataclass(eq=False, repr=False)
 class Material:
     identifier: int = 0
@@ -277,69 +364,24 @@ class Material:
 
     def read(self, file: BinaryIO) -> "Material":
         """Reads the Material from the buffer"""
-        self.identifier = unpack("i", file.read(4))[0]
-        if self.identifier == 1668510769:
-            self.smoothness = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510770:
-            self.metalness = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510771:
-            self.reflectivity = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510772:
-            self.emissivity = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510773:
-            self.refraction_scale = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510774:
-            self.distortion_mesh_scale = unpack("f", file.read(4))[0]
-        elif self.identifier == 1935897704:
-            self.scratch = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510775:
-            self.specular_scale = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510776:
-            self.wind_response = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510777:
-            self.wind_height = unpack("f", file.read(4))[0]
-        elif self.identifier == 1935893623:
-            self.depth_write_threshold = unpack("f", file.read(4))[0]
-        elif self.identifier == 1668510785:
-            self.saturation = unpack("f", file.read(4))[0]
-        else:
-            self.unknown = unpack("f", file.read(4))[0]
+        self.identifier, value = _MATERIAL_STRUCT.unpack(file.read(8))
+        attribute = _MATERIAL_ATTRIBUTES.get(self.identifier)
+        if attribute is None:
+            self.unknown = value
             raise TypeError(f"Unknown Material {self.unknown}")
+        setattr(self, attribute, value)
         return self
 
     def write(self, file: BinaryIO) -> None:
         """Writes the Material to the buffer"""
-        file.write(pack("i", self.identifier))
-        if self.identifier == 1668510769:
-            file.write(pack("f", self.smoothness))
-        elif self.identifier == 1668510770:
-            file.write(pack("f", self.metalness))
-        elif self.identifier == 1668510771:
-            file.write(pack("f", self.reflectivity))
-        elif self.identifier == 1668510772:
-            file.write(pack("f", self.emissivity))
-        elif self.identifier == 1668510773:
-            file.write(pack("f", self.refraction_scale))
-        elif self.identifier == 1668510774:
-            file.write(pack("f", self.distortion_mesh_scale))
-        elif self.identifier == 1935897704:
-            file.write(pack("f", self.scratch))
-        elif self.identifier == 1668510775:
-            file.write(pack("f", self.specular_scale))
-        elif self.identifier == 1668510776:
-            file.write(pack("f", self.wind_response))
-        elif self.identifier == 1668510777:
-            file.write(pack("f", self.wind_height))
-        elif self.identifier == 1935893623:
-            file.write(pack("f", self.depth_write_threshold))
-        elif self.identifier == 1668510785:
-            file.write(pack("f", self.saturation))
-        else:
-            file.write(pack("f", self.unknown))
+        attribute = _MATERIAL_ATTRIBUTES.get(self.identifier)
+        if attribute is None:
+            file.write(_MATERIAL_STRUCT.pack(self.identifier, self.unknown))
             raise TypeError(f"Unknown Material {self.unknown}")
+        file.write(_MATERIAL_STRUCT.pack(self.identifier, getattr(self, attribute)))
 
     def size(self) -> int:
-        return 4 + 4
+        return _MATERIAL_STRUCT.size
 
 
 @dataclass(eq=False, repr=False)
@@ -495,7 +537,7 @@ class Flow:
 class BattleforgeMesh:
     vertex_count: int = 0
     face_count: int = 0
-    faces: List[Face] = field(default_factory=list)
+    face_indices: Optional[np.ndarray] = None
     mesh_count: int = 0
     mesh_data: List[MeshData] = field(default_factory=list)
     bounding_box_lower_left_corner: Vector3 = field(default_factory=Vector3)
@@ -510,10 +552,12 @@ class BattleforgeMesh:
     level_of_detail: LevelOfDetail = field(default_factory=LevelOfDetail)
     empty_string: EmptyString = field(default_factory=EmptyString)
     flow: Flow = field(default_factory=Flow)
+    faces = ArrayBackedList("face_indices", faces_to_objects, faces_to_array)
 
     def read(self, file: BinaryIO) -> "BattleforgeMesh":
         self.vertex_count, self.face_count = unpack("ii", file.read(8))
-        self.faces = [Face().read(file) for _ in range(self.face_count)]
+        self.face_indices = read_faces(file, self.face_count)
+        BattleforgeMesh.faces.reset(self)
         self.mesh_count = unpack("B", file.read(1))[0]
         self.mesh_data = [
             MeshData().read(file, self.vertex_count) for _ in range(self.mesh_count)
@@ -570,8 +614,7 @@ class BattleforgeMesh:
                 f"Error writing BattleforgeMesh vertex_count {self.vertex_count} or face_count {self.face_count}: {e}"
             ) from e
 
-        for face in self.faces:
-            face.write(file)
+        write_array(file, BattleforgeMesh.faces.array(self))
 
         try:
             file.write(pack("B", self.mesh_count))
@@ -629,7 +672,7 @@ class BattleforgeMesh:
         size += 24  # BoundingBox1 + BoundingBox2
         size += 2  # MaterialID
         size += 4  # MaterialParameters
-        size += sum(face.size() for face in self.faces)
+        size += 6 * BattleforgeMesh.faces.count(self)
         size += sum(mesh_data.size() for mesh_data in self.mesh_data)
 
         if self.material_parameters == -86061050:
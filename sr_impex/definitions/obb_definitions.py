@@ -3,18 +3,42 @@ OBB (Oriented Bounding Box) tree class definitions for DRS files.
 
 This module contains classes related to OBB tree data structures:
 - OBBNode: Individual oriented bounding box node with children and triangle info
-- CGeoOBBTree: Complete OBB tree with nodes and face data
+- CGeoOBBTree: Complete OBB tree with nodes and face data, stored as packed arrays
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from struct import pack, unpack
-from typing import BinaryIO, List
+from typing import BinaryIO, List, Optional
+
+import numpy as np
 
 from sr_impex.definitions.base_types import (
+    ArrayBackedList,
     CMatCoordinateSystem,
-    Face,
+    Matrix3x3,
+    Vector3,
+    faces_to_array,
+    faces_to_objects,
+    read_array,
+    read_faces,
+    write_array,
+)
+
+# On-disk layout of one OBBNode: CMatCoordinateSystem followed by "4H2I".
+OBB_NODE_DTYPE = np.dtype(
+    [
+        ("matrix", "<f4", 9),
+        ("position", "<f4", 3),
+        ("first_child_index", "<u2"),
+        ("second_child_index", "<u2"),
+        ("skip_pointer", "<u2"),
+        ("node_depth", "<u2"),
+        ("triangle_offset", "<u4"),
+        ("total_triangles", "<u4"),
+    ]
 )
+_NODE_FIELDS = OBB_NODE_DTYPE.names[2:]
 
 
 @dataclass(eq=False, repr=False)
@@ -59,33 +83,60 @@ class OBBNode:
         return self.oriented_bounding_box.size() + 16
 
 
+def _nodes_to_objects(_owner, nodes: np.ndarray) -> List[OBBNode]:
+    result = []
+    columns = [nodes[name].tolist() for name in OBB_NODE_DTYPE.names]
+    for matrix, position, *values in zip(*columns):
+        obb_node = OBBNode(
+            CMatCoordinateSystem(Matrix3x3().from_flat(matrix), Vector3(*position)),
+            *values,
+        )
+        result.append(obb_node)
+    return result
+
+
+def _nodes_to_array(_owner, obb_nodes: List[OBBNode]) -> np.ndarray:
+    nodes = np.zeros(len(obb_nodes), dtype=OBB_NODE_DTYPE)
+    if obb_nodes:
+        nodes["matrix"] = [np.reshape(n.oriented_bounding_box.matrix.matrix, 9) for n in obb_nodes]
+        position = [n.oriented_bounding_box.position for n in obb_nodes]
+        nodes["position"] = [(p.x, p.y, p.z) for p in position]
+        for name in _NODE_FIELDS:
+            nodes[name] = [getattr(n, name) for n in obb_nodes]
+    return nodes
+
+
 @dataclass(eq=False, repr=False)
 class CGeoOBBTree:
+    """OBB tree stored as one packed node array and an (N, 3) uint16 index buffer."""
+
     magic: int = 1845540702
     version: int = 3
     matrix_count: int = 0
-    obb_nodes: List[OBBNode] = field(default_factory=list)
+    node_array: Optional[np.ndarray] = None
     triangle_count: int = 0
-    faces: List[Face] = field(default_factory=list)
+    face_indices: Optional[np.ndarray] = None
+    obb_nodes = ArrayBackedList("node_array", _nodes_to_objects, _nodes_to_array)
+    faces = ArrayBackedList("face_indices", faces_to_objects, faces_to_array)
 
     def read(self, file: BinaryIO) -> "CGeoOBBTree":
         self.magic, self.version, self.matrix_count = unpack("iii", file.read(12))
-        self.obb_nodes = [OBBNode().read(file) for _ in range(self.matrix_count)]
+        self.node_array = read_array(file, OBB_NODE_DTYPE, self.matrix_count)
         self.triangle_count = unpack("i", file.read(4))[0]
-        self.faces = [Face().read(file) for _ in range(self.triangle_count)]
+        self.face_indices = read_faces(file, self.triangle_count)
+        CGeoOBBTree.obb_nodes.reset(self)
+        CGeoOBBTree.faces.reset(self)
         return self
 
     def write(self, file: BinaryIO) -> None:
         file.write(pack("iii", self.magic, self.version, self.matrix_count))
-        for obb_node in self.obb_nodes:
-            obb_node.write(file)
+        write_array(file, CGeoOBBTree.obb_nodes.array(self))
         file.write(pack("i", self.triangle_count))
-        for face in self.faces:
-            face.write(file)
+        write_array(file, CGeoOBBTree.faces.array(self))
 
     def size(self) -> int:
         return (
             16
-            + sum(obb_node.size() for obb_node in self.obb_nodes)
-            + sum(face.size() for face in self.faces)
+            + OBB_NODE_DTYPE.itemsize * CGeoOBBTree.obb_nodes.count(self)
+            + 6 * CGeoOBBTree.faces.count(self)
         )
@@ -0,0 +1,295 @@
+"""
+Header-only probes for DRS, BMG, SKA and FXB files.
+
+A probe returns the metadata needed for indexing and validation without
+decoding the payload of a file:
+- ContainerProbe: node table of a DRS/BMG/BMS container plus consistency issues
+- DrsProbe: ContainerProbe with the texture names referenced by CDspMeshFile
+- SkaProbe: SKA type, headers, duration and bone count
+- FxbProbe: DrsProbe with the top-level element types of the FxMaster
+
+The exception is FxbProbe: FxMaster elements carry no sizes, so finding the top-level
+elements means reading the whole element stream, tracks included. It costs as much as
+decoding the FxMaster. Corrupt or truncated input never raises; the problem is recorded
+in `issues` instead.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from struct import unpack
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from sr_impex.core.file_io import MappedFileReader
+from sr_impex.definitions.base_types import Node, NodeInformation, RootNode, RootNodeInformation, read_array
+from sr_impex.definitions.mesh_definitions import (
+    EmptyString,
+    Flow,
+    LevelOfDetail,
+    Materials,
+    Refraction,
+    Textures,
+)
+from sr_impex.definitions.ska_definitions import SKA_HEADER_DTYPE
+
+CONTAINER_MAGIC = -981667554
+SKA_MAGIC = -1491828473
+CDSP_MESH_FILE_MAGIC = 1314189598
+HEADER_SIZE = 20
+NODE_INFORMATION_SIZE = 32
+
+
+@dataclass(eq=False)
+class NodeEntry:
+    name: str = ""
+    magic: int = 0
+    identifier: int = 0
+    offset: int = 0
+    size: int = 0
+
+
+@dataclass(eq=False)
+class ContainerProbe:
+    file_name: str = ""
+    file_size: int = 0
+    magic: int = 0
+    node_count: int = 0
+    node_information_offset: int = 0
+    node_hierarchy_offset: int = 0
+    nodes: List[NodeEntry] = field(default_factory=list)
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+    def node(self, name: str):
+        return next((entry for entry in self.nodes if entry.name == name), None)
+
+
+@dataclass(eq=False)
+class DrsProbe(ContainerProbe):
+    textures: List[Tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class FxbProbe(DrsProbe):
+    element_types: List[str] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class SkaProbe:
+    file_name: str = ""
+    file_size: int = 0
+    type: int = 0
+    header_array: Optional[np.ndarray] = None  # SKA_HEADER_DTYPE records
+    time_count: int = 0
+    duration: float = 0.0
+    bone_count: int = 0
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+
+def _probe_container(reader: MappedFileReader, result: ContainerProbe) -> ContainerProbe:
+    """Read the header, the NodeInformation table and the hierarchy names, then cross-check them."""
+    result.file_size = reader.size()
+    if result.file_size < HEADER_SIZE:
+        result.issues.append(f"File too small for a container header ({result.file_size} bytes)")
+        return result
+    (
+        result.magic,
+        _number_of_models,
+        result.node_information_offset,
+        result.node_hierarchy_offset,
+        result.node_count,
+    ) = unpack("iiiiI", reader.read(HEADER_SIZE))
+    if result.magic != CONTAINER_MAGIC or result.node_count < 1:
+        result.issues.append(f"Invalid header. Magic: {result.magic}, NodeCount: {result.node_count}")
+        return result
+    for label, offset in (
+        ("NodeInformation", result.node_information_offset),
+        ("NodeHierarchy", result.node_hierarchy_offset),
+    ):
+        if not HEADER_SIZE <= offset < result.file_size:
+            result.issues.append(f"{label} offset {offset} lies outside the file ({result.file_size} bytes)")
+    if result.issues:
+        return result
+
+    table_end = result.node_information_offset + NODE_INFORMATION_SIZE * result.node_count
+    if table_end > result.file_size:
+        result.issues.append(f"NodeInformation table ends at {table_end}, past the end of the file")
+        return result
+
+    reader.seek(result.node_information_offset)
+    RootNodeInformation().read(reader)
+    infos = [NodeInformation().read(reader) for _ in range(result.node_count - 1)]
+
+    reader.seek(result.node_hierarchy_offset)
+    try:
+        RootNode().read(reader)
+        names = [Node().read(reader) for _ in range(result.node_count - 1)]
+    except Exception as exc:  # pylint: disable=broad-except
+        result.issues.append(f"Unreadable node hierarchy: {exc}")
+        names = []
+
+    # Hierarchy nodes point into the information table by info_index (1-based, 0 is the root)
+    name_by_index = {node.info_index: node.name for node in names}
+    for index, info in enumerate(infos, start=1):
+        result.nodes.append(
+            NodeEntry(name_by_index.get(index, ""), info.magic, info.identifier, info.offset, info.node_size)
+        )
+
+    sections = sorted((entry for entry in result.nodes if entry.size > 0), key=lambda entry: entry.offset)
+    previous_end, previous_name = HEADER_SIZE, "header"
+    for entry in sections:
+        label = entry.name or str(entry.magic)
+        if entry.offset < previous_end:
+            result.issues.append(f"Node {label} at {entry.offset} overlaps {previous_name} ending at {previous_end}")
+        if entry.offset + entry.size > result.node_information_offset:
+            result.issues.append(f"Node {label} runs into the NodeInformation table")
+        previous_end, previous_name = entry.offset + entry.size, label
+    for entry in result.nodes:
+        if not entry.name:
+            result.issues.append(f"NodeInformation {entry.identifier} has no hierarchy node")
+    return result
+
+
+def _scan_mesh_textures(reader: MappedFileReader, offset: int, result: DrsProbe) -> None:
+    """Walk CDspMeshFile, skipping face and vertex payloads, and collect the texture names."""
+    reader.seek(offset)
+    if unpack("i", reader.read(4))[0] != CDSP_MESH_FILE_MAGIC:
+        result.issues.append("CDspMeshFile has the wrong magic value")
+        return
+    _zero, mesh_count = unpack("ii", reader.read(8))
+    reader.seek(reader.tell() + 24)  # bounding box
+    for _ in range(mesh_count):
+        vertex_count, face_count = unpack("ii", reader.read(8))
+        reader.seek(reader.tell() + 6 * face_count)
+        for _ in range(unpack("B", reader.read(1))[0]):
+            _revision, vertex_size = unpack("ii", reader.read(8))
+            reader.seek(reader.tell() + vertex_size * vertex_count)
+        reader.seek(reader.tell() + 24)  # bounding box
+        _material_id, material_parameters = unpack("=hi", reader.read(6))
+        if material_parameters in (-86061050, -86061051, -86061052):
+            reader.read(8)
+        elif material_parameters in (-86061053, -86061054, -86061055):
+            reader.read(4)
+        else:
+            result.issues.append(f"Unknown MaterialParameters {material_parameters}")
+            return
+        textures = Textures().read(reader)
+        result.textures.extend((texture.identifier, texture.name) for texture in textures.textures)
+        # The remaining material blocks are tiny, decode them only to advance to the next mesh
+        Refraction().read(reader)
+        Materials().read(reader)
+        if material_parameters != -86061055:
+            LevelOfDetail().read(reader)
+        if material_parameters not in (-86061054, -86061055):
+            EmptyString().read(reader)
+        if material_parameters == -86061050:
+            Flow().read(reader)
+
+
+def probe_container(file_name: str) -> ContainerProbe:
+    """Probe any DRS-style container (BMG, BMS, ...) for its node table."""
+    with MappedFileReader(file_name) as reader:
+        return _probe_container(reader, ContainerProbe(file_name=file_name))
+
+
+def probe_drs(file_name: str) -> DrsProbe:
+    """Probe a DRS file for its node table and referenced textures."""
+    with MappedFileReader(file_name) as reader:
+        result = _probe_container(reader, DrsProbe(file_name=file_name))
+        mesh_file = result.node("CDspMeshFile")
+        if result.valid and mesh_file is not None:
+            try:
+                _scan_mesh_textures(reader, mesh_file.offset, result)
+            except Exception as exc:  # pylint: disable=broad-except
+                result.issues.append(f"Unreadable CDspMeshFile: {exc}")
+        return result
+
+
+def probe_fxb(file_name: str) -> FxbProbe:
+    """Probe an FXB file for its node table and the top-level FxMaster element types.
+
+    Not a cheap probe: the element stream has no sizes to skip by, so every element and
+    track is decoded on the way and only the top-level type names are kept.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sr_impex.definitions.fxb_definitions import FxMaster, _element_type_map, iter_elements
+
+    with MappedFileReader(file_name) as reader:
+        result = _probe_container(reader, FxbProbe(file_name=file_name))
+        fx_master = result.node("FxMaster")
+        if not result.valid or fx_master is None:
+            return result
+        reader.seek(fx_master.offset)
+        try:
+            root = FxMaster().read_header(reader).special_effect
+            for element in iter_elements(reader, root):
+                if element.parent is root:
+                    element_class = _element_type_map[element.element_type_header]
+                    result.element_types.append(element_class.__name__)
+        except Exception as exc:  # pylint: disable=broad-except
+            result.issues.append(f"Unreadable FxMaster: {exc}")
+        return result
+
+
+def probe_ska(file_name: str) -> SkaProbe:
+    """Probe an SKA file for its headers, duration and bone count without reading keyframes."""
+    result = SkaProbe(file_name=file_name)
+    with MappedFileReader(file_name) as reader:
+        result.file_size = reader.size()
+        if result.file_size < 8:
+            result.issues.append(f"File too small for an SKA header ({result.file_size} bytes)")
+            return result
+        magic, result.type = unpack("iI", reader.read(8))
+        if magic != SKA_MAGIC:
+            result.issues.append(f"Invalid SKA magic: {magic}")
+            return result
+        if result.type not in (6, 7):
+            return result
+        if result.file_size < 12:
+            result.issues.append("File ends before the SKA header count")
+            return result
+        header_count = unpack("i", reader.read(4))[0]
+        headers_end = reader.tell() + SKA_HEADER_DTYPE.itemsize * header_count
+        if header_count < 0 or headers_end + 4 > result.file_size:
+            result.issues.append(f"Header block of {header_count} headers runs past the end of the file")
+            return result
+        result.header_array = read_array(reader, SKA_HEADER_DTYPE, header_count)
+        result.time_count = unpack("i", reader.read(4))[0]
+        if result.time_count < 0:
+            result.issues.append(f"Negative time count {result.time_count}")
+            return result
+        # times (4 bytes) and keyframes (32 bytes) are skipped
+        duration_offset = reader.tell() + 36 * result.time_count
+        if duration_offset + 4 > result.file_size:
+            result.issues.append(f"Keyframe block ends at {duration_offset}, past the end of the file")
+            return result
+        reader.seek(duration_offset)
+        result.duration = unpack("f", reader.read(4))[0]
+        headers = result.header_array
+        result.bone_count = len(np.unique(headers["bone_id"]))
+        overflow = headers["tick"].astype(np.int64) + headers["interval"] > result.time_count
+        if overflow.any():
+            bone_id = int(headers["bone_id"][overflow.argmax()])
+            result.issues.append(f"Header of bone {bone_id} points past the keyframe block")
+    return result
+
+
+def probe_file(file_name: str):
+    """Dispatch to the matching probe by file extension."""
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == ".drs":
+        return probe_drs(file_name)
+    if extension == ".fxb":
+        return probe_fxb(file_name)
+    if extension == ".ska":
+        return probe_ska(file_name)
+    return probe_container(file_name)
@@ -10,10 +10,18 @@ This module contains classes related to resource metadata:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from struct import calcsize, pack, unpack
+from struct import pack, unpack
 from typing import BinaryIO, List
 
+from sr_impex.definitions.base_types import Fixed, String, binary_layout
 
+
+@binary_layout(
+    Fixed("version", "i"),
+    Fixed("unknown", "i"),
+    Fixed("length", "i"),
+    String("hash", "length"),
+)
 @dataclass(eq=False, repr=False)
 class DrwResourceMeta:
     version: int = 1
@@ -21,24 +29,6 @@ class DrwResourceMeta:
     length: int = 0
     hash: str = ""
 
-    def read(self, file: BinaryIO) -> "DrwResourceMeta":
-        """Reads the DrwResourceMeta from the buffer"""
-        self.version, self.unknown = unpack("2i", file.read(8))
-        self.length = unpack("i", file.read(4))[0]
-        self.hash = file.read(self.length).decode("utf-8").strip("\x00")
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        """Writes the DrwResourceMeta to the buffer"""
-        file.write(pack("i", self.version))
-        file.write(pack("i", self.unknown))
-        file.write(pack("i", self.length))
-        file.write(self.hash.encode("utf-8"))
-
-    def size(self) -> int:
-        """Returns the size of the DrwResourceMeta"""
-        return calcsize(f"2ii{self.length}s")
-
 
 @dataclass(eq=False, repr=False)
 class CGeoPrimitiveContainer:
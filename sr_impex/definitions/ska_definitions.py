@@ -1,9 +1,20 @@
-from typing import BinaryIO
+from typing import List, Optional
 from struct import calcsize, unpack, pack
 from dataclasses import dataclass, field
-from sr_impex.core.file_io import FileReader
+import numpy as np
+from sr_impex.core.file_io import MappedFileReader
+from sr_impex.definitions.base_types import ArrayBackedList, Fixed, binary_layout, read_array, write_array
 
+# One SKAHeader record, see SKAHeader for the per-object form
+SKA_HEADER_DTYPE = np.dtype([("tick", "<u4"), ("interval", "<u4"), ("type", "<u4"), ("bone_id", "<u4")])
 
+
+@binary_layout(
+    Fixed("tick", "I"),
+    Fixed("interval", "I"),
+    Fixed("type", "I"),
+    Fixed("bone_id", "I"),
+)
 @dataclass(eq=False, repr=False)
 class SKAHeader:
     tick: int = 0  # uint
@@ -11,20 +22,17 @@ class SKAHeader:
     type: int = 0  # uint
     bone_id: int = 0  # uint
 
-    def read(self, file: BinaryIO) -> "SKAHeader":
-        self.tick = unpack("I", file.read(calcsize("I")))[0]
-        self.interval = unpack("I", file.read(calcsize("I")))[0]
-        self.type = unpack("I", file.read(calcsize("I")))[0]
-        self.bone_id = unpack("I", file.read(calcsize("i")))[0]
-        return self
-
-    def write(self, file: BinaryIO) -> None:
-        file.write(pack("I", self.tick))
-        file.write(pack("I", self.interval))
-        file.write(pack("I", self.type))
-        file.write(pack("I", self.bone_id))
-
 
+@binary_layout(
+    Fixed("x", "f"),
+    Fixed("y", "f"),
+    Fixed("z", "f"),
+    Fixed("w", "f"),
+    Fixed("tan_x", "f"),
+    Fixed("tan_y", "f"),
+    Fixed("tan_z", "f"),
+    Fixed("tan_w", "f"),
+)
 @dataclass(eq=False, repr=False)
 class SKAKeyframe:
     x: float = 0.0
@@ -36,45 +44,45 @@ class SKAKeyframe:
     tan_z: float = 0.0
     tan_w: float = 0.0
 
-    def read(self, file: BinaryIO) -> "SKAKeyframe":
-        data = unpack("8f", file.read(calcsize("8f")))
-        (
-            self.x,
-            self.y,
-            self.z,
-            self.w,
-            self.tan_x,
-            self.tan_y,
-            self.tan_z,
-            self.tan_w,
-        ) = data
-        return self
 
-    def write(self, file: BinaryIO) -> None:
-        file.write(
-            pack(
-                "8f",
-                self.x,
-                self.y,
-                self.z,
-                self.w,
-                self.tan_x,
-                self.tan_y,
-                self.tan_z,
-                self.tan_w,
-            )
-        )
+def _headers_to_objects(_owner, headers: np.ndarray) -> List[SKAHeader]:
+    columns = [headers[name].tolist() for name in SKA_HEADER_DTYPE.names]
+    return [SKAHeader(*row) for row in zip(*columns)]
+
+
+def _headers_to_array(_owner, headers: List[SKAHeader]) -> np.ndarray:
+    return np.array(
+        [(header.tick, header.interval, header.type, header.bone_id) for header in headers],
+        dtype=SKA_HEADER_DTYPE,
+    )
+
+
+def _keyframes_to_objects(_owner, keyframes: np.ndarray) -> List[SKAKeyframe]:
+    return [SKAKeyframe(*row) for row in keyframes.tolist()]
+
+
+def _keyframes_to_array(_owner, keyframes: List[SKAKeyframe]) -> np.ndarray:
+    rows = [(k.x, k.y, k.z, k.w, k.tan_x, k.tan_y, k.tan_z, k.tan_w) for k in keyframes]
+    return np.array(rows, dtype="<f4").reshape(len(rows), 8)
 
 
 @dataclass(eq=False, repr=False)
 class SKA:
+    """SKA animation file.
+
+    For types 6 and 7 the channel headers, times and keyframes are kept as arrays:
+    header_array (SKA_HEADER_DTYPE records), time_array (float32) and keyframe_array
+    ((N, 8) float32 as x, y, z, w, tan_x, tan_y, tan_z, tan_w). headers, times and
+    keyframes expose them as object lists on first access.
+    """
+
     magic: int = -1491828473
     type: int = 0  # uint
     header_count: int = 0
-    headers: list[SKAHeader] = field(default_factory=list)
+    header_array: Optional[np.ndarray] = None
     time_count: int = 0
-    times: list[float] = field(default_factory=list)
-    keyframes: list[SKAKeyframe] = field(default_factory=list)
+    time_array: Optional[np.ndarray] = None
+    keyframe_array: Optional[np.ndarray] = None
     duration: float = 0.0
     repeat: int = 0
     stutter_mode: int = (
@@ -93,8 +101,16 @@ class SKA:
     frame_length: int = 0  # only for type 7
     zeroes: list[int] = field(default_factory=list)
 
+    headers = ArrayBackedList("header_array", _headers_to_objects, _headers_to_array)
+    times = ArrayBackedList(
+        "time_array",
+        lambda _owner, times: times.tolist(),
+        lambda _owner, times: np.asarray(times, dtype="<f4"),
+    )
+    keyframes = ArrayBackedList("keyframe_array", _keyframes_to_objects, _keyframes_to_array)
+
     def read(self, file_name: str) -> "SKA":
-        reader = FileReader(file_name)
+        reader = MappedFileReader(file_name)
         self.magic = unpack("i", reader.read(calcsize("i")))[0]
         self.type = unpack("I", reader.read(calcsize("I")))[0]
         if self.type == 2:
@@ -123,25 +139,42 @@ class SKA:
                 unpack("i", reader.read(calcsize("i")))[0] for _ in range(unused5)
             ]
         elif self.type == 6 or self.type == 7:
-            self.header_count = unpack("i", reader.read(calcsize("i")))[0]
-            self.headers = [SKAHeader().read(reader) for _ in range(self.header_count)]
-            self.time_count = unpack("i", reader.read(calcsize("i")))[0]
-            self.times = [
-                unpack("f", reader.read(calcsize("f")))[0]
-                for _ in range(self.time_count)
-            ]
-            self.keyframes = [
-                SKAKeyframe().read(reader) for _ in range(self.time_count)
-            ]
-            self.duration = unpack("f", reader.read(calcsize("f")))[0]
-            self.repeat = unpack("i", reader.read(calcsize("i")))[0]
-            self.stutter_mode = unpack("i", reader.read(calcsize("i")))[0]
+            self.header_count = unpack("i", reader.read(4))[0]
+            self.header_array = read_array(reader, SKA_HEADER_DTYPE, self.header_count)
+            self.time_count = unpack("i", reader.read(4))[0]
+            self.time_array = read_array(reader, "<f4", self.time_count)
+            self.keyframe_array = read_array(reader, "<f4", self.time_count * 8).reshape(self.time_count, 8)
+            for name in ("headers", "times", "keyframes"):
+                getattr(SKA, name).reset(self)
+            self.duration, self.repeat, self.stutter_mode = unpack("fii", reader.read(12))
             if self.type == 7:
-                self.unused1 = unpack("i", reader.read(calcsize("i")))[0]
-            self.frame_length = unpack("i", reader.read(calcsize("i")))[0]
-            self.zeroes = [unpack("i", reader.read(calcsize("i")))[0] for _ in range(3)]
+                self.unused1 = unpack("i", reader.read(4))[0]
+            self.frame_length = unpack("i", reader.read(4))[0]
+            self.zeroes = list(unpack("3i", reader.read(12)))
         else:
             print(f"Unknown SKA type: {self.type}.")
+        reader.close()
+        return self
+
+    def read_header(self, file_name: str) -> "SKA":
+        """Read the type and the trailing timing fields of a type 6/7 file, skipping the keyframe block.
+
+        header_array, time_array and keyframe_array stay None; use read() for the animation itself.
+        """
+        with MappedFileReader(file_name) as reader:
+            self.magic, self.type = unpack("iI", reader.read(8))
+            if self.type not in (6, 7):
+                print(f"Unknown SKA type: {self.type}.")
+                return self
+            self.header_count = unpack("i", reader.read(4))[0]
+            reader.seek(reader.tell() + SKA_HEADER_DTYPE.itemsize * self.header_count)
+            self.time_count = unpack("i", reader.read(4))[0]
+            # times (4 bytes) and keyframes (32 bytes each)
+            reader.seek(reader.tell() + 36 * self.time_count)
+            self.duration, self.repeat, self.stutter_mode = unpack("fii", reader.read(12))
+            if self.type == 7:
+                self.unused1 = unpack("i", reader.read(4))[0]
+            self.frame_length = unpack("i", reader.read(4))[0]
         return self
 
     def write(self, file_name: str) -> None:
@@ -167,17 +200,17 @@ class SKA:
                 for unused in self.unused6:
                     file.write(pack("i", unused))
             elif self.type == 6 or self.type == 7:
+                header_array = SKA.headers.array(self)
+                time_array = SKA.times.array(self)
+                keyframe_array = SKA.keyframes.array(self)
+                self.header_count = len(header_array)
+                self.time_count = len(time_array)
                 file.write(pack("i", self.header_count))
-                for header in self.headers:
-                    header.write(file)
+                write_array(file, header_array.astype(SKA_HEADER_DTYPE, copy=False))
                 file.write(pack("i", self.time_count))
-                for time in self.times:
-                    file.write(pack("f", time))
-                for keyframe in self.keyframes:
-                    keyframe.write(file)
-                file.write(pack("f", self.duration))
-                file.write(pack("i", self.repeat))
-                file.write(pack("i", self.stutter_mode))
+                write_array(file, time_array.astype("<f4", copy=False))
+                write_array(file, keyframe_array.astype("<f4", copy=False))
+                file.write(pack("fii", self.duration, self.repeat, self.stutter_mode))
                 if self.type == 7:
                     file.write(pack("i", self.unused1))
                 file.write(pack("i", self.frame_length))
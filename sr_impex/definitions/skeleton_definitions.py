@@ -15,16 +15,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from struct import calcsize, pack, unpack
-from typing import BinaryIO, List
+from typing import TYPE_CHECKING, BinaryIO, List, Optional
 
-from mathutils import Matrix, Quaternion, Vector
+import numpy as np
 
 from sr_impex.definitions.base_types import (
+    ArrayBackedList,
     Vector3,
     Matrix4x4,
+    read_array,
+    write_array,
 )
 from sr_impex.definitions.mesh_definitions import VertexData
 
+if TYPE_CHECKING:
+    from mathutils import Matrix, Quaternion, Vector
+
 
 @dataclass(eq=False, repr=False)
 class Bone:
@@ -178,24 +184,72 @@ class CSkSkeleton:
         )
 
 
+# One CSkSkinInfo entry as stored on disk ("4f4i")
+SKIN_DTYPE = np.dtype([("weights", "<f4", (4,)), ("bone_indices", "<i4", (4,))])
+
+
+def _skin_to_objects(_owner, skin: np.ndarray) -> List[VertexData]:
+    return [
+        VertexData(weights, bone_indices)
+        for weights, bone_indices in zip(skin["weights"].tolist(), skin["bone_indices"].tolist())
+    ]
+
+
+def _skin_to_array(_owner, vertex_data: List[VertexData]) -> np.ndarray:
+    skin = np.zeros(len(vertex_data), dtype=SKIN_DTYPE)
+    if vertex_data:
+        skin["weights"] = [vertex.weights for vertex in vertex_data]
+        skin["bone_indices"] = [vertex.bone_indices for vertex in vertex_data]
+    return skin
+
+
 @dataclass(eq=False, repr=False)
 class CSkSkinInfo:
+    """Skin table with four bone influences per vertex.
+
+    The table is stored as one SKIN_DTYPE record array mirroring the file layout;
+    weights and bone_indices are (N, 4) float32/int32 views of it. VertexData objects
+    are only built when vertex_data is accessed.
+    """
+
     version: int = 1
     vertex_count: int = 0
-    vertex_data: List[VertexData] = field(default_factory=list)
+    skin_array: Optional[np.ndarray] = None
+
+    vertex_data = ArrayBackedList("skin_array", _skin_to_objects, _skin_to_array)
+
+    @property
+    def weights(self) -> np.ndarray:
+        return CSkSkinInfo.vertex_data.array(self)["weights"]
+
+    @property
+    def bone_indices(self) -> np.ndarray:
+        return CSkSkinInfo.vertex_data.array(self)["bone_indices"]
+
+    def set_arrays(self, weights: np.ndarray, bone_indices: np.ndarray) -> "CSkSkinInfo":
+        """Replace the skin table with (N, 4) weight and bone index arrays."""
+        skin = np.empty(len(weights), dtype=SKIN_DTYPE)
+        skin["weights"] = weights
+        skin["bone_indices"] = bone_indices
+        self.skin_array = skin
+        self.vertex_count = len(skin)
+        CSkSkinInfo.vertex_data.reset(self)
+        return self
 
     def read(self, file: BinaryIO) -> "CSkSkinInfo":
         self.version, self.vertex_count = unpack("ii", file.read(8))
-        self.vertex_data = [VertexData().read(file) for _ in range(self.vertex_count)]
+        self.skin_array = read_array(file, SKIN_DTYPE, self.vertex_count)
+        CSkSkinInfo.vertex_data.reset(self)
         return self
 
     def write(self, file: BinaryIO) -> None:
+        skin = CSkSkinInfo.vertex_data.array(self)
+        self.vertex_count = len(skin)
         file.write(pack("ii", self.version, self.vertex_count))
-        for vertex in self.vertex_data:
-            vertex.write(file)
+        write_array(file, skin)
 
     def size(self) -> int:
-        return 8 + sum(vd.size() for vd in self.vertex_data)
+        return 8 + SKIN_DTYPE.itemsize * CSkSkinInfo.vertex_data.count(self)
 
 
 @dataclass(eq=False, repr=False)
@@ -13,6 +13,7 @@ import xml.etree.ElementTree as ET
 from mathutils import Matrix
 import bpy
 
+from sr_impex.core.decode_scheduler import read_file, schedule_files, with_decode_scheduler
 from sr_impex.core.message_logger import MessageLogger
 
 from sr_impex.definitions.bmg_definitions import BMG, BMS
@@ -28,13 +29,13 @@ from sr_impex.blender.editors.effect_set_editor import (
     EFFECT_BLOB_KEY,
 )
 from sr_impex.blender.editors.bmg_state_editor import MESHGRID_BLOB_KEY, switch_meshset_state
+from sr_impex.blender.instancing import with_mesh_instancing
 from sr_impex.utilities.helpers import verify_collections, abort, copy, build_ska_export_name_map
 
 # Import required functions from drs_utility
 # These are shared between DRS and BMG import/export
 from sr_impex.utilities.drs_utility import (
-    create_static_mesh,
-    create_material,
+    create_shared_static_mesh,
     create_mesh_object,
     setup_armature,
     import_collision_shapes,
@@ -53,6 +54,67 @@ from sr_impex.utilities.drs_utility import (
 
 logger = MessageLogger()
 
+
+def _debris_files(xml_file_path: str, dir_name: str) -> list:
+    """Return the DRS paths of the PhysicObject elements of a debris XML file."""
+    if not os.path.exists(xml_file_path):
+        return []
+    with open(xml_file_path, "r", encoding="utf-8") as file:
+        xml_root = ET.fromstring(file.read())
+    return [
+        os.path.join(dir_name, "meshes", element.attrib["resource"])
+        for element in xml_root.findall(".//Element[@type='PhysicObject']")
+        if element.attrib.get("resource") and element.attrib.get("name")
+    ]
+
+
+def _state_based_mesh_set_files(
+    state_based_mesh_set: StateBasedMeshSet, dir_name: str, import_debris: bool
+) -> list:
+    """Return every file a StateBasedMeshSet import reads: state DRS files and debris meshes."""
+    files = [
+        os.path.join(dir_name, mesh_state.drs_file)
+        for mesh_state in state_based_mesh_set.mesh_states
+        if mesh_state.has_files
+    ]
+    if import_debris:
+        for destruction_state in state_based_mesh_set.destruction_states:
+            files += _debris_files(os.path.join(dir_name, destruction_state.file_name), dir_name)
+    return files
+
+
+def _animation_set_files(animation_set, dir_name: str) -> list:
+    if animation_set is None:
+        return []
+    return [
+        os.path.join(dir_name, variant.file)
+        for animation_key in animation_set.mode_animation_keys
+        for variant in animation_key.animation_set_variants
+    ]
+
+
+def _bmg_files(
+    bmg_file: BMG, dir_name: str, import_animation: bool, import_debris: bool, import_construction: bool
+) -> list:
+    """Gather the files load_bmg reads, so they can be decoded in parallel ahead of use."""
+    grid = bmg_file.mesh_set_grid
+    files = []
+    if grid is not None and grid.ground_decal and grid.ground_decal_length > 0:
+        files.append(os.path.join(dir_name, grid.ground_decal))
+    if grid is not None:
+        for module in grid.mesh_modules:
+            if module.has_mesh_set:
+                files += _state_based_mesh_set_files(module.state_based_mesh_set, dir_name, import_debris)
+    if import_construction and grid is not None:
+        construction_dir = os.path.join(dir_name, "..", "..", "construction")
+        for slocator in grid.cdrw_locator_list.slocators:
+            if slocator.file_name_length > 0 and slocator.class_type == "Construction":
+                files.append(os.path.join(construction_dir, slocator.file_name))
+    if import_animation:
+        files += _animation_set_files(bmg_file.animation_set, dir_name)
+    return files
+
+
 def process_debris_import(state_based_mesh_set, source_collection, dir_name, base_name):
     for destruction_state in state_based_mesh_set.destruction_states:
         state_collection_name = f"Destruction_State_{destruction_state.state_num}"
@@ -71,27 +133,18 @@ def process_debris_import(state_based_mesh_set, source_collection, dir_name, bas
             resource = element.attrib.get("resource")
             name = element.attrib.get("name")
             if resource and name:
-                debris_drs_file = DRS().read(os.path.join(dir_name, "meshes", resource))
-                for mesh_index in range(debris_drs_file.cdsp_mesh_file.mesh_count):
-                    # Create the mesh data and object.
-                    mesh_data = create_static_mesh(
-                        debris_drs_file.cdsp_mesh_file, mesh_index
-                    )
-                    mesh_object = bpy.data.objects.new(
-                        f"CDspMeshFile_{name}", mesh_data
-                    )
-
-                    # Create and assign the material.
-                    material = create_material(
-                        dir_name,
-                        mesh_index,
-                        debris_drs_file.cdsp_mesh_file.meshes[mesh_index],
-                        f"{base_name}_{name}",
-                    )
-                    mesh_data.materials.append(material)
+                with read_file(os.path.join(dir_name, "meshes", resource), lazy=True) as debris_drs_file:
+                    for mesh_index in range(debris_drs_file.cdsp_mesh_file.mesh_count):
+                        # Create the mesh data with its material, shared by repeated debris, and the object.
+                        mesh_data = create_shared_static_mesh(
+                            debris_drs_file.cdsp_mesh_file, mesh_index, dir_name, f"{base_name}_{name}"
+                        )
+                        mesh_object = bpy.data.objects.new(
+                            f"CDspMeshFile_{name}", mesh_data
+                        )
 
-                    # Link the debris mesh object to the collection.
-                    state_collection.objects.link(mesh_object)
+                        # Link the debris mesh object to the collection.
+                        state_collection.objects.link(mesh_object)
 
 
 def import_debris_from_xml(xml_file_path: str, dir_name: str, base_name: str, collection_name: str) -> bpy.types.Collection:
@@ -119,27 +172,18 @@ def import_debris_from_xml(xml_file_path: str, dir_name: str, base_name: str, co
         resource = element.attrib.get("resource")
         name = element.attrib.get("name")
         if resource and name:
-            debris_drs_file = DRS().read(os.path.join(dir_name, "meshes", resource))
-            for mesh_index in range(debris_drs_file.cdsp_mesh_file.mesh_count):
-                # Create the mesh data and object
-                mesh_data = create_static_mesh(
-                    debris_drs_file.cdsp_mesh_file, mesh_index
-                )
-                mesh_object = bpy.data.objects.new(
-                    f"CDspMeshFile_{name}", mesh_data
-                )
-
-                # Create and assign the material
-                material = create_material(
-                    dir_name,
-                    mesh_index,
-                    debris_drs_file.cdsp_mesh_file.meshes[mesh_index],
-                    f"{base_name}_{name}",
-                )
-                mesh_data.materials.append(material)
+            with read_file(os.path.join(dir_name, "meshes", resource), lazy=True) as debris_drs_file:
+                for mesh_index in range(debris_drs_file.cdsp_mesh_file.mesh_count):
+                    # Create the mesh data with its material, shared by repeated debris, and the object
+                    mesh_data = create_shared_static_mesh(
+                        debris_drs_file.cdsp_mesh_file, mesh_index, dir_name, f"{base_name}_{name}"
+                    )
+                    mesh_object = bpy.data.objects.new(
+                        f"CDspMeshFile_{name}", mesh_data
+                    )
 
-                # Link the debris mesh object to the collection
-                debris_collection.objects.link(mesh_object)
+                    # Link the debris mesh object to the collection
+                    debris_collection.objects.link(mesh_object)
 
     return debris_collection
 
@@ -208,7 +252,7 @@ def create_meshset_structure(
             state_col.children.link(meshes_col)
 
             # Load DRS file
-            drs_file: DRS = DRS().read(os.path.join(dir_name, mesh_state.drs_file))
+            drs_file: DRS = read_file(os.path.join(dir_name, mesh_state.drs_file))
 
             # Import collision shapes if present
             # S0 (undamaged): only import if import_s0_collision_shapes is True (BMG-level shapes apply to all S0)
@@ -330,7 +374,7 @@ def import_state_based_mesh_set(
                 mesh_collection, state_collection_name
             )
             # Load the DRS Files
-            drs_file: DRS = DRS().read(os.path.join(dir_name, mesh_set.drs_file))
+            drs_file: DRS = read_file(os.path.join(dir_name, mesh_set.drs_file))
 
             if not armature_object:
                 armature_object, bone_list = setup_armature(source_collection, drs_file)
@@ -339,8 +383,10 @@ def import_state_based_mesh_set(
                 import_collision_shapes(state_collection, drs_file)
 
             for mesh_index in range(drs_file.cdsp_mesh_file.mesh_count):
-                # Create the Mesh Data
-                mesh_data = create_static_mesh(drs_file.cdsp_mesh_file, mesh_index)
+                # Create the Mesh Data with its Material, shared between States using the same DRS
+                mesh_data = create_shared_static_mesh(
+                    drs_file.cdsp_mesh_file, mesh_index, dir_name, base_name
+                )
                 # Create the Mesh Object and add the Mesh Data to it
                 mesh_object: bpy.types.Object = bpy.data.objects.new(
                     f"CDspMeshFile_{mesh_index}", mesh_data
@@ -371,15 +417,6 @@ def import_state_based_mesh_set(
                         Matrix.Translation(location) @ transposed_rotation.to_4x4()
                     )
                     mesh_object.matrix_world = local_matrix
-                # Create the Material Data
-                material_data = create_material(
-                    dir_name,
-                    mesh_index,
-                    drs_file.cdsp_mesh_file.meshes[mesh_index],
-                    base_name
-                )
-                # Assign the Material to the Mesh
-                mesh_data.materials.append(material_data)
                 # Link the Mesh Object to the Source Collection
                 state_collection.objects.link(mesh_object)
             if (
@@ -393,7 +430,7 @@ def import_state_based_mesh_set(
                 with ensure_mode("POSE"):
                     for animation_key in bmg_file.animation_set.mode_animation_keys:
                         for variant in animation_key.animation_set_variants:
-                            ska_file: SKA = SKA().read(
+                            ska_file: SKA = read_file(
                                 os.path.join(dir_name, variant.file)
                             )
                             import_ska_animation(
@@ -477,12 +514,13 @@ def import_mesh_set_grid(
                 for mesh_state in module.state_based_mesh_set.mesh_states:
                     if mesh_state.has_files:
                         file_path = os.path.join(dir_name, mesh_state.drs_file)
-                        drs_file = DRS().read(file_path)
-                        if drs_file.csk_skeleton is not None:
-                            armature_object, bone_list = setup_armature(
-                                source_collection, drs_file
-                            )
-                            break
+                        # Only the skeleton is needed here, skip decoding the rest
+                        with read_file(file_path, lazy=True) as drs_file:
+                            if drs_file.csk_skeleton is not None:
+                                armature_object, bone_list = setup_armature(
+                                    source_collection, drs_file
+                                )
+                                break
 
             # Create structured MeshSet with all states organized hierarchically
             meshset_col, _ = create_meshset_structure(
@@ -529,15 +567,15 @@ def import_mesh_set_grid(
                 for mesh_state in module.state_based_mesh_set.mesh_states:
                     if mesh_state.has_files:
                         file_path = os.path.join(dir_name, mesh_state.drs_file)
-                        drs_file = DRS().read(file_path)
-                        if (
-                            drs_file.csk_skeleton is not None
-                            and drs_file.animation_set is not None
-                        ):
-                            import_animation_ik_atlas(
-                                armature_object, drs_file.animation_set, bone_list
-                            )
-                            break  # Only need to do this once per module
+                        with read_file(file_path, lazy=True) as drs_file:
+                            if (
+                                drs_file.csk_skeleton is not None
+                                and drs_file.animation_set is not None
+                            ):
+                                import_animation_ik_atlas(
+                                    armature_object, drs_file.animation_set, bone_list
+                                )
+                                break  # Only need to do this once per module
 
         # Increment module index for each module (even if no mesh)
         module_index += 1
@@ -545,6 +583,8 @@ def import_mesh_set_grid(
     return armature_object, bone_list, module_mesh_map
 
 
+@with_decode_scheduler
+@with_mesh_instancing
 def load_bmg(
     context: bpy.types.Context,
     filepath="",
@@ -576,7 +616,9 @@ def load_bmg(
         "DRSModel_" + base_name
     )
     context.collection.children.link(source_collection)
-    bmg_file: BMG = BMG().read(filepath)
+    bmg_file: BMG = read_file(filepath)
+    # Decode every referenced file in worker processes while the datablocks are built here
+    schedule_files(_bmg_files(bmg_file, dir_name, import_animation, import_debris, import_construction))
 
     # persist_locator_blob_on_collection(source_collection, bmg_file)
     persist_animset_blob_on_collection(source_collection, bmg_file)
@@ -594,26 +636,19 @@ def load_bmg(
         )
         source_collection.children.link(ground_decal_collection)
         # Load the DRS Files
-        ground_decal: DRS = DRS().read(
+        ground_decal: DRS = read_file(
             os.path.join(dir_name, bmg_file.mesh_set_grid.ground_decal)
         )
         # Load the Meshes
         for mesh_index in range(ground_decal.cdsp_mesh_file.mesh_count):
-            # Create the Mesh Data
-            mesh_data = create_static_mesh(ground_decal.cdsp_mesh_file, mesh_index)
+            # Create the Mesh Data with its Material
+            mesh_data = create_shared_static_mesh(
+                ground_decal.cdsp_mesh_file, mesh_index, dir_name, "GroundDecal"
+            )
             # Create the Mesh Object and add the Mesh Data to it
             mesh_object: bpy.types.Object = bpy.data.objects.new(
                 f"GroundDecal{mesh_index}", mesh_data
             )
-            # Create the Material Data
-            material_data = create_material(
-                dir_name,
-                mesh_index,
-                ground_decal.cdsp_mesh_file.meshes[mesh_index],
-                "GroundDecal",
-            )
-            # Assign the Material to the Mesh
-            mesh_data.materials.append(material_data)
             # Material Parameters
             setup_material_parameters(mesh_object, ground_decal, mesh_index)
             # Link the Mesh Object to the Source Collection
@@ -722,9 +757,14 @@ def load_bmg(
                 # Check for file ending (DRS or BMS)
 
                 if slocator.file_name.endswith(".bms"):
-                    bms_file: BMS = BMS().read(
+                    bms_file: BMS = read_file(
                         os.path.join(construction_dir, slocator.file_name)
                     )
+                    # The nested files are only known now, start them before the import needs them
+                    schedule_files(
+                        _state_based_mesh_set_files(bms_file.state_based_mesh_set, construction_dir, import_debris)
+                        + (_animation_set_files(bms_file.animation_set, construction_dir) if import_animation else [])
+                    )
                     module_name = slocator.class_type + "_" + str(slocator.bone_id)
                     import_state_based_mesh_set(
                         bms_file.state_based_mesh_set,
@@ -744,27 +784,21 @@ def load_bmg(
                         "Construction_",
                     )
                 elif slocator.file_name.endswith(".drs"):
-                    drs_file: DRS = DRS().read(
+                    drs_file: DRS = read_file(
                         os.path.join(construction_dir, slocator.file_name)
                     )
                     for mesh_index in range(drs_file.cdsp_mesh_file.mesh_count):
-                        # Create the Mesh Data
-                        mesh_data = create_static_mesh(
-                            drs_file.cdsp_mesh_file, mesh_index
+                        # Create the Mesh Data with its Material, shared by repeated construction parts
+                        mesh_data = create_shared_static_mesh(
+                            drs_file.cdsp_mesh_file,
+                            mesh_index,
+                            construction_dir,
+                            base_name + "_Construction_" + str(mesh_index),
                         )
                         # Create the Mesh Object and add the Mesh Data to it
                         mesh_object: bpy.types.Object = bpy.data.objects.new(
                             f"CDspMeshFile_{slocator.class_type}", mesh_data
                         )
-                        # Create the Material Data
-                        material_data = create_material(
-                            construction_dir,
-                            mesh_index,
-                            drs_file.cdsp_mesh_file.meshes[mesh_index],
-                            base_name + "_Construction_" + str(mesh_index),
-                        )
-                        # Assign the Material to the Mesh
-                        mesh_data.materials.append(material_data)
                         # Apply the Transformations to the Mesh Object
                         mesh_object.matrix_world = local_matrix
                         # Link the Mesh Object to the Source Collection
@@ -792,7 +826,7 @@ def load_bmg(
         with ensure_mode("POSE"):
             for animation_key in bmg_file.animation_set.mode_animation_keys:
                 for variant in animation_key.animation_set_variants:
-                    ska_file: SKA = SKA().read(os.path.join(dir_name, variant.file))
+                    ska_file: SKA = read_file(os.path.join(dir_name, variant.file))
                     # Create the Animation
                     import_ska_animation(
                         ska_file,
@@ -951,8 +985,6 @@ def save_bmg(
             pass
         # TODO: Check if we should support additional types. Maybe they are not used/wrongly exported in existing models
 
-    new_bmg_file.update_offsets()
-
     # === SAVE THE BMG FILE ====================================================
     try:
         new_bmg_file.save(os.path.join(folder_path, model_name + ".drs"))
@@ -14,22 +14,24 @@ from mathutils.kdtree import KDTree
 import bpy
 from bmesh.ops import (
     triangulate as tri,
-    remove_doubles,
     split_edges,
     create_uvsphere,
     create_cone,
 )
-import bmesh
 import numpy as np
 
+from sr_impex.core.decode_scheduler import read_file, schedule_files, with_decode_scheduler
 from sr_impex.core.message_logger import MessageLogger
+from sr_impex.core.oriented_box import fit_oriented_box
+from sr_impex.core.skin_weights import MAX_INFLUENCES, limit_influences, quantize_weights
+from sr_impex.core.welded_geometry import WeldedGeometry, match_positions, weld_meshes
 
 from sr_impex.definitions.animation_definitions import AnimationSet, IKAtlas, AnimationTimings, AnimationTiming, TimingVariant, Timing, AnimationMarkerSet, ModeAnimationKey, AnimationSetVariant, AnimationMarker
 from sr_impex.definitions.skeleton_definitions import BoneMatrix, DRSBone, JointGroup, CSkSkeleton, CSkSkinInfo, BoneWeight, CDspJointMap, Bone, BoneVertex
-from sr_impex.definitions.base_types import Matrix3x3, Vector3, Face, CMatCoordinateSystem, Vector4
+from sr_impex.definitions.base_types import Matrix3x3, Vector3, CMatCoordinateSystem
 from sr_impex.definitions.locator_definitions import SLocator, CDrwLocatorList
 from sr_impex.definitions.effect_definitions import EffectSet
-from sr_impex.definitions.mesh_definitions import BattleforgeMesh, CDspMeshFile, CGeoMesh, MeshData, Vertex, Texture, LevelOfDetail, EmptyString, Refraction, Flow, Textures, VertexData, Materials
+from sr_impex.definitions.mesh_definitions import VERTEX_DTYPES, BattleforgeMesh, CDspMeshFile, CGeoMesh, MeshData, Texture, LevelOfDetail, EmptyString, Refraction, Flow, Textures, Materials
 from sr_impex.definitions.collision_definitions import CollisionShape, BoxShape, SphereShape, CylinderShape, CGeoAABox, CGeoSphere, CGeoCylinder
 from sr_impex.definitions.obb_definitions import CGeoOBBTree, OBBNode
 from sr_impex.definitions.resource_definitions import Constraint, DrwResourceMeta
@@ -44,12 +46,14 @@ from sr_impex.blender.transform_utils import (
     create_empty,
     get_conversion_matrix,
 )
+from sr_impex.blender.adapters import to_matrix, to_vector
 from sr_impex.blender.drs_material import DRSMaterial
+from sr_impex.blender.instancing import locator_marker_mesh, shared_mesh, with_mesh_instancing
 from sr_impex.blender.bmesh_utils import new_bmesh_from_object, edit_bmesh_from_object, new_bmesh
-from sr_impex.blender.animation_utils import import_ska_animation
+from sr_impex.blender.animation_utils import DEFERRED_ACTION_PROP, fill_ska_action, import_ska_animation
 from sr_impex.blender.control_rig import apply_joint_display, build_control_rig
 from sr_impex.blender.editors.locator_editor import BLOB_KEY, UID_KEY, blob_to_cdrw
-from sr_impex.blender.editors.animation_set_editor import ANIM_BLOB_KEY
+from sr_impex.blender.editors.animation_set_editor import ANIM_BLOB_KEY, DEFERRED_ANIMATIONS_KEY
 from sr_impex.blender.editors.effect_set_editor import (
     effectset_to_blob as _effectset_to_blob,
     blob_to_effectset as _blob_to_effectset,
@@ -69,6 +73,7 @@ except Exception:
 
 TOL_DIGITS = 6  # ~1e-6 (your original rounding)
 KD_TOL = 1e-5  # tolerant fallback for welded/shifted verts
+MAX_GAME_VERTICES = 32767  # per mesh and for the unified mesh
 MIN_TRIS = 12
 MAX_DEPTH = 32
 
@@ -410,6 +415,101 @@ def persist_animset_blob_on_collection(
     return blob
 
 
+def _read_animset_blob(source_collection: bpy.types.Collection) -> dict | None:
+    raw = source_collection.get(ANIM_BLOB_KEY)
+    if not isinstance(raw, str) or not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def record_deferred_animations(
+    source_collection: bpy.types.Collection,
+    actions: Dict[str, str],
+    drs_path: str,
+    smooth_animation: bool,
+) -> None:
+    """
+    Record Actions created without curves (action name -> SKA path) in the AnimationSet blob,
+    together with the DRS whose skeleton the curves are built against.
+    """
+    blob = _read_animset_blob(source_collection)
+    if blob is None:
+        blob = {}
+    entries = blob.setdefault(DEFERRED_ANIMATIONS_KEY, {})
+    for action_name, ska_path in actions.items():
+        entries[action_name] = {"ska": ska_path, "drs": drs_path, "smooth": bool(smooth_animation)}
+    source_collection[ANIM_BLOB_KEY] = json.dumps(
+        blob, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _deform_armature(collection: bpy.types.Collection) -> bpy.types.Object | None:
+    for obj in collection.all_objects:
+        if obj.type == "ARMATURE" and "Control_Rig" not in obj.name:
+            return obj
+    return None
+
+
+def materialize_deferred_action(
+    action_name: str, source_collection: bpy.types.Collection | None = None
+) -> bool:
+    """
+    Build the curves of an Action recorded by record_deferred_animations().
+
+    Without a collection every DRSModel_* collection is searched for the reference.
+    Returns True if curves were built. If the recorded DRS or SKA file cannot be read
+    (e.g. the game files moved) the Action is left deferred and a warning is logged.
+    """
+    action = bpy.data.actions.get(action_name)
+    if action is None or not action.get(DEFERRED_ACTION_PROP):
+        return False
+    if source_collection is not None:
+        candidates = [source_collection]
+    else:
+        candidates = [col for col in bpy.data.collections if col.name.startswith("DRSModel_")]
+    for collection in candidates:
+        blob = _read_animset_blob(collection)
+        entries = (blob or {}).get(DEFERRED_ANIMATIONS_KEY) or {}
+        entry = entries.get(action_name)
+        if entry is None:
+            continue
+        armature_object = _deform_armature(collection)
+        if armature_object is None:
+            return False
+        try:
+            drs_file: DRS = read_file(entry["drs"])
+            ska_file = read_file(entry["ska"])
+        except (OSError, ValueError) as e:
+            missing = getattr(e, "filename", None) or f"{entry['drs']} / {entry['ska']}"
+            logger.log(
+                f"Animation {action_name} could not be built, {missing} is not readable: {e}",
+                "Deferred Animation",
+                "WARNING",
+            )
+            return False
+        bone_list = init_bones(drs_file.csk_skeleton)
+        record_bind_pose(bone_list, armature_object.data)
+        fill_ska_action(action, ska_file, armature_object, bone_list, entry.get("smooth", True))
+        del entries[action_name]
+        if not entries:
+            del blob[DEFERRED_ANIMATIONS_KEY]
+        collection[ANIM_BLOB_KEY] = json.dumps(
+            blob, separators=(",", ":"), ensure_ascii=False
+        )
+        return True
+    return False
+
+
+def materialize_deferred_actions(source_collection: bpy.types.Collection) -> int:
+    """Build the curves of every deferred Action of a model; returns how many were built."""
+    blob = _read_animset_blob(source_collection)
+    names = list(((blob or {}).get(DEFERRED_ANIMATIONS_KEY) or {}).keys())
+    return sum(materialize_deferred_action(name, source_collection) for name in names)
+
+
 def triangulate(meshes_collection: bpy.types.Collection) -> None:
     for obj in meshes_collection.objects:
         if obj.type == "MESH":
@@ -417,32 +517,26 @@ def triangulate(meshes_collection: bpy.types.Collection) -> None:
                 tri(bm, faces=bm.faces[:])  # pylint: disable=E1111, E1120
 
 
-def verify_mesh_vertex_count(meshes_collection: bpy.types.Collection) -> bool:
+def verify_mesh_vertex_count(meshes_collection: bpy.types.Collection, geometry: WeldedGeometry) -> bool:
     """Check if the Models are valid for the game. This includes the following checks:
-    - Check if the Meshes have more than 32767 Vertices"""
-    with new_bmesh() as unified_mesh:
-        for obj in meshes_collection.objects:
-            if obj.type == "MESH":
-                if len(obj.data.vertices) > 32767:
-                    logger.log(
-                        f"Mesh '{obj.name}' has more than 32767 Vertices. This is not supported by the game.",
-                        "Error",
-                        "ERROR",
-                    )
-                    return False
-                unified_mesh.from_mesh(obj.data)
-
-        unified_mesh.verts.ensure_lookup_table()
-        unified_mesh.verts.index_update()
-        remove_doubles(unified_mesh, verts=unified_mesh.verts, dist=1e-6)
+    - Check if the Meshes or their welded geometry have more than MAX_GAME_VERTICES Vertices"""
+    for obj in meshes_collection.objects:
+        if obj.type == "MESH":
+            if len(obj.data.vertices) > MAX_GAME_VERTICES:
+                logger.log(
+                    f"Mesh '{obj.name}' has more than {MAX_GAME_VERTICES} Vertices. This is not supported by the game.",
+                    "Error",
+                    "ERROR",
+                )
+                return False
 
-        if len(unified_mesh.verts) > 32767:
-            logger.log(
-                "The unified Mesh has more than 32767 Vertices. This is not supported by the game.",
-                "Error",
-                "ERROR",
-            )
-            return False
+    if geometry.vertex_count > MAX_GAME_VERTICES:
+        logger.log(
+            f"The unified Mesh has more than {MAX_GAME_VERTICES} Vertices. This is not supported by the game.",
+            "Error",
+            "ERROR",
+        )
+        return False
 
     return True
 
@@ -631,7 +725,7 @@ def load_static_bms_module(
     # if filename has .module extension replace it with bms
     if file_name.endswith(".module"):
         file_name = file_name.replace(".module", ".bms")
-    bms_file: BMS = BMS().read(os.path.join(dir_name, file_name))
+    bms_file: BMS = read_file(os.path.join(dir_name, file_name))
 
     if bms_file.state_based_mesh_set is None:
         logger.log(
@@ -655,7 +749,7 @@ def load_static_bms_module(
         )
 
     for mesh_state in bms_file.state_based_mesh_set.mesh_states:
-        drs_file = DRS().read(os.path.join(dir_name, mesh_state.drs_file))
+        drs_file = read_file(os.path.join(dir_name, mesh_state.drs_file))
         mesh_object, _ = create_mesh_object(
             drs_file, 0, dir_name, f"State_{mesh_state.state_num}", None
         )
@@ -673,7 +767,7 @@ def load_animated_bms_module(
     # if filename has .module extension replace it with bms
     if file_name.endswith(".module"):
         file_name = file_name.replace(".module", ".bms")
-    bms_file: BMS = BMS().read(os.path.join(dir_name, file_name))
+    bms_file: BMS = read_file(os.path.join(dir_name, file_name))
 
     if bms_file.state_based_mesh_set is None:
         logger.log(
@@ -695,7 +789,7 @@ def load_animated_bms_module(
         )
 
     for mesh_state in bms_file.state_based_mesh_set.mesh_states:
-        drs_file = DRS().read(os.path.join(dir_name, mesh_state.drs_file))
+        drs_file = read_file(os.path.join(dir_name, mesh_state.drs_file))
         armature_object, bone_list = setup_armature(
             mesh_state_collection, drs_file, "Locator_Wheel_"
         )
@@ -714,7 +808,7 @@ def load_animated_bms_module(
             with ensure_mode("POSE"):
                 for animation_key in drs_file.animation_set.mode_animation_keys:
                     for variant in animation_key.animation_set_variants:
-                        ska_file: SKA = SKA().read(os.path.join(dir_name, variant.file))
+                        ska_file: SKA = read_file(os.path.join(dir_name, variant.file))
                         # Create the Animation
                         import_ska_animation(
                             ska_file,
@@ -736,7 +830,7 @@ def load_turret_animation(
     bone_list: List[DRSBone],
     smooth_animation,
 ):
-    ska_file: SKA = SKA().read(os.path.join(dir_name, file_name))
+    ska_file: SKA = read_file(os.path.join(dir_name, file_name))
     # Create the Animation
     import_ska_animation(
         ska_file,
@@ -775,8 +869,8 @@ def process_slocator_import(
     stable_uid = hashlib.sha1(key.encode("utf-8")).hexdigest()
 
     # Convert locator local transform
-    local_offset = Vector(slocator.cmat_coordinate_system.position.xyz)
-    local_rot = Matrix(slocator.cmat_coordinate_system.matrix.math_matrix)
+    local_offset = to_vector(slocator.cmat_coordinate_system.position)
+    local_rot = to_matrix(slocator.cmat_coordinate_system.matrix)
 
     # Default world transform (used if no bone is attached)
     world_loc = local_offset.copy()
@@ -822,12 +916,9 @@ def process_slocator_import(
                 print(
                     f"Warning [process_slocator_import]: Could not load effect {slocator.file_name}: {e}"
                 )
-        # Create visual sphere for locator
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.1, location=(0, 0, 0))
-        locator_object = bpy.context.object
-        locator_object.name = f"Locator_{slocator.class_type}"
+        # Visual sphere for the locator, all markers share one mesh
+        locator_object = bpy.data.objects.new(f"Locator_{slocator.class_type}", locator_marker_mesh())
         source_collection.objects.link(locator_object)
-        bpy.context.collection.objects.unlink(locator_object)
 
         # If this is an FXB effect, try to load and visualize it
         # if slocator.file_name.lower().endswith('.fxb') and locator_object:
@@ -1953,13 +2044,14 @@ def add_skin_weights_to_mesh(
 
     skined_vertices_data = next(
         (
-            mesh.vertices
+            mesh.vertex_array()
             for mesh in cdsp_mesh_file_data.mesh_data
             if mesh.revision == 12
         ),
+        None,
     )
 
-    if not skined_vertices_data:
+    if skined_vertices_data is None or len(skined_vertices_data) == 0:
         logger.log(
             f"Mesh {mesh_object.name} does not have skin weights.",
             "Info",
@@ -1967,18 +2059,47 @@ def add_skin_weights_to_mesh(
         )
         return
 
-    for vertex_index, vertex in enumerate(skined_vertices_data):
-        for i in range(4):
-            if vertex.raw_weights[i] > 0:
-                joint_index = vertex.bone_indices[i]
-                bone_index = joint_group.joints[joint_index]
-                bone_name = armature_object.data.bones[bone_index].name
-                if bone_name not in mesh_object.vertex_groups:
-                    vertex_group = mesh_object.vertex_groups.new(name=bone_name)
-                    vertex_group.add([vertex_index], vertex.raw_weights[i] / 255, "ADD")
-                else:
-                    vertex_group = mesh_object.vertex_groups[bone_name]
-                    vertex_group.add([vertex_index], vertex.raw_weights[i] / 255, "ADD")
+    # One entry per (vertex, influence) with a weight, in vertex order
+    raw_weights = skined_vertices_data["raw_weights"].astype(np.int64).reshape(-1)
+    joint_indices = skined_vertices_data["bone_indices"].astype(np.int64).reshape(-1)
+    influences = np.flatnonzero(raw_weights > 0)
+    if len(influences) == 0:
+        return
+    vertex_indices = influences // 4
+    bone_indices = np.asarray(joint_group.joints, dtype=np.int64)[joint_indices[influences]]
+    raw_weights = raw_weights[influences]
+
+    # Influences of one vertex on the same bone add up, as repeated "ADD" calls would
+    bone_count = int(bone_indices.max()) + 1
+    pairs, first, inverse = np.unique(
+        vertex_indices * bone_count + bone_indices, return_index=True, return_inverse=True
+    )
+    pair_weights = np.bincount(inverse.reshape(-1), weights=raw_weights).astype(np.int64)
+    pair_vertices, pair_bones = pairs // bone_count, pairs % bone_count
+
+    # Vertex groups are created in the order their bones are first used
+    first_use = np.full(bone_count, len(raw_weights), dtype=np.int64)
+    np.minimum.at(first_use, pair_bones, first)
+    used_bones = np.flatnonzero(first_use < len(raw_weights))
+    used_bones = used_bones[np.argsort(first_use[used_bones], kind="stable")]
+    vertex_groups = {}
+    bone_names = armature_object.data.bones
+    for bone_index in used_bones.tolist():
+        bone_name = bone_names[bone_index].name
+        vertex_group = mesh_object.vertex_groups.get(bone_name)
+        if vertex_group is None:
+            vertex_group = mesh_object.vertex_groups.new(name=bone_name)
+        vertex_groups[bone_index] = vertex_group
+
+    # One add() per (bone, quantized weight) group
+    order = np.lexsort((pair_vertices, pair_weights, pair_bones))
+    group_keys = pair_bones[order] * 1024 + pair_weights[order]
+    starts = np.flatnonzero(np.r_[True, group_keys[1:] != group_keys[:-1]])
+    for start, end in zip(starts.tolist(), np.r_[starts[1:], len(order)].tolist()):
+        pair = order[start]
+        vertex_groups[int(pair_bones[pair])].add(
+            pair_vertices[order[start:end]].tolist(), min(int(pair_weights[pair]) / 255, 1.0), "ADD"
+        )
 
 
 def record_bind_pose(bone_list: list[DRSBone], armature: bpy.types.Armature) -> None:
@@ -2199,49 +2320,47 @@ def import_csk_skeleton(
 def create_bone_weights(
     mesh_file: CDspMeshFile, skin_data: CSkSkinInfo, geo_mesh_data: CGeoMesh
 ) -> list[BoneWeight]:
-    total_vertex_count = sum(mesh.vertex_count for mesh in mesh_file.meshes)
-    bone_weights = [BoneWeight() for _ in range(total_vertex_count)]
     vertex_positions = [
-        vertex.position
+        tuple(position)
         for mesh in mesh_file.meshes
-        for vertex in mesh.mesh_data[0].vertices
-    ]
-    geo_mesh_positions = [
-        [vertex.x, vertex.y, vertex.z] for vertex in geo_mesh_data.vertices
+        for position in mesh.mesh_data[0].vertex_array()["position"].tolist()
     ]
-
-    for index, check in enumerate(vertex_positions):
-        j = geo_mesh_positions.index(check)
-        bone_weights[index] = BoneWeight(
-            skin_data.vertex_data[j].bone_indices, skin_data.vertex_data[j].weights
-        )
+    # First CGeoMesh vertex at each position, like list.index() would find it
+    geo_mesh_index: Dict[tuple, int] = {}
+    for j, position in enumerate(CGeoMesh.vertices.array(geo_mesh_data)[:, :3].tolist()):
+        geo_mesh_index.setdefault(tuple(position), j)
+
+    skin_bone_indices = skin_data.bone_indices.tolist()
+    skin_weights = skin_data.weights.tolist()
+    bone_weights = []
+    for position in vertex_positions:
+        j = geo_mesh_index.get(position)
+        if j is None:
+            raise ValueError(f"Vertex {position} is not part of the CGeoMesh")
+        bone_weights.append(BoneWeight(skin_bone_indices[j], skin_weights[j]))
 
     return bone_weights
 
 
-def create_static_mesh(mesh_file: CDspMeshFile, mesh_index: int) -> bpy.types.Mesh:
-    battleforge_mesh_data: BattleforgeMesh = mesh_file.meshes[mesh_index]
-    # _name = override_name if (override_name != '') else f"State_{i}" if (state == True) else f"{i}"
-    mesh_data = bpy.data.meshes.new(f"MeshData_{mesh_index}")
-
-    vertices = list()
-    faces = list()
-    normals = list()
-    uv_list = list()
-
-    for _ in range(battleforge_mesh_data.face_count):
-        face = battleforge_mesh_data.faces[_].indices
-        faces.append([face[0], face[1], face[2]])
-
-    for _ in range(battleforge_mesh_data.vertex_count):
-        vertex = battleforge_mesh_data.mesh_data[0].vertices[_]
-        vertices.append(vertex.position)
-        normals.append(vertex.normal)
-        # Negate the UVs Y Axis before adding them
-        uv_list.append((vertex.texture[0], -vertex.texture[1]))
+def fill_triangle_mesh(mesh_data: bpy.types.Mesh, positions: np.ndarray, triangles: np.ndarray) -> None:
+    """Fill an empty mesh from an (N, 3) position array and an (M, 3) triangle index array.
 
-    mesh_data.from_pydata(vertices, [], faces)
-    mesh_data.polygons.foreach_set("use_smooth", [True] * len(mesh_data.polygons))
+    The buffers are copied with foreach_set; the faces are smooth shaded like from_pydata + use_smooth.
+    """
+    positions = np.ascontiguousarray(positions, dtype=np.float32)
+    loop_vertices = np.ascontiguousarray(triangles, dtype=np.int32).reshape(-1)
+    face_count = len(loop_vertices) // 3
+
+    mesh_data.vertices.add(len(positions))
+    mesh_data.vertices.foreach_set("co", positions.reshape(-1))
+    mesh_data.loops.add(len(loop_vertices))
+    mesh_data.loops.foreach_set("vertex_index", loop_vertices)
+    mesh_data.polygons.add(face_count)
+    mesh_data.polygons.foreach_set("loop_start", np.arange(0, len(loop_vertices), 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):  # loop_total is derived from loop_start since 4.0
+        mesh_data.polygons.foreach_set("loop_total", np.full(face_count, 3, dtype=np.int32))
+    mesh_data.polygons.foreach_set("use_smooth", np.ones(face_count, dtype=bool))
+    mesh_data.update(calc_edges=True)
     if bpy.app.version[:2] in [
         (3, 3),
         (3, 4),
@@ -2251,17 +2370,28 @@ def create_static_mesh(mesh_file: CDspMeshFile, mesh_index: int) -> bpy.types.Me
     ]:  # pylint: disable=unsubscriptable-object
         mesh_data.use_auto_smooth = True
 
-    custom_normals = [normals[loop.vertex_index] for loop in mesh_data.loops]
-    mesh_data.normals_split_custom_set(custom_normals)
+
+def create_static_mesh(mesh_file: CDspMeshFile, mesh_index: int) -> bpy.types.Mesh:
+    battleforge_mesh_data: BattleforgeMesh = mesh_file.meshes[mesh_index]
+    mesh_data = bpy.data.meshes.new(f"MeshData_{mesh_index}")
+
+    triangles = BattleforgeMesh.faces.array(battleforge_mesh_data)
+    vertex_array = battleforge_mesh_data.mesh_data[0].vertex_array()
+    fill_triangle_mesh(mesh_data, vertex_array["position"], triangles)
+
+    # Custom normals are per vertex in the DRS, Blender maps them onto the loops
+    if "normal" in vertex_array.dtype.names:
+        normals = np.ascontiguousarray(vertex_array["normal"], dtype=np.float32)
+    else:
+        normals = np.zeros((len(vertex_array), 3), dtype=np.float32)
+    mesh_data.normals_split_custom_set_from_vertices(normals)
     mesh_data.update()
 
-    uv_list = [
-        i
-        for poly in mesh_data.polygons
-        for vidx in poly.vertices
-        for i in uv_list[vidx]
-    ]
-    mesh_data.uv_layers.new().data.foreach_set("uv", uv_list)
+    # Negate the UVs Y Axis before adding them
+    uvs = vertex_array["texture"].astype(np.float32)
+    uvs[:, 1] *= -1.0
+    loop_uvs = uvs[np.asarray(triangles, dtype=np.intp).reshape(-1)]
+    mesh_data.uv_layers.new().data.foreach_set("uv", loop_uvs.reshape(-1))
 
     return mesh_data
 
@@ -2279,6 +2409,21 @@ def import_cdsp_mesh_file(
     return mesh_object, mesh_data
 
 
+def create_shared_static_mesh(
+    mesh_file: CDspMeshFile, mesh_index: int, dir_name: str, base_name: str
+) -> bpy.types.Mesh:
+    """create_static_mesh plus its material, built once per import for each mesh of a mesh file."""
+
+    def build() -> bpy.types.Mesh:
+        mesh_data = create_static_mesh(mesh_file, mesh_index)
+        mesh_data.materials.append(
+            create_material(dir_name, mesh_index, mesh_file.meshes[mesh_index], base_name)
+        )
+        return mesh_data
+
+    return shared_mesh(mesh_file, mesh_index, dir_name, build)
+
+
 def create_mesh_object(
     drs_file: DRS,
     mesh_index: int,
@@ -2286,21 +2431,29 @@ def create_mesh_object(
     base_name,
     armature_object=None,
 ):
-    # Create the mesh data using your existing helper.
-    mesh_data = create_static_mesh(drs_file.cdsp_mesh_file, mesh_index)
-
-    # Create the mesh object.
-    mesh_object = bpy.data.objects.new(f"CDspMeshFile_{mesh_index}", mesh_data)
-
     # Add skin weights if available ==> any of drs_file.cdsp_mesh_file.meshes[mesh_index].mesh_data[n].revision == 12
-    if (
+    skinned = bool(
         drs_file.csk_skin_info
         and any(
             mesh.revision == 12
             for mesh in drs_file.cdsp_mesh_file.meshes[mesh_index].mesh_data
         )
         and armature_object
-    ):
+    )
+
+    # Skinned meshes carry their own weights, everything else is shared between repeated uses
+    if skinned:
+        mesh_data = create_static_mesh(drs_file.cdsp_mesh_file, mesh_index)
+        mesh_data.materials.append(
+            create_material(dir_name, mesh_index, drs_file.cdsp_mesh_file.meshes[mesh_index], base_name)
+        )
+    else:
+        mesh_data = create_shared_static_mesh(drs_file.cdsp_mesh_file, mesh_index, dir_name, base_name)
+
+    # Create the mesh object.
+    mesh_object = bpy.data.objects.new(f"CDspMeshFile_{mesh_index}", mesh_data)
+
+    if skinned:
         add_skin_weights_to_mesh(
             mesh_object,
             drs_file.cdsp_mesh_file.meshes[mesh_index],
@@ -2313,11 +2466,7 @@ def create_mesh_object(
         modifier = mesh_object.modifiers.new(type="ARMATURE", name="Armature")
         modifier.object = armature_object
 
-    # Create and assign material.
-    material = create_material(
-        dir_name, mesh_index, drs_file.cdsp_mesh_file.meshes[mesh_index], base_name, mesh_object
-    )
-    mesh_data.materials.append(material)
+    DRSMaterial.create_wind_nodes(mesh_object)
 
     return mesh_object, mesh_data
 
@@ -2676,27 +2825,9 @@ def import_animation_ik_atlas(
 def import_cgeo_mesh(cgeo_mesh: CGeoMesh, collection: bpy.types.Collection) -> None:
     start_time = time.time()
     cgeo_mesh_mesh = bpy.data.meshes.new("CGeoMesh")
-    vertices = list()
-    faces = list()
-
-    for face in cgeo_mesh.faces:
-        faces.append([face.indices[0], face.indices[1], face.indices[2]])
-
-    for vertex in cgeo_mesh.vertices:
-        vertices.append([vertex.x, vertex.y, vertex.z])
-
-    cgeo_mesh_mesh.from_pydata(vertices, [], faces)
-    cgeo_mesh_mesh.polygons.foreach_set(
-        "use_smooth", [True] * len(cgeo_mesh_mesh.polygons)
+    fill_triangle_mesh(
+        cgeo_mesh_mesh, CGeoMesh.vertices.array(cgeo_mesh)[:, :3], CGeoMesh.faces.array(cgeo_mesh)
     )
-    if bpy.app.version[:2] in [
-        (3, 3),
-        (3, 4),
-        (3, 5),
-        (3, 6),
-        (4, 0),
-    ]:  # pylint: disable=unsubscriptable-object
-        cgeo_mesh_mesh.use_auto_smooth = True
 
     cgeo_mesh_object = bpy.data.objects.new("CGeoMesh", cgeo_mesh_mesh)
     cgeo_mesh_object.display_type = "WIRE"
@@ -2877,6 +3008,8 @@ def import_bounding_box(
     logger.log(f"AABB Bounding Box creation took {end_time - start_time:.2f} seconds.")
 
 
+@with_decode_scheduler
+@with_mesh_instancing
 def load_drs(
     context: bpy.types.Context,
     filepath="",
@@ -2893,11 +3026,12 @@ def load_drs(
     limit_obb_depth=5,
     import_bb=False,
     import_environment_cubemap=True,
+    defer_animations=False,
 ):
     start_time = time.time()
     base_name = os.path.basename(filepath).split(".")[0]
     dir_name = os.path.dirname(filepath)
-    drs_file: DRS = DRS().read(filepath)
+    drs_file: DRS = read_file(filepath)
 
     source_collection: bpy.types.Collection = bpy.data.collections.new(
         "DRSModel_" + base_name
@@ -2933,6 +3067,20 @@ def load_drs(
         and import_animation
     ):
         referenced_animation_files: set[str] = set()
+        # Action name -> SKA path of animations whose curves are built on first use
+        deferred: Dict[str, str] = {}
+        if defer_animations:
+            # Deferred Actions only need the timing fields; the keyframes are decoded on first use
+            def read_ska(path: str) -> SKA:
+                return SKA().read_header(path)
+        else:
+            read_ska = read_file
+            # Decode the referenced animations in worker processes while the actions are built
+            schedule_files(
+                os.path.join(dir_name, variant.file)
+                for animation_key in drs_file.animation_set.mode_animation_keys
+                for variant in animation_key.animation_set_variants
+            )
         with ensure_mode("POSE"):
             for animation_key in drs_file.animation_set.mode_animation_keys:
                 for variant in animation_key.animation_set_variants:
@@ -2947,9 +3095,9 @@ def load_drs(
                             "WARNING",
                         )
                         continue
-                    ska_file: SKA = SKA().read(os.path.join(dir_name, variant.file))
+                    ska_file: SKA = read_ska(os.path.join(dir_name, variant.file))
                     # Create the Animation
-                    import_ska_animation(
+                    action = import_ska_animation(
                         ska_file,
                         armature_object,
                         bone_list,
@@ -2957,7 +3105,10 @@ def load_drs(
                         smooth_animation,
                         filepath,
                         map_collection=source_collection,
+                        build_curves=not defer_animations,
                     )
+                    if action is not None and action.get(DEFERRED_ACTION_PROP):
+                        deferred[action.name] = os.path.join(dir_name, variant.file)
 
             if import_all_supported_animations:
                 additional_loaded: list[str] = []
@@ -2975,17 +3126,21 @@ def load_drs(
                     )
                     ska_candidates = []
 
-                for file_name in sorted(ska_candidates, key=str.lower):
-                    if file_name.lower() in referenced_animation_files:
-                        continue
-
+                ska_candidates = [
+                    file_name
+                    for file_name in sorted(ska_candidates, key=str.lower)
+                    if file_name.lower() not in referenced_animation_files
+                ]
+                if not defer_animations:
+                    schedule_files(os.path.join(dir_name, file_name) for file_name in ska_candidates)
+                for file_name in ska_candidates:
                     full_path = os.path.join(dir_name, file_name)
                     if not os.path.isfile(full_path):
                         continue
 
                     try:
-                        ska_file = SKA().read(full_path)
-                        import_ska_animation(
+                        ska_file = read_ska(full_path)
+                        action = import_ska_animation(
                             ska_file,
                             armature_object,
                             bone_list,
@@ -2993,7 +3148,10 @@ def load_drs(
                             smooth_animation,
                             filepath,
                             map_collection=source_collection,
+                            build_curves=not defer_animations,
                         )
+                        if action is not None and action.get(DEFERRED_ACTION_PROP):
+                            deferred[action.name] = full_path
                         additional_loaded.append(file_name)
                     except Exception as exc:
                         logger.log(
@@ -3010,6 +3168,9 @@ def load_drs(
                         "INFO",
                     )
 
+        if deferred:
+            record_deferred_animations(source_collection, deferred, filepath, smooth_animation)
+
     if (
         import_ik_atlas
         and drs_file.csk_skeleton is not None
@@ -3117,235 +3278,62 @@ def load_drs(
 # region Export Blender Model to DRS
 
 
-def create_unified_mesh(meshes_collection: bpy.types.Collection) -> bpy.types.Mesh:
-    """Create a unified Mesh from a Collection of Meshes."""
-
-    with new_bmesh() as bm_out:
-        for obj in meshes_collection.objects:
-            if obj.type != "MESH":
-                continue
-
-            # Build a temporary BMesh from the object's raw mesh in object-local space.
-            bm_tmp = bmesh.new()
-            bm_tmp.from_mesh(obj.data)
-            # Intentionally do not apply obj.matrix_world here.
-
-            # Pipe into the output BMesh
-            tmp_me = bpy.data.meshes.new(name="__tmp__")
-            bm_tmp.to_mesh(tmp_me)
-            bm_tmp.free()
-
-            bm_out.from_mesh(tmp_me)
-            bpy.data.meshes.remove(tmp_me)
-
-        # Weld tiny duplicates after the transform
-        bm_out.verts.ensure_lookup_table()
-        remove_doubles(bm_out, verts=bm_out.verts, dist=1e-6)
+def create_welded_geometry(meshes_collection: bpy.types.Collection) -> WeldedGeometry:
+    """Weld the triangles of all Meshes of a Collection into one geometry, in object-local space."""
 
-        # Bake to a new Mesh
-        unified = bpy.data.meshes.new("unified_mesh")
-        bm_out.to_mesh(unified)
+    def mesh_arrays(obj: bpy.types.Object) -> Tuple[np.ndarray, np.ndarray]:
+        mesh = obj.data
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        mesh.calc_loop_triangles()
+        triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", triangles)
+        return positions, triangles
 
-    return unified
+    # Intentionally do not apply obj.matrix_world here.
+    return weld_meshes(
+        (mesh_arrays(obj) for obj in meshes_collection.objects if obj.type == "MESH"),
+        TOL_DIGITS,
+    )
 
 
-def create_cgeo_mesh(unique_mesh: bpy.types.Mesh) -> CGeoMesh:
-    """Create a CGeoMesh from a Blender Mesh Object."""
+def create_cgeo_mesh(geometry: WeldedGeometry) -> CGeoMesh:
+    """Create a CGeoMesh from the welded geometry."""
     _cgeo_mesh = CGeoMesh()
-    _cgeo_mesh.index_count = len(unique_mesh.polygons) * 3
-    _cgeo_mesh.vertex_count = len(unique_mesh.vertices)
-    _cgeo_mesh.faces = []
-    _cgeo_mesh.vertices = []
-
-    for _face in unique_mesh.polygons:
-        new_face = Face()
-        new_face.indices = [_face.vertices[0], _face.vertices[1], _face.vertices[2]]
-        _cgeo_mesh.faces.append(new_face)
-
-    for _vertex in unique_mesh.vertices:
-        _cgeo_mesh.vertices.append(
-            Vector4(_vertex.co.x, _vertex.co.y, _vertex.co.z, 1.0)
-        )
+    _cgeo_mesh.index_count = geometry.triangle_count * 3
+    _cgeo_mesh.vertex_count = geometry.vertex_count
+    _cgeo_mesh.face_indices = geometry.triangles.astype("<u2")
+
+    positions = np.ones((_cgeo_mesh.vertex_count, 4), dtype="<f4")
+    positions[:, :3] = geometry.positions
+    _cgeo_mesh.position_array = positions
 
     return _cgeo_mesh
 
 
-def create_cgeo_obb_tree(unified_mesh: bpy.types.Mesh) -> CGeoOBBTree:
-    unified_mesh.calc_loop_triangles()
-    vcount = len(unified_mesh.vertices)
-    verts = np.empty(vcount * 3, dtype=np.float64)
-    unified_mesh.vertices.foreach_get("co", verts)
-    verts = verts.reshape(vcount, 3)
-    tris = np.array(
-        [lt.vertices[:] for lt in unified_mesh.loop_triangles], dtype=np.int32
-    )
+def create_cgeo_obb_tree(geometry: WeldedGeometry) -> CGeoOBBTree:
+    verts = geometry.positions
+    tris = geometry.triangles
     tri_count = len(tris)
     if tri_count == 0:
         tree = CGeoOBBTree()
         tree.matrix_count = 0
         tree.obb_nodes = []
         tree.triangle_count = 0
-        tree.faces = []
+        tree.face_indices = np.zeros((0, 3), dtype="<u2")
         return tree
 
     tri_centroids = verts[tris].mean(axis=1)
 
-    def volume_from_axes(points: np.ndarray, aaaaa: np.ndarray):
-        pp = points @ aaaaa
-        mn = pp.min(axis=0)
-        mx = pp.max(axis=0)
-        e = 0.5 * (mx - mn)
-        return float(8.0 * e[0] * e[1] * e[2])
-
-    def pca_axes(points: np.ndarray):
-        c = points.mean(axis=0)
-        xx = points - c
-        _uu, _ss, vt = np.linalg.svd(xx, full_matrices=False)
-        aa = vt.T
-        if np.linalg.det(aa) < 0:
-            aa[:, 2] *= -1.0
-        return aa
-
-    def rodrigues(w):
-        t = np.linalg.norm(w)
-        if t < 1e-12:
-            return np.eye(3)
-        k = w / t
-        kk = np.array(
-            [[0, -k[2], k[1]], [k[2], 0, -k[0]], [-k[1], k[0], 0]], dtype=np.float64
-        )
-        return np.eye(3) + np.sin(t) * kk + (1 - np.cos(t)) * (kk @ kk)
-
-    def nm_simplex(func, x0, step, iters):
-        x = np.array(
-            [
-                x0,
-                x0 + np.array([step, 0, 0]),
-                x0 + np.array([0, step, 0]),
-                x0 + np.array([0, 0, step]),
-            ],
-            dtype=np.float64,
-        )
-        fx = np.array([func(xi) for xi in x], dtype=np.float64)
-        for _ in range(iters):
-            order = np.argsort(fx)
-            x = x[order]
-            fx = fx[order]
-            c = x[:3].mean(axis=0)
-            xr = c + (c - x[3])
-            fr = func(xr)
-            if fr < fx[0]:
-                xe = c + 2 * (xr - c)
-                fe = func(xe)
-                x[3], fx[3] = (xe, fe) if fe < fr else (xr, fr)
-            elif fr < fx[2]:
-                x[3], fx[3] = xr, fr
-            else:
-                xc = c + 0.5 * (x[3] - c)
-                fc = func(xc)
-                if fc < fx[3]:
-                    x[3], fx[3] = xc, fc
-                else:
-                    x[1:] = x[0] + 0.5 * (x[1:] - x[0])
-                    fx[1:] = np.array([func(xi) for xi in x[1:]])
-        order = np.argsort(fx)
-        return x[order][0], fx[order][0]
-
-    def hybbrid_orientation(points: np.ndarray):
-        # Seeds: PCA, identity, plus up to two hull feature frames.
-        bm = bmesh.new()
-        for p in points:
-            bm.verts.new((float(p[0]), float(p[1]), float(p[2])))
-        bm.verts.ensure_lookup_table()
-        bmesh.ops.convex_hull(bm, input=bm.verts[:])
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        hh = np.array([v.co[:] for v in bm.verts], dtype=np.float64)
-        normals = [
-            np.array(f.normal[:], dtype=np.float64)
-            for f in bm.faces
-            if f.normal.length > 1e-12
-        ]
-        edges = []
-        for e in bm.edges:
-            d = hh[e.verts[1].index] - hh[e.verts[0].index]
-            n = np.linalg.norm(d)
-            if n > 1e-9:
-                edges.append(d / n)
-        bm.free()
-
-        seeds = [pca_axes(points), np.eye(3)]
-        if normals:
-            z = normals[0] / (np.linalg.norm(normals[0]) + 1e-30)
-            if edges:
-                t = edges[0]
-                u = t - z * (t @ z)
-                if np.linalg.norm(u) > 1e-9:
-                    u /= np.linalg.norm(u)
-                    v = np.cross(z, u)
-                    seeds.append(np.column_stack([u, v, z]))
-        if len(normals) > 1:
-            z = normals[-1] / (np.linalg.norm(normals[-1]) + 1e-30)
-            if edges:
-                t = edges[-1]
-                u = t - z * (t @ z)
-                if np.linalg.norm(u) > 1e-9:
-                    u /= np.linalg.norm(u)
-                    v = np.cross(z, u)
-                    seeds.append(np.column_stack([u, v, z]))
-
-        best_a = seeds[0]
-        best_v = volume_from_axes(points, best_a)
-        step = 0.15  # ~8.6°
-        iters = 10
-
-        for a0 in seeds:
-            def func(w):
-                rrr = rodrigues(w)
-                aaa = a0 @ rrr
-                if np.linalg.det(aaa) < 0:
-                    aaa[:, 2] = np.cross(aaa[:, 0], aaa[:, 1])
-                return volume_from_axes(points, aaa)
-
-            w_best, v_best = nm_simplex(func, np.zeros(3), step, iters)
-            if v_best < best_v:
-                rrr = rodrigues(w_best)
-                best_a = a0 @ rrr
-                if np.linalg.det(best_a) < 0:
-                    best_a[:, 2] = np.cross(best_a[:, 0], best_a[:, 1])
-                best_v = v_best
-
-        ppp = points @ best_a
-        mn = ppp.min(axis=0)
-        mx = ppp.max(axis=0)
-        e = 0.5 * (mx - mn)
-        mid = 0.5 * (mx + mn)
-        c = mid @ best_a.T
-        return c, best_a, np.maximum(e + 1e-6, 1e-9)
-
-    def build(face_idx: np.ndarray, depth: int, nodes: list) -> int:
+    def make_node(face_idx: np.ndarray, depth: int):
         uniq = np.unique(tris[face_idx].reshape(-1))
-        pts = verts[uniq]
-        c, aaaa, eeee = hybbrid_orientation(pts)
+        c, aaaa, eeee = fit_oriented_box(verts[uniq])
 
         cs = CMatCoordinateSystem()
         cs.position = Vector3(x=float(c[0]), y=float(c[1]), z=float(c[2]))
         scaled = aaaa * eeee[None, :]
         m_store = scaled.T  # store rows; importer does one transpose
-        cs.matrix = Matrix3x3(
-            matrix=[
-                float(m_store[0, 0]),
-                float(m_store[0, 1]),
-                float(m_store[0, 2]),
-                float(m_store[1, 0]),
-                float(m_store[1, 1]),
-                float(m_store[1, 2]),
-                float(m_store[2, 0]),
-                float(m_store[2, 1]),
-                float(m_store[2, 2]),
-            ]
-        )
+        cs.matrix = Matrix3x3(matrix=[float(value) for value in m_store.reshape(-1)])
 
         node = OBBNode()
         node.oriented_bounding_box = cs
@@ -3355,13 +3343,9 @@ def create_cgeo_obb_tree(unified_mesh: bpy.types.Mesh) -> CGeoOBBTree:
         node.node_depth = depth
         node.triangle_offset = 0
         node.total_triangles = int(len(face_idx))
+        return node, c, aaaa, eeee
 
-        my = len(nodes)
-        nodes.append(node)
-
-        if len(face_idx) <= MIN_TRIS or depth >= MAX_DEPTH:
-            return my
-
+    def split(face_idx: np.ndarray, c: np.ndarray, aaaa: np.ndarray, eeee: np.ndarray):
         axis_id = int(np.argmax(eeee))
         dir_world = aaaa[:, axis_id] / (np.linalg.norm(aaaa[:, axis_id]) + 1e-30)
         vals = (tri_centroids[face_idx] - c) @ dir_world
@@ -3374,30 +3358,36 @@ def create_cgeo_obb_tree(unified_mesh: bpy.types.Mesh) -> CGeoOBBTree:
             order = np.argsort(vals)
             half = len(order) // 2
             if half == 0:
-                return my
+                return None
             left_idx = face_idx[order[:half]]
             right_idx = face_idx[order[half:]]
+        return left_idx, right_idx
 
-        li = build(left_idx, depth + 1, nodes)
-        ri = build(right_idx, depth + 1, nodes)
-        nodes[my].first_child_index = li if li > 0 else 0
-        nodes[my].second_child_index = ri if ri > 0 else 0
-        return my
-
+    # Depth-first with an explicit stack; nodes are stored in pre-order (node, left subtree,
+    # right subtree) and each child links itself into its parent
     nodes: list[OBBNode] = []
-    all_faces = np.arange(tri_count, dtype=np.int32)
-    build(all_faces, 0, nodes)
+    stack = [(np.arange(tri_count, dtype=np.int32), 0, None, "")]
+    while stack:
+        face_idx, depth, parent, side = stack.pop()
+        node, c, aaaa, eeee = make_node(face_idx, depth)
+        my = len(nodes)
+        nodes.append(node)
+        if parent is not None:
+            setattr(parent, side, my)
+
+        if len(face_idx) <= MIN_TRIS or depth >= MAX_DEPTH:
+            continue
+        children = split(face_idx, c, aaaa, eeee)
+        if children is None:
+            continue
+        stack.append((children[1], depth + 1, node, "second_child_index"))
+        stack.append((children[0], depth + 1, node, "first_child_index"))
 
     tree = CGeoOBBTree()
     tree.matrix_count = len(nodes)
     tree.obb_nodes = nodes
     tree.triangle_count = tri_count
-    out_faces = []
-    for a, b, c in tris:
-        _face = Face()
-        _face.indices = [int(a), int(b), int(c)]
-        out_faces.append(_face)
-    tree.faces = out_faces
+    tree.face_indices = tris.astype("<u2")
     return tree
 
 
@@ -3687,6 +3677,132 @@ def set_refraction_color_and_map(refraction_color_node, refraction_map_node, new
     return rgb
 
 
+def read_vertex_group_weights(mesh: bpy.types.Object) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the vertex group weights of a mesh object as (vertex index, group index, weight) arrays."""
+    vertex_ids, group_ids, weights = [], [], []
+    for vertex in mesh.data.vertices:
+        for group in vertex.groups:
+            vertex_ids.append(vertex.index)
+            group_ids.append(group.group)
+            weights.append(group.weight)
+    return (
+        np.array(vertex_ids, dtype=np.int64),
+        np.array(group_ids, dtype=np.int64),
+        np.array(weights, dtype=np.float64),
+    )
+
+
+def _vertex_skin_arrays(
+    mesh: bpy.types.Object, per_mesh_bone_data: Dict[str, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (V, 4) raw weights (bytes summing to 255) and local bone indices of every vertex of a mesh object.
+
+    Bone indices are vertex group indices; unused slots have weight 0 and are pointed at the
+    root reference by update_mesh_file_root_reference(). Bones that are used are recorded
+    in per_mesh_bone_data (bone name -> local index).
+    """
+    vertex_ids, group_ids, weights = read_vertex_group_weights(mesh)
+    # We need to use local_index and bone_name and map them into the JointMap
+    used = group_ids[weights > 0.0]
+    _, first_use = np.unique(used, return_index=True)
+    for group_index in used[np.sort(first_use)]:
+        bone_name = mesh.vertex_groups[int(group_index)].name
+        per_mesh_bone_data.setdefault(bone_name, int(group_index))
+
+    bone_indices, normalized, clipped = limit_influences(
+        vertex_ids, group_ids, weights, len(mesh.data.vertices)
+    )
+    if clipped:
+        logger.log(
+            f"{clipped} of {len(mesh.data.vertices)} vertices of {mesh.name} had more than "
+            f"{MAX_INFLUENCES} weights. Kept the {MAX_INFLUENCES} strongest.",
+            "Warning",
+            "WARNING",
+        )
+    # The skin stream stores local bone indices as bytes
+    if bone_indices.size and bone_indices.max() > 255:
+        raise ValueError(
+            f"Mesh {mesh.name} uses vertex group index {int(bone_indices.max())}, "
+            "but DRS skin weights can only address vertex groups 0-255"
+        )
+    return quantize_weights(normalized), bone_indices.astype(np.uint8)
+
+
+def extract_vertex_streams(
+    mesh: bpy.types.Object, add_skin_mesh: bool, per_mesh_bone_data: Dict[str, int]
+) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Read a triangulated mesh object into DRS vertex streams and a face index buffer.
+
+    Positions, loop normals, UVs, tangents and bitangent signs are fetched with foreach_get
+    after one calc_tangents(). Loops of the same vertex with the same normal and UV become
+    one DRS vertex; the tangent of the last such loop is kept. Returns the structured arrays
+    of the 133121 (position/normal/UV), 12288 (tangent) and, with add_skin_mesh, 12 (skin)
+    streams plus the (F, 3) face indices.
+    """
+    data = mesh.data
+    data.calc_tangents()
+    loop_count = len(data.loops)
+
+    polygon_sizes = np.empty(len(data.polygons), dtype=np.int32)
+    data.polygons.foreach_get("loop_total", polygon_sizes)
+    if np.any(polygon_sizes != 3):
+        raise ValueError(f"Mesh {mesh.name} is not triangulated")
+    polygon_starts = np.empty(len(data.polygons), dtype=np.int32)
+    data.polygons.foreach_get("loop_start", polygon_starts)
+
+    positions = np.empty(len(data.vertices) * 3, dtype=np.float32)
+    data.vertices.foreach_get("co", positions)
+    loop_vertices = np.empty(loop_count, dtype=np.int32)
+    data.loops.foreach_get("vertex_index", loop_vertices)
+    normals = np.empty(loop_count * 3, dtype=np.float32)
+    data.loops.foreach_get("normal", normals)
+    tangents = np.empty(loop_count * 3, dtype=np.float32)
+    data.loops.foreach_get("tangent", tangents)
+    bitangent_signs = np.empty(loop_count, dtype=np.float32)
+    data.loops.foreach_get("bitangent_sign", bitangent_signs)
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    data.uv_layers.active.data.foreach_get("uv", uvs)
+    positions = positions.reshape(-1, 3)
+    normals = normals.reshape(-1, 3)
+    tangents = tangents.reshape(-1, 3)
+    uvs = uvs.reshape(-1, 2)
+    uvs[:, 1] *= -1.0
+
+    # One DRS vertex per distinct (vertex, normal, UV); searching the reversed loops makes
+    # the last loop of each group its representative
+    keys = np.empty(loop_count, dtype=[("vertex", "<i4"), ("normal", "<f4", 3), ("uv", "<f4", 2)])
+    keys["vertex"] = loop_vertices
+    keys["normal"] = normals
+    keys["uv"] = uvs
+    _, last_reversed, inverse_reversed = np.unique(keys[::-1], return_index=True, return_inverse=True)
+    representatives = loop_count - 1 - last_reversed
+    loop_to_output = inverse_reversed.reshape(-1)[::-1]
+    vertices = loop_vertices[representatives]
+
+    stream_0 = np.zeros(len(representatives), dtype=VERTEX_DTYPES[133121])
+    stream_0["position"] = positions[vertices]
+    stream_0["normal"] = normals[representatives]
+    stream_0["texture"] = uvs[representatives]
+
+    stream_1 = np.zeros(len(representatives), dtype=VERTEX_DTYPES[12288])
+    tangent = tangents[representatives]
+    stream_1["bitangent"] = bitangent_signs[representatives, None] * np.cross(stream_0["normal"], tangent)
+    # Switch X and Y as the Tangent is flipped
+    stream_1["tangent"] = tangent[:, [1, 0, 2]]
+
+    streams = [stream_0, stream_1]
+    if add_skin_mesh:
+        raw_weights, bone_indices = _vertex_skin_arrays(mesh, per_mesh_bone_data)
+        stream_2 = np.zeros(len(representatives), dtype=VERTEX_DTYPES[12])
+        stream_2["raw_weights"] = raw_weights[vertices]
+        stream_2["bone_indices"] = bone_indices[vertices]
+        streams.append(stream_2)
+
+    face_loops = polygon_starts[:, None] + np.arange(3, dtype=np.int32)
+    return streams, loop_to_output[face_loops]
+
+
 def create_mesh(
     mesh: bpy.types.Object,
     mesh_index: int,
@@ -3704,103 +3820,30 @@ def create_mesh(
             bpy.ops.mesh.flip_normals()
             bpy.ops.mesh.select_all(action="DESELECT")
 
-    mesh.data.calc_tangents()
     per_mesh_bone_data: Dict[str, int] = {}
     per_mesh_bone_data["root_ref"] = -1
 
-    new_mesh = BattleforgeMesh()
-    new_mesh.vertex_count = len(mesh.data.vertices)
-    new_mesh.face_count = len(mesh.data.polygons)
-    new_mesh.faces = []
-
-    new_mesh.mesh_count = 2 if not add_skin_mesh else 3
-    new_mesh.mesh_data = []
-
-    _mesh_0_data = MeshData()
-    _mesh_0_data.vertices = [Vertex() for _ in range(new_mesh.vertex_count)]
-    _mesh_0_data.revision = 133121
-    _mesh_0_data.vertex_size = 32
-
-    _mesh_1_data = MeshData()
-    _mesh_1_data.vertices = [Vertex() for _ in range(new_mesh.vertex_count)]
-    _mesh_1_data.revision = 12288
-    _mesh_1_data.vertex_size = 24
-
-    if add_skin_mesh:
-        _mesh_2_data = MeshData()
-        _mesh_2_data.vertices = [Vertex() for _ in range(new_mesh.vertex_count)]
-        _mesh_2_data.revision = 12
-        _mesh_2_data.vertex_size = 8
-
-    for _face in mesh.data.polygons:
-        new_face = Face()
-        new_face.indices = []
-        for index in _face.loop_indices:
-            vertex: bpy.types.MeshLoop = mesh.data.loops[index]
-            vertex2: bpy.types.MeshVertex = mesh.data.vertices[vertex.vertex_index]
-            position = vertex2.co
-            normal = vertex.normal
-            uv = mesh.data.uv_layers.active.data[index].uv.copy()
-            uv.y = -uv.y
-            _mesh_0_data.vertices[vertex.vertex_index] = Vertex(
-                position=position, normal=normal, texture=uv
-            )
-
-            if new_mesh.mesh_count > 1:
-                tangent = vertex.tangent
-                bitangent = vertex.bitangent_sign * normal.cross(tangent)
-                # Switch X and Y as the Tangent is flipped
-                tangent = Vector((tangent.y, tangent.x, tangent.z))
-                _mesh_1_data.vertices[vertex.vertex_index] = Vertex(
-                    tangent=tangent, bitangent=bitangent
-                )
-
-            if add_skin_mesh:
-                weights = []
-                bone_indices = []
-                for group in vertex2.groups:
-                    # only if weight > 0.0
-                    if group.weight <= 0.0:
-                        continue
-                    # Weight is between 0.0 and 1.0, we need to convert it to 0-255
-                    weight = int(group.weight * 255)
-                    bone_name = mesh.vertex_groups[group.group].name
-                    local_index = group.group
-                    # We need to use local_index and bone_name and map them into the JointMap
-                    if bone_name not in per_mesh_bone_data:
-                        per_mesh_bone_data[bone_name] = local_index
-                    weights.append(weight)
-                    bone_indices.append(local_index)
-
-                while len(weights) < 4:
-                    weights.append(0)
-                    bone_indices.append(-1)  # Root Reference, we update that later.
-
-                # Check if we have more than 4 weights, if so, we need to clip them
-                if len(weights) > 4:
-                    logger.log(
-                        f"More than 4 weights found for vertex {vertex.vertex_index}. Clipping to 4.",
-                        "Warning",
-                        "WARNING",
-                    )
-                    # We remove the lowest weights until we have 4 left
-                    while len(weights) > 4:
-                        min_weight_index = weights.index(min(weights))
-                        weights.pop(min_weight_index)
-                        bone_indices.pop(min_weight_index)
-
-                _mesh_2_data.vertices[vertex.vertex_index] = Vertex(
-                    raw_weights=weights, bone_indices=bone_indices
-                )
-
-            new_face.indices.append(vertex.vertex_index)
-
-        new_mesh.faces.append(new_face)
+    streams, face_indices = extract_vertex_streams(mesh, add_skin_mesh, per_mesh_bone_data)
+    vertex_count = len(streams[0])
+    # Vertices are split per distinct normal and UV, so this can exceed the Blender vertex count
+    if vertex_count > MAX_GAME_VERTICES:
+        logger.log(
+            f"Mesh '{mesh.name}' has more than {MAX_GAME_VERTICES} Vertices after splitting by normals and UVs "
+            f"({vertex_count}). This is not supported by the game.",
+            "Error",
+            "ERROR",
+        )
+        return None, per_mesh_bone_data
 
-    new_mesh.mesh_data.append(_mesh_0_data)
-    new_mesh.mesh_data.append(_mesh_1_data)
-    if add_skin_mesh:
-        new_mesh.mesh_data.append(_mesh_2_data)
+    new_mesh = BattleforgeMesh()
+    new_mesh.vertex_count = vertex_count
+    new_mesh.face_count = len(face_indices)
+    new_mesh.face_indices = face_indices.astype("<u2")
+    new_mesh.mesh_count = len(streams)
+    new_mesh.mesh_data = [
+        MeshData(revision=revision, vertex_size=vertex_size, data=data)
+        for (revision, vertex_size), data in zip(((133121, 32), (12288, 24), (12, 8)), streams)
+    ]
 
     # We need to investigate the Bounding Box further, as it seems to be wrong
     (
@@ -4344,88 +4387,78 @@ def create_collision_shape(meshes_collection: bpy.types.Collection) -> Collision
 
 
 def create_skin_info(
-    unified_mesh: bpy.types.Mesh,
+    geometry: WeldedGeometry,
     meshes_collection: bpy.types.Collection,
     bone_map: Dict[str, Dict[str, int]],
 ) -> CSkSkinInfo:
-    """Create CSkSkinInfo by matching vertices in the same space as unified_mesh."""
+    """Create CSkSkinInfo by matching vertices in the same space as the welded geometry."""
     skin_info = CSkSkinInfo()
-    skin_info.vertex_count = len(unified_mesh.vertices)
-
-    # Build coordinate -> index hashtable (fast path).
-    # unified_mesh currently stores object-local coordinates, so matching must stay local too.
-    unified_hashtable: dict[tuple[float, float, float], int] = {}
-    for v in unified_mesh.vertices:
-        key = (
-            round(v.co.x, TOL_DIGITS),
-            round(v.co.y, TOL_DIGITS),
-            round(v.co.z, TOL_DIGITS),
-        )
-        if key in unified_hashtable:
-            logger.log(
-                f"Duplicate vertex found in unified mesh: {v.co}", "Error", "ERROR"
-            )
-            skin_info.vertex_data = [
-                VertexData(bone_indices=[0, 0, 0, 0], weights=[0.0, 0.0, 0.0, 0.0])
-            ] * skin_info.vertex_count
-            return skin_info
-        unified_hashtable[key] = v.index
-
-    # Build KDTree as a robust fallback (handles tiny weld shifts from remove_doubles)
-    kd = KDTree(len(unified_mesh.vertices))
-    for v in unified_mesh.vertices:
-        kd.insert(v.co, v.index)
-    kd.balance()
-
-    vertex_data: list[VertexData | None] = [None] * skin_info.vertex_count
+    skin_info.vertex_count = geometry.vertex_count
+
+    mesh_objects = [obj for obj in meshes_collection.objects if obj.type == "MESH"]
+    object_positions = []
+    for obj in mesh_objects:
+        positions = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+        obj.data.vertices.foreach_get("co", positions)
+        object_positions.append(positions.reshape(-1, 3))
+    source_positions = np.concatenate(object_positions) if object_positions else np.zeros((0, 3))
+
+    # Join the quantized positions (fast path). The welded geometry stores object-local
+    # coordinates, so matching must stay local too.
+    source_to_unified = match_positions(geometry.positions, source_positions, TOL_DIGITS)
+    missing = np.flatnonzero(source_to_unified < 0)
+    if len(missing):
+        # One KDTree for the remainder (vertices that moved off the weld grid)
+        kd = KDTree(skin_info.vertex_count)
+        for index, co in enumerate(geometry.positions.tolist()):
+            kd.insert(co, index)
+        kd.balance()
+        for source_index in missing.tolist():
+            _pos, kd_idx, dist = kd.find(source_positions[source_index].tolist())
+            if kd_idx is not None and dist <= KD_TOL:
+                source_to_unified[source_index] = kd_idx
+
+    # Influences as (unified vertex, bone id, weight) triplets, first-seen order
+    influence_vertices: list[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+    influence_bones: list[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+    influence_weights: list[np.ndarray] = [np.zeros(0)]
     misses = 0
 
-    for obj in meshes_collection.objects:
-        if obj.type != "MESH":
-            continue
-        vgroups = obj.vertex_groups
+    offset = 0
+    for obj in mesh_objects:
+        # Vertex group index -> bone id, -1 for groups without a bone
+        group_bones = np.full(max(len(obj.vertex_groups), 1), -1, dtype=np.int64)
+        for group in obj.vertex_groups:
+            bone_info = bone_map.get(group.name)
+            if bone_info is not None:
+                group_bones[group.index] = bone_info["id"]
+        unified_indices = source_to_unified[offset : offset + len(obj.data.vertices)]
+        offset += len(obj.data.vertices)
+        for vertex_index in np.flatnonzero(unified_indices < 0).tolist():
+            if misses < 20:  # avoid spam
+                logger.log(
+                    f"Vertex {vertex_index} of {obj.name} not found in unified mesh "
+                    f"(local: {tuple(obj.data.vertices[vertex_index].co)})",
+                    "Warning",
+                    "WARNING",
+                )
+            misses += 1
 
-        for v in obj.data.vertices:
-            key = (
-                round(v.co.x, TOL_DIGITS),
-                round(v.co.y, TOL_DIGITS),
-                round(v.co.z, TOL_DIGITS),
+        vertex_ids, group_ids, weights = read_vertex_group_weights(obj)
+        bone_ids = group_bones[group_ids]
+        matched = unified_indices[vertex_ids] >= 0
+        unmapped = np.unique(group_ids[matched & (bone_ids < 0) & (weights > 0.0)])
+        for group_index in unmapped:
+            logger.log(
+                f"Bone {obj.vertex_groups[int(group_index)].name} of {obj.name} is not in the bone map, "
+                "its weights are ignored",
+                "Error",
+                "ERROR",
             )
-
-            idx = unified_hashtable.get(key)
-            if idx is None:
-                # KD fallback
-                _pos, kd_idx, dist = kd.find(v.co)
-                if kd_idx is None or dist > KD_TOL:
-                    if misses < 20:  # avoid spam
-                        logger.log(
-                            f"Vertex {v.index} not found in unified mesh (local: {v.co})",
-                            "Warning",
-                            "WARNING",
-                        )
-                    misses += 1
-                    continue
-                idx = kd_idx
-
-            if vertex_data[idx] is None:
-                vertex_data[idx] = VertexData(bone_indices=[], weights=[])
-
-            for g in v.groups:
-                if g.weight <= 0.0:
-                    continue
-                bone_name = vgroups[g.group].name
-                bone_info = bone_map.get(bone_name)
-                if bone_info is None:
-                    logger.log(
-                        f"Bone {bone_name} not in bone map for vertex {v.index}",
-                        "Error",
-                        "ERROR",
-                    )
-                    continue
-                bone_id = bone_info["id"]
-                if bone_id not in vertex_data[idx].bone_indices:
-                    vertex_data[idx].bone_indices.append(bone_id)
-                    vertex_data[idx].weights.append(g.weight)
+        keep = matched & (bone_ids >= 0)
+        influence_vertices.append(unified_indices[vertex_ids[keep]])
+        influence_bones.append(bone_ids[keep])
+        influence_weights.append(weights[keep])
 
     if misses > 20:
         logger.log(
@@ -4434,25 +4467,22 @@ def create_skin_info(
             "WARNING",
         )
 
-    # Normalize to 4 influences per vertex (pad/truncate) — unchanged
-    for i, vd in enumerate(vertex_data):
-        if vd is None:
-            vertex_data[i] = VertexData(
-                bone_indices=[0, 0, 0, 0], weights=[0.0, 0.0, 0.0, 0.0]
-            )
-            continue
-        if len(vd.weights) > 4:
-            order = sorted(
-                range(len(vd.weights)), key=lambda k: vd.weights[k], reverse=True
-            )[:4]
-            vd.bone_indices = [vd.bone_indices[k] for k in order]
-            vd.weights = [vd.weights[k] for k in order]
-        while len(vd.bone_indices) < 4:
-            vd.bone_indices.append(0)
-            vd.weights.append(0.0)
+    # Keep the 4 strongest influences per vertex and normalize them; unmatched vertices stay zero
+    bone_indices, weights, clipped = limit_influences(
+        np.concatenate(influence_vertices),
+        np.concatenate(influence_bones),
+        np.concatenate(influence_weights),
+        skin_info.vertex_count,
+    )
+    if clipped:
+        logger.log(
+            f"{clipped} of {skin_info.vertex_count} skinned vertices had more than {MAX_INFLUENCES} "
+            f"bone weights. Kept the {MAX_INFLUENCES} strongest.",
+            "Warning",
+            "WARNING",
+        )
 
-    skin_info.vertex_data = vertex_data  # type: ignore[assignment]
-    return skin_info
+    return skin_info.set_arrays(weights.astype(np.float32), bone_indices.astype(np.int32))
 
 
 def create_skeleton(
@@ -4910,18 +4940,13 @@ def update_mesh_file_root_reference(
         # Check if the bone data is valid
         if not per_mesh_bone_data:
             continue
-        # Get the SkinningMeshData
+        # Get the SkinningMeshData and point the unused 2nd, 3rd and 4th slots at the root
         skinning_mesh_data = mesh.mesh_data[2]
-        for vertex in skinning_mesh_data.vertices:
-            # Check the 2nd, 3rd and 4th bone index for -1
-            if not vertex.bone_indices:
-                continue
-            if vertex.bone_indices[1] == -1:
-                vertex.bone_indices[1] = per_mesh_bone_data["root_ref"]
-            if vertex.bone_indices[2] == -1:
-                vertex.bone_indices[2] = per_mesh_bone_data["root_ref"]
-            if vertex.bone_indices[3] == -1:
-                vertex.bone_indices[3] = per_mesh_bone_data["root_ref"]
+        skin = skinning_mesh_data.vertex_array()
+        unused = skin["raw_weights"][:, 1:] == 0
+        skin["bone_indices"][:, 1:][unused] = per_mesh_bone_data["root_ref"]
+        skinning_mesh_data.data = skin
+        MeshData.vertices.reset(skinning_mesh_data)
     return cdsp_mesh_file
 
 
@@ -5071,6 +5096,13 @@ def save_drs(
     if not verify_collections(source_collection, model_type):
         return abort(keep_debug_collections, None)
 
+    # Animations imported without curves are exported from their built Actions
+    try:
+        materialize_deferred_actions(source_collection)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.log(f"Error building deferred animations: {e}", "Animation Error", "ERROR")
+        return abort(keep_debug_collections, None)
+
     # Create a safe copy of the collection for export
     try:
         source_collection_copy = copy(context.scene.collection, source_collection)
@@ -5120,14 +5152,6 @@ def save_drs(
             logger.log(f"Error during triangulation: {e}", "Triangulation Error", "ERROR")
             return abort(keep_debug_collections, source_collection_copy)
 
-    if not verify_mesh_vertex_count(meshes_collection):
-        logger.log(
-            "Model verification failed: one or more meshes are invalid or exceed vertex limits.",
-            "Model Verification Error",
-            "ERROR",
-        )
-        return abort(keep_debug_collections, source_collection_copy)
-
     if split_mesh_by_uv_islands:
         try:
             split_meshes_by_uv_islands(meshes_collection)
@@ -5187,6 +5211,21 @@ def save_drs(
         logger.log(f"Error setting origin for meshes: {e}", "Origin Error", "ERROR")
         return abort(keep_debug_collections, source_collection_copy)
 
+    # One welded snapshot of the final mesh geometry feeds the checks, CGeoMesh, OBB tree and skin info
+    try:
+        welded_geometry = create_welded_geometry(meshes_collection)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.log(f"Error creating unified mesh: {e}", "Unified Mesh Error", "ERROR")
+        return abort(keep_debug_collections, source_collection_copy)
+
+    if not verify_mesh_vertex_count(meshes_collection, welded_geometry):
+        logger.log(
+            "Model verification failed: one or more meshes are invalid or exceed vertex limits.",
+            "Model Verification Error",
+            "ERROR",
+        )
+        return abort(keep_debug_collections, source_collection_copy)
+
     # === Action name strategy for export =========================================
     export_prefix: str | None
     if set_model_name_prefix == "model_name":
@@ -5208,11 +5247,6 @@ def save_drs(
     env_cubemap_image = get_environment_cubemap_image(source_collection_copy)
 
     new_drs_file: DRS = DRS(model_type=model_type)
-    try:
-        unified_mesh = create_unified_mesh(meshes_collection)
-    except Exception as e:  # pylint: disable=broad-except
-        logger.log(f"Error creating unified mesh: {e}", "Unified Mesh Error", "ERROR")
-        return abort(keep_debug_collections, source_collection_copy)
 
     # Generate the CDspMeshFile
     try:
@@ -5235,10 +5269,10 @@ def save_drs(
     nodes = InformationIndices[model_type]
     for node in nodes:
         if node == "CGeoMesh":
-            new_drs_file.cgeo_mesh = create_cgeo_mesh(unified_mesh)
+            new_drs_file.cgeo_mesh = create_cgeo_mesh(welded_geometry)
             new_drs_file.push_node_infos("CGeoMesh", new_drs_file.cgeo_mesh)
         elif node == "CGeoOBBTree":
-            new_drs_file.cgeo_obb_tree = create_cgeo_obb_tree(unified_mesh)
+            new_drs_file.cgeo_obb_tree = create_cgeo_obb_tree(welded_geometry)
             new_drs_file.push_node_infos("CGeoOBBTree", new_drs_file.cgeo_obb_tree)
         elif node == "CDspJointMap":
             new_drs_file.cdsp_joint_map = create_cdsp_joint_map(
@@ -5265,7 +5299,7 @@ def save_drs(
             new_drs_file.push_node_infos("collisionShape", new_drs_file.collision_shape)
         elif node == "CSkSkinInfo":
             new_drs_file.csk_skin_info = create_skin_info(
-                unified_mesh, meshes_collection, bone_map
+                welded_geometry, meshes_collection, bone_map
             )
             if new_drs_file.csk_skin_info is None:
                 logger.log("Failed to create CSkSkinInfo.", "Skin Info Error", "ERROR")
@@ -5369,8 +5403,6 @@ def save_drs(
             )
             return abort(keep_debug_collections, source_collection_copy)
 
-    new_drs_file.update_offsets()
-
     # === SAVE THE DRS FILE ====================================================
     try:
         new_drs_file.save(os.path.join(folder_path, model_name + ".drs"))
@@ -5409,7 +5441,7 @@ def save_drs(
     texture_cache_flu = {}
     texture_cache_env = {}
     new_drs_file = None
-    unified_mesh = None
+    welded_geometry = None
     meshes_collection = None
     armature_object = None
     source_collection_copy = None
@@ -5,6 +5,7 @@ from collections import defaultdict
 from mathutils import Vector, Quaternion
 import bpy
 
+from sr_impex.blender.animation_utils import DEFERRED_ACTION_PROP
 from sr_impex.definitions.ska_definitions import SKA, SKAHeader, SKAKeyframe
 from sr_impex.core.message_logger import MessageLogger
 
@@ -114,6 +115,11 @@ def get_actions(current_collection: bpy.types.Collection = None) -> List[str]:
             if "Control_Rig" in action.name:
                 continue
 
+            # Deferred SKA imports have no curves until they are first used
+            if obj.type == "ARMATURE" and action.get(DEFERRED_ACTION_PROP) and "Control_Rig" not in obj.name:
+                relevant_actions.add(action.name)
+                continue
+
             for fcurve in _iter_action_fcurves(action):
                 # Check if the action references this object's properties or pose bones
                 if fcurve.data_path.startswith(("location", "rotation", "scale")):